@@ -12,22 +12,56 @@
 
 # flake8: noqa: F403
 
+import importlib
 import warnings
+from typing import Any, List
 
+from holidays import constants, holiday_base, utils
 from holidays.constants import *
 from holidays.deprecation import (
     FUTURE_INCOMPATIBILITY_WARNING_TEMPLATE,
     FutureIncompatibilityWarning,
 )
 from holidays.holiday_base import *
-from holidays.registry import EntityLoader
+from holidays.registry import ENTITY_MODULES, IMPORT_LOCK
 from holidays.utils import *
 
 __version__ = "0.54"
 
 
-EntityLoader.load("countries", globals())
-EntityLoader.load("financial", globals())
+__all__ = [
+    *constants.__all__,
+    "FutureIncompatibilityWarning",
+    *holiday_base.__all__,
+    *utils.__all__,
+    # The country and financial entities.
+    *ENTITY_MODULES,
+]
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *ENTITY_MODULES})
+
+
+def __getattr__(name: str) -> Any:
+    """Return a country or financial entity class importing its module on
+    the first access (see PEP 562).
+
+    The class is bound to the package namespace, so the subsequent accesses
+    are regular attribute lookups.
+    """
+    try:
+        module_name = ENTITY_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    # Avoid deadlock due to importlib.import_module not being thread-safe.
+    with IMPORT_LOCK:
+        entity = getattr(importlib.import_module(module_name), name)
+    globals()[name] = entity
+
+    return entity
+
 
 warnings.warn(
     FUTURE_INCOMPATIBILITY_WARNING_TEMPLATE.format(version=__version__),
@@ -11,6 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from typing import Dict
 
 GREGORIAN_CALENDAR = "GREGORIAN_CALENDAR"
 
@@ -33,6 +34,8 @@ WEEKDAYS = {w: i for i, w in enumerate(("mon", "tue", "wed", "thu", "fri", "sat"
 CHRISTMAS = "christmas"
 WINTER_SOLSTICE = "winter_solstice"
 
+_year_start_ordinals: Dict[int, int] = {}
+
 
 def _timedelta(dt: date, days: int = 0) -> date:
     """
@@ -42,6 +45,17 @@ def _timedelta(dt: date, days: int = 0) -> date:
     return date.fromordinal(dt.toordinal() + days)
 
 
+def _get_year_start_ordinal(year: int) -> int:
+    """
+    Return the proleptic Gregorian ordinal of January 1st of the specified year.
+    """
+
+    try:
+        return _year_start_ordinals[year]
+    except KeyError:
+        return _year_start_ordinals.setdefault(year, date(year, 1, 1).toordinal())
+
+
 def _get_nth_weekday_from(n: int, weekday: int, from_dt: date) -> date:
     """
     Return date of a n-th weekday before a specific date
@@ -12,6 +12,44 @@
 
 # flake8: noqa: F401
 
+__all__ = (
+    "JAN",
+    "FEB",
+    "MAR",
+    "APR",
+    "MAY",
+    "JUN",
+    "JUL",
+    "AUG",
+    "SEP",
+    "OCT",
+    "NOV",
+    "DEC",
+    "MON",
+    "TUE",
+    "WED",
+    "THU",
+    "FRI",
+    "SAT",
+    "SUN",
+    "WEEKEND",
+    "HOLIDAY_NAME_DELIMITER",
+    "ARMED_FORCES",
+    "BANK",
+    "GOVERNMENT",
+    "HALF_DAY",
+    "OPTIONAL",
+    "PUBLIC",
+    "SCHOOL",
+    "UNOFFICIAL",
+    "WORKDAY",
+    "CHINESE",
+    "CHRISTIAN",
+    "HEBREW",
+    "HINDU",
+    "ISLAMIC",
+)
+
 from holidays.calendars.gregorian import (
     JAN,
     FEB,
@@ -11,7 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
-from typing import Tuple
+from typing import Any, Optional, Tuple
 
 from holidays.calendars.gregorian import (
     JAN,
@@ -81,6 +81,12 @@ class HongKong(
         kwargs.setdefault("observed_rule", SUN_TO_NEXT_WORKDAY)
         super().__init__(*args, **kwargs)
 
+    def _get_populate_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        if (key := super()._get_populate_cache_key()) is None:
+            return None
+
+        return (*key, frozenset(self.preferred_discretionary_holidays))
+
     def _add_mid_autumn(self) -> date:
         # Chinese Mid-Autumn Festival.
 
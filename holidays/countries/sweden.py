@@ -11,6 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from gettext import gettext as tr
+from typing import Any, Optional, Tuple
 
 from holidays.calendars.gregorian import _timedelta, _get_all_sundays
 from holidays.groups import ChristianHolidays, InternationalHolidays
@@ -46,6 +47,12 @@ class Sweden(HolidayBase, ChristianHolidays, InternationalHolidays):
         InternationalHolidays.__init__(self)
         super().__init__(*args, **kwargs)
 
+    def _get_populate_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        if (key := super()._get_populate_cache_key()) is None:
+            return None
+
+        return (*key, self.include_sundays)
+
     def _populate_public_holidays(self):
         # New Year's Day.
         self._add_new_years_day(tr("Nyårsdagen"))
@@ -0,0 +1,433 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("DatabaseHolidays", "HolidayDatabase")
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import date
+from heapq import merge
+from itertools import combinations, groupby
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
+
+from holidays.constants import HOLIDAY_NAME_DELIMITER, PUBLIC
+from holidays.holiday_base import DateLike, YearArg, _array_to_bytes, _to_date
+from holidays.helpers import _normalize_arguments
+from holidays.reverse_index import _iter_entities
+
+# The file starts with a header followed by the sections, each padded to
+# 4 bytes. All the integers are little-endian:
+#   - header: magic, format version, first and last year, language name ID,
+#     and the numbers of names, entries and holidays;
+#   - name offsets: `names + 1` offsets of the UTF-8 names in the name data;
+#   - name data;
+#   - entries: code, subdivision and category name IDs and the index of the
+#     entry's first holiday. The category names of the entries of several
+#     categories are joined with a comma, such an entry is stored only if its
+#     holidays differ from the merged holidays of the single categories
+#     entries (e.g., if the observed rules depend on the other categories);
+#   - holiday dates: the date ordinals sorted within each entry;
+#   - holiday names: the name IDs of the holidays.
+_CATEGORY_DELIMITER = ","
+_HEADER = struct.Struct("<4sHHHIIII")
+_MAGIC = b"HLDB"
+_NO_NAME = 0xFFFFFFFF
+_VERSION = 2
+
+
+def _get_merged_holidays(
+    holidays: Iterable[Dict[date, str]], first_year: int, last_year: int
+) -> Dict[date, str]:
+    """Return the holidays of the years merged the way :class:`HolidayBase`
+    merges the names of several holidays on the same date."""
+    names: Dict[date, Set[str]] = {}
+    for category_holidays in holidays:
+        for dt, name in category_holidays.items():
+            if first_year <= dt.year <= last_year:
+                names.setdefault(dt, set()).update(name.split(HOLIDAY_NAME_DELIMITER))
+
+    return {dt: HOLIDAY_NAME_DELIMITER.join(sorted(dt_names)) for dt, dt_names in names.items()}
+
+
+def _pad(data: bytes) -> bytes:
+    """Return the data padded with zero bytes to a multiple of 4 bytes."""
+    return data + b"\0" * (-len(data) % 4)
+
+
+class HolidayDatabase:
+    """
+    A precompiled holiday database for the registered entities.
+
+    The database is built once for a range of years (see :meth:`build`) into a
+    single binary file holding a sorted array of date ordinals per entity,
+    subdivision and holiday category along with a table of the distinct
+    holiday names. Opening the file memory-maps it, so the holidays are
+    answered without importing any of the entity modules or running their
+    rules, and the processes using the same file share its pages.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from holidays.database import HolidayDatabase
+        >>> HolidayDatabase.build("holidays.db", range(1950, 2051), countries=["US"])
+        >>> with HolidayDatabase("holidays.db") as database:
+        ...     us_holidays = database.get_holidays("US", subdiv="CA")
+        ...     us_holidays.get("2024-07-04")
+        'Independence Day'
+    """
+
+    language: Optional[str]
+    """The language of the holiday names, None for the entities' defaults."""
+    years: Tuple[int, int]
+    """The first and the last year of the database."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        :param path:
+            The database file created by :meth:`build`.
+        """
+        with open(path, "rb") as database_file:
+            self._mmap = mmap.mmap(database_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, first_year, last_year, language_id, names, entries, holidays = (
+                _HEADER.unpack_from(self._mmap)
+            )
+        except struct.error:
+            magic = version = None
+        if magic != _MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f"File {path} isn't a holiday database.")
+
+        self._buffer = memoryview(self._mmap)
+        offset = _HEADER.size
+        self._name_offsets, offset = self._get_array("I", offset, names + 1)
+        self._name_data_offset = offset
+        offset += self._name_offsets[-1] + -self._name_offsets[-1] % 4
+        entries_data, offset = self._get_array("I", offset, entries * 4)
+        self._ordinals, offset = self._get_array("i", offset, holidays)
+        self._name_ids, offset = self._get_array("I", offset, holidays)
+
+        self._entries: Dict[Tuple[str, Optional[str], str], Tuple[int, int]] = {}
+        for idx in range(entries):
+            code_id, subdiv_id, category_id, start = entries_data[idx * 4 : idx * 4 + 4]
+            end = entries_data[idx * 4 + 7] if idx < entries - 1 else holidays
+            subdiv = None if subdiv_id == _NO_NAME else self._get_name(subdiv_id)
+            key = (self._get_name(code_id), subdiv, self._get_name(category_id))
+            self._entries[key] = (start, end)
+        if isinstance(entries_data, memoryview):
+            entries_data.release()
+
+        self.language = None if language_id == _NO_NAME else self._get_name(language_id)
+        self.years = (first_year, last_year)
+
+    def __enter__(self) -> "HolidayDatabase":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"HolidayDatabase(years={self.years}, entries={len(self.entries)})"
+
+    def _get_array(self, typecode: str, offset: int, size: int) -> Tuple[Any, int]:
+        """Return a section of `size` integers and the next section offset.
+
+        The section is used in place on little-endian platforms and copied
+        with the byte order swapped otherwise.
+        """
+        end = offset + size * 4
+        data = self._buffer[offset:end]
+        if sys.byteorder == "little":
+            return data.cast(typecode), end
+
+        values = array(typecode, data)
+        values.byteswap()
+        data.release()
+        return values, end
+
+    def _get_name(self, name_id: int) -> str:
+        """Return the name by its ID."""
+        start = self._name_data_offset + self._name_offsets[name_id]
+        end = self._name_data_offset + self._name_offsets[name_id + 1]
+        return str(self._mmap[start:end], "utf-8")
+
+    @property
+    def entries(self) -> List[Tuple[str, Optional[str], str]]:
+        """The code, subdivision and category of the database entries."""
+        return [key for key in self._entries if _CATEGORY_DELIMITER not in key[2]]
+
+    @staticmethod
+    def build(
+        path: Union[str, Path],
+        years: YearArg,
+        countries: Optional[Iterable[str]] = None,
+        markets: Optional[Iterable[str]] = None,
+        language: Optional[str] = None,
+    ) -> None:
+        """Build the database file from the registered entities.
+
+        Every entity is stored for each of its subdivisions (and once for its
+        entity-wide holidays) and each of its supported categories. The
+        combinations of the categories are stored only if populating them
+        together gives other holidays than the single categories merged.
+
+        :param path:
+            The database file to create.
+
+        :param years:
+            The years to store. The database spans from the first to the last
+            of them.
+
+        :param countries:
+            The country codes to store, all supported countries by default.
+
+        :param markets:
+            The market codes to store, all supported markets by default.
+
+        :param language:
+            The language of the holiday names, the entities' default languages
+            by default.
+        """
+        years_set = _normalize_arguments(int, years)
+        if not years_set:
+            raise ValueError("At least one year must be given.")
+        first_year, last_year = min(years_set), max(years_set)
+
+        name_ids: Dict[str, int] = {}
+        entries = array("I")
+        ordinals = array("i")
+        holiday_name_ids = array("I")
+
+        def add_entry(
+            code: str, subdiv: Optional[str], category: str, holidays: Dict[date, str]
+        ) -> None:
+            entries.extend(
+                (
+                    name_ids.setdefault(code, len(name_ids)),
+                    _NO_NAME if subdiv is None else name_ids.setdefault(subdiv, len(name_ids)),
+                    name_ids.setdefault(category, len(name_ids)),
+                    len(ordinals),
+                )
+            )
+            for dt, name in sorted(holidays.items()):
+                if first_year <= dt.year <= last_year:
+                    ordinals.append(dt.toordinal())
+                    holiday_name_ids.append(name_ids.setdefault(name, len(name_ids)))
+
+        years_range = range(first_year, last_year + 1)
+        for (code, subdiv), entity_holidays in groupby(
+            _iter_entities(years_range, countries=countries, markets=markets, language=language),
+            key=lambda item: (item[0].code, item[0].subdiv),
+        ):
+            category_holidays = {entry.category: holidays for entry, holidays in entity_holidays}
+            for category, holidays in category_holidays.items():
+                add_entry(code, subdiv, category, holidays)
+
+            categories = sorted(category_holidays)
+            entity_cls = type(category_holidays[categories[0]])
+            for size in range(2, len(categories) + 1):
+                for combination in combinations(categories, size):
+                    combined_holidays = _get_merged_holidays(
+                        (
+                            entity_cls(
+                                subdiv=subdiv,
+                                years=years_range,
+                                categories=combination,
+                                language=language,
+                            ),
+                        ),
+                        first_year,
+                        last_year,
+                    )
+                    if combined_holidays != _get_merged_holidays(
+                        (category_holidays[category] for category in combination),
+                        first_year,
+                        last_year,
+                    ):
+                        add_entry(
+                            code,
+                            subdiv,
+                            _CATEGORY_DELIMITER.join(combination),
+                            combined_holidays,
+                        )
+
+        language_id = (
+            _NO_NAME if language is None else name_ids.setdefault(language, len(name_ids))
+        )
+        name_data = [name.encode() for name in name_ids]
+        name_offsets = array("I", [0])
+        for name_bytes in name_data:
+            name_offsets.append(name_offsets[-1] + len(name_bytes))
+
+        with open(path, "wb") as database_file:
+            database_file.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    first_year,
+                    last_year,
+                    language_id,
+                    len(name_data),
+                    len(entries) // 4,
+                    len(ordinals),
+                )
+            )
+            for section in (
+                _array_to_bytes(name_offsets),
+                b"".join(name_data),
+                _array_to_bytes(entries),
+                _array_to_bytes(ordinals),
+                _array_to_bytes(holiday_name_ids),
+            ):
+                database_file.write(_pad(section))
+
+    def close(self) -> None:
+        """Close the database file."""
+        for section in (self._name_offsets, self._ordinals, self._name_ids, self._buffer):
+            if isinstance(section, memoryview):
+                section.release()
+        self._mmap.close()
+
+    def get_holidays(
+        self,
+        code: str,
+        subdiv: Optional[str] = None,
+        categories: Optional[Union[str, Iterable[str]]] = None,
+    ) -> "DatabaseHolidays":
+        """Return the holidays of an entity.
+
+        :param code:
+            The country or market code.
+
+        :param subdiv:
+            The subdivision code, None for the entity-wide holidays.
+
+        :param categories:
+            The holiday categories, public holidays by default.
+
+        :return:
+            A :class:`DatabaseHolidays` object.
+        """
+        categories = sorted(_normalize_arguments(str, categories) or {PUBLIC})
+        ranges = []
+        for category in categories:
+            try:
+                ranges.append(self._entries[(code, subdiv, category)])
+            except KeyError:
+                raise KeyError(
+                    f"Entity {code!r} with subdivision {subdiv!r} and category "
+                    f"{category!r} isn't in the database."
+                )
+
+        # The categories which can't be merged are stored together.
+        if combined_range := self._entries.get(
+            (code, subdiv, _CATEGORY_DELIMITER.join(categories))
+        ):
+            ranges = [combined_range]
+
+        return DatabaseHolidays(self, ranges)
+
+
+class DatabaseHolidays(Mapping[date, str]):
+    """
+    A read-only view of an entity's holidays stored in a
+    :class:`HolidayDatabase`.
+
+    The view maps dates to holiday names the same way :class:`HolidayBase`
+    does, the distinct names of several holidays on the same date being
+    sorted and joined with a delimiter. Dates outside of the database years
+    aren't holidays, except for getting them with ``[]`` raising
+    :class:`KeyError`.
+    """
+
+    __slots__ = ("_database", "_ranges")
+
+    def __init__(self, database: HolidayDatabase, ranges: List[Tuple[int, int]]) -> None:
+        """
+        :param database:
+            The database the holidays are stored in.
+
+        :param ranges:
+            The positions of the entries' holidays in the database.
+        """
+        self._database = database
+        self._ranges = ranges
+
+    def __contains__(self, key: object) -> bool:
+        return bool(self.get_list(key))  # type: ignore[arg-type]
+
+    def __getitem__(self, key: DateLike) -> str:
+        dt = _to_date(key)
+        if names := self.get_list(dt):
+            return HOLIDAY_NAME_DELIMITER.join(names)
+
+        if not self._is_in_range(dt):
+            raise KeyError(f"Date out of the database range: {dt}.")
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[date]:
+        ordinals = self._database._ordinals
+        previous = None
+        for ordinal in merge(*(ordinals[start:end] for start, end in self._ranges)):
+            if ordinal != previous:
+                previous = ordinal
+                yield date.fromordinal(ordinal)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _is_in_range(self, dt: date) -> bool:
+        """Return True if the date is within the database years."""
+        first_year, last_year = self._database.years
+        return first_year <= dt.year <= last_year
+
+    def get(self, key: DateLike, default: Any = None) -> Any:  # type: ignore[override]
+        """Return the holiday name for a date if date is a holiday, else
+        default.
+
+        :param key:
+            The date expressed in any form supported by :class:`HolidayBase`.
+
+        :param default:
+            The value to return if the date isn't a holiday.
+        """
+        return HOLIDAY_NAME_DELIMITER.join(names) if (names := self.get_list(key)) else default
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date if date is a
+        holiday, else empty list.
+
+        :param key:
+            The date expressed in any form supported by :class:`HolidayBase`.
+        """
+        dt = _to_date(key)
+        if not self._is_in_range(dt):
+            return []
+
+        database = self._database
+        ordinal = dt.toordinal()
+        ordinals = database._ordinals
+        names: List[str] = []
+        for start, end in self._ranges:
+            idx = bisect_left(ordinals, ordinal, start, end)
+            if idx < end and ordinals[idx] == ordinal:
+                name = database._get_name(database._name_ids[idx])
+                names.extend(name.split(HOLIDAY_NAME_DELIMITER))
+
+        # The names of the merged categories may repeat.
+        return sorted(set(names)) if len(self._ranges) > 1 else names
@@ -10,18 +10,47 @@
 #  Website: https://github.com/vacanza/python-holidays
 #  License: MIT (see LICENSE file)
 
-__all__ = ("DateLike", "HolidayBase", "HolidaySum")
+__all__ = (
+    "DateLike",
+    "FrozenHolidays",
+    "HolidayBase",
+    "HolidayQuorum",
+    "HolidaySum",
+    "HolidayUnion",
+)
 
 import copy
+import os
+import sys
 import warnings
+from array import array
+from bisect import bisect_left, bisect_right
 from calendar import isleap
-from datetime import date, datetime, timedelta, timezone
-from functools import cached_property
-from gettext import gettext, translation
+from contextlib import nullcontext
+from datetime import MAXYEAR, MINYEAR, date, datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
-
-from dateutil.parser import parse
+from threading import Lock, RLock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from holidays.calendars.gregorian import (
     MON,
@@ -33,6 +62,7 @@ from holidays.calendars.gregorian import (
     SUN,
     _timedelta,
     _get_nth_weekday_from,
+    _get_year_start_ordinal,
     _get_nth_weekday_of_month,
     DAYS,
     MONTHS,
@@ -41,6 +71,11 @@ from holidays.calendars.gregorian import (
 from holidays.constants import HOLIDAY_NAME_DELIMITER, PUBLIC
 from holidays.helpers import _normalize_arguments, _normalize_tuple
 
+if TYPE_CHECKING:
+    import sqlite3
+
+    import numpy as np
+
 CategoryArg = Union[str, Iterable[str]]
 DateArg = Union[date, Tuple[int, int]]
 DateLike = Union[date, datetime, str, float, int]
@@ -52,6 +87,258 @@ SubstitutedHoliday = Union[
 YearArg = Union[int, Iterable[int]]
 
 
+class YearCacheInfo(NamedTuple):
+    """Populated years cache statistics (see :meth:`HolidayBase.year_cache_info`
+    and :func:`holidays.utils.get_populate_cache_info`)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def _parse_date_string(key: str) -> date:
+    """Parses a date string.
+
+    Strict ISO 8601 ``YYYY-MM-DD`` date and datetime strings are handled by
+    :meth:`date.fromisoformat` and :meth:`datetime.fromisoformat`, any other
+    format falls back to :func:`dateutil.parser.parse`.
+    """
+    if len(key) >= 10 and key[4] == "-" and key[7] == "-":
+        try:
+            if len(key) == 10:
+                return date.fromisoformat(key)
+            if key[10] in {"T", " "}:
+                return datetime.fromisoformat(key).date()
+        except ValueError:
+            pass
+
+    # Imported here as it's only needed for non-ISO formats and slow to import.
+    from dateutil.parser import parse
+
+    try:
+        return parse(key).date()
+    except (OverflowError, ValueError):
+        raise ValueError(f"Cannot parse date from string '{key}'")
+
+
+@lru_cache(maxsize=None)
+def _get_translation_function(
+    domain: str, language: Optional[str], environment: Tuple[Optional[str], ...]
+) -> Callable[[str], str]:
+    """Return the function translating the entity holiday names.
+
+    The translations are looked up once per entity and supported language,
+    or per locale environment variables values if no supported language is
+    requested.
+
+    :param domain:
+        The entity code.
+
+    :param language:
+        The supported language to translate to, None for the language set by
+        the locale environment variables (if supported).
+
+    :param environment:
+        The locale environment variables values the translation depends on
+        if no language is requested.
+    """
+    from gettext import translation
+
+    return translation(
+        domain,
+        fallback=language is None,
+        languages=[language] if language is not None else None,
+        localedir=str(Path(__file__).with_name("locale")),
+    ).gettext
+
+
+# The environment variables gettext selects the default language by.
+_LOCALE_ENVIRONMENT_VARIABLES = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+# Replaced by a bounded LRU cache wrapper when the parse cache is enabled,
+# see :func:`holidays.utils.enable_parse_cache`.
+_parse_date = _parse_date_string
+
+# The process-wide cache of populated years results, see
+# :func:`holidays.utils.enable_populate_cache`.
+_populate_cache: Optional["_PopulateCache"] = None
+
+
+def _get_slice_range(start: date, stop: date, step: Any) -> Tuple[int, int, int]:
+    """Return the first and the last ordinals of the days a holidays slice
+    visits, and its step.
+
+    The step sign is adjusted to the slice direction: the slice starts at the
+    first ordinal for positive steps and at the last one for negative steps.
+    The range is empty if the first ordinal is greater than the last one.
+    """
+    if step is None:
+        step = 1
+    elif isinstance(step, timedelta):
+        step = step.days
+    elif not isinstance(step, int):
+        raise TypeError(f"Cannot convert type '{type(step)}' to int.")
+
+    if step == 0:
+        raise ValueError("Step value must not be zero.")
+
+    date_diff = stop - start
+    if date_diff.days < 0 <= step or date_diff.days >= 0 > step:
+        step *= -1
+
+    start_ordinal = start.toordinal()
+    if step > 0:
+        return start_ordinal, stop.toordinal() - 1, step
+
+    return stop.toordinal() + 1, start_ordinal, step
+
+
+def _to_date(key: DateLike) -> date:
+    """Convert a :class:`datetime.datetime`, a :class:`str` or a POSIX
+    timestamp to :class:`datetime.date`."""
+    # Using type() here to skip date subclasses.
+    if type(key) is date:
+        return key
+
+    if isinstance(key, str):
+        return _parse_date(key)
+
+    # Must go before the `isinstance(key, date)` check as datetime is `date` subclass.
+    if isinstance(key, datetime):
+        return key.date()
+
+    if isinstance(key, date):
+        return key
+
+    if isinstance(key, (float, int)):
+        return datetime.fromtimestamp(key, timezone.utc).date()
+
+    raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+
+def _align_years(holidays: Iterable["HolidayBase"], years: Optional[YearArg]) -> None:
+    """Populate the operands of a combination of holidays objects for the
+    given years and align the expandable operands' years with the others."""
+    expand_years = set().union(*(operand.years for operand in holidays))
+    populate_years = _normalize_arguments(int, years)
+    for operand in holidays:
+        for year in sorted((expand_years | populate_years) if operand.expand else populate_years):
+            if year not in operand.years:
+                operand._populate_year(year)
+
+
+def _get_merged_names(holidays: Iterable["HolidayBase"], dt: date) -> Tuple[str, ...]:
+    """Return the holiday names of a date merged across several holidays
+    objects and sorted alphabetically the way :class:`HolidaySum` does it."""
+    operand_names = [names for operand in holidays if (names := operand.get_names(dt))]
+    if len(operand_names) < 2:
+        return operand_names[0] if operand_names else ()
+
+    return tuple(sorted({name for names in operand_names for name in names}))
+
+
+def _get_nth_workday(get_workday_counts: Callable[[int], "array[int]"], dt: date, n: int) -> date:
+    """Return n-th working day from the date given the per-year cumulative
+    working day counts (see :meth:`HolidayBase._get_workday_counts`)."""
+    if n == 0:
+        return dt
+
+    year = dt.year
+    counts = get_workday_counts(year)
+    day = dt.toordinal() - _get_year_start_ordinal(year)
+    if n > 0:
+        # The first date whose cumulative count reaches the target.
+        target = counts[day + 1] + n
+        while target > counts[-1]:
+            target -= counts[-1]
+            year += 1
+            counts = get_workday_counts(year)
+    else:
+        # The working day preceded by exactly |n| - 1 working days before the date.
+        target = counts[day] + n + 1
+        while target < 1:
+            year -= 1
+            counts = get_workday_counts(year)
+            target += counts[-1]
+
+    return date.fromordinal(_get_year_start_ordinal(year) + bisect_left(counts, target) - 1)
+
+
+def _get_workdays_number(
+    get_workday_counts: Callable[[int], "array[int]"], dt1: date, dt2: date
+) -> int:
+    """Return the number of working days between two dates (not including
+    the start date) given the per-year cumulative working day counts."""
+    if dt1 == dt2:
+        return 0
+    if dt1 > dt2:
+        dt1, dt2 = dt2, dt1
+
+    year1, year2 = dt1.year, dt2.year
+    count = (
+        get_workday_counts(year2)[dt2.toordinal() - _get_year_start_ordinal(year2) + 1]
+        - get_workday_counts(year1)[dt1.toordinal() - _get_year_start_ordinal(year1) + 1]
+    )
+    for year in range(year1, year2):
+        count += get_workday_counts(year)[-1]
+
+    return count
+
+
+def _array_from_bytes(typecode: str, data: bytes) -> "array[int]":
+    """Return an array stored by :func:`_array_to_bytes`."""
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values
+
+
+def _array_to_bytes(values: "array[int]") -> bytes:
+    """Return the array's items as little-endian bytes."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _from_serialized(
+    cls: Type["HolidayBase"],
+    state: Dict[str, Any],
+    years: Tuple[int, ...],
+    ordinals: bytes,
+    names: Tuple[str, ...],
+    name_ids: bytes,
+    weekend_workdays: bytes,
+) -> "HolidayBase":
+    """Recreate a holidays object serialized by :meth:`HolidayBase._serialize`
+    without populating any of its years."""
+    holidays = cls.__new__(cls)
+    holidays.__setstate__(state)
+    holidays.__dict__.update(
+        weekend_workdays=set(map(date.fromordinal, _array_from_bytes("i", weekend_workdays))),
+        years=set(years),
+    )
+
+    ordinals_array = _array_from_bytes("i", ordinals)
+    if ordinals_array:
+        name_ids_array = _array_from_bytes(
+            _NAME_ID_TYPECODES[len(name_ids) // len(ordinals_array)], name_ids
+        )
+        super(HolidayBase, holidays).update(
+            zip(map(date.fromordinal, ordinals_array), map(names.__getitem__, name_ids_array))
+        )
+
+    return holidays
+
+
+# The array typecodes of the name table indexes by item size.
+_NAME_ID_TYPECODES = {1: "B", 2: "H", 4: "I"}
+
+
 class HolidayBase(Dict[date, str]):
     """
     A dict-like object containing the holidays for a specific country (and
@@ -244,6 +531,50 @@ class HolidayBase(Dict[date, str]):
     """All holiday categories supported by this entity."""
     supported_languages: Tuple[str, ...] = ()
     """All languages supported by this entity."""
+    max_years: Optional[int] = None
+    """The maximum number of populated years kept (for expand=True objects)."""
+    thread_safe: bool = False
+    """Whether years are populated under a lock and published when done."""
+    _holiday_bitmaps: Optional[Dict[int, int]] = None
+    """Day-of-year holiday bitmaps by year (built on demand)."""
+    _holiday_ordinals: Optional[Dict[int, List[int]]] = None
+    """Sorted holiday date ordinals by year (built on demand)."""
+    _holiday_names: Optional[Dict[bool, "_HolidayNameIndex"]] = None
+    """Holiday name indexes, with and without splitting multiple names
+    (built on demand, dropped on changes)."""
+    _populate_lock: Optional[RLock] = None
+    """The lock serializing years population (thread_safe objects only)."""
+    _populate_layers: Optional[Dict[Tuple[Any, ...], "_PopulateResult"]] = None
+    """Years populated one category at a time by populate cache key (kept
+    once observed or categories are changed)."""
+    _populating_years: Optional[Set[int]] = None
+    """The years being populated (thread_safe objects only)."""
+    _multiple_holiday_names: Optional[Dict[date, Tuple[str, Tuple[str, ...]]]] = None
+    """Names tuples of dates with multiple holidays along with the values
+    they were joined to."""
+    _year_cache_stats: Optional[List[int]] = None
+    """Populated years cache hits, misses and evictions."""
+    _year_records: Optional[Dict[int, "_YearRecord"]] = None
+    """Holidays and weekend working days added by each populated year, from
+    the least to the most recently used one (kept if max_years is set)."""
+    _year_recording: Optional["_YearRecord"] = None
+    """The record of the year being populated."""
+    _workday_counts: Optional[Dict[int, "array[int]"]] = None
+    """Cumulative day-of-year working day counts by year (built on demand)."""
+    _transient_attributes: Tuple[str, ...] = (
+        "_holiday_bitmaps",
+        "_holiday_names",
+        "_holiday_ordinals",
+        "_multiple_holiday_names",
+        "_populate_layers",
+        "_populate_lock",
+        "_populating_years",
+        "_workday_counts",
+        "_year_cache_stats",
+        "_year_records",
+        "_year_recording",
+    )
+    """Derived attributes excluded from copies and pickles."""
 
     def __init__(
         self,
@@ -255,6 +586,8 @@ class HolidayBase(Dict[date, str]):
         state: Optional[str] = None,  # Deprecated.
         language: Optional[str] = None,
         categories: Optional[CategoryArg] = None,
+        max_years: Optional[int] = None,
+        thread_safe: bool = False,
     ) -> None:
         """
         :param years:
@@ -283,11 +616,27 @@ class HolidayBase(Dict[date, str]):
             The language which the returned holiday names will be translated
             into. It must be an ISO 639-1 (2-letter) language code. If the
             language translation is not supported the original holiday names
-            will be used.
+            will be used. The language is matched case-insensitively (e.g.,
+            "en_us" is the same as "en_US").
 
         :param categories:
             Requested holiday categories.
 
+        :param max_years:
+            The maximum number of populated years to keep for expand=True
+            objects. Once exceeded, the least recently used years are evicted
+            (their holidays and weekend working days are removed) and
+            transparently populated again on the next access. Unlimited by
+            default.
+
+        :param thread_safe:
+            Whether the object is shared between threads. Years are then
+            populated under a lock and published to :attr:`years` only once
+            complete, while lookups of already populated years stay lock-free.
+            Other changes (e.g., setting :attr:`observed`) are not covered.
+            Can't be combined with max_years, as an evicted year could be
+            removed while another thread is reading it.
+
         :return:
             A :class:`HolidayBase` object matching the **country**.
         """
@@ -350,6 +699,14 @@ class HolidayBase(Dict[date, str]):
                 "and `substituted_date_format` attributes set."
             )
 
+        if thread_safe and max_years is not None:
+            raise ValueError("Arguments max_years and thread_safe can't be used together.")
+
+        self.max_years = max_years
+        self.thread_safe = thread_safe
+        if thread_safe:
+            self._populate_lock = RLock()
+            self._populating_years = set()
         self.categories = categories
         self.expand = expand
         self.has_special_holidays = getattr(self, "has_special_holidays", False)
@@ -359,22 +716,11 @@ class HolidayBase(Dict[date, str]):
         self.subdiv = subdiv
         self.weekend_workdays = set()
 
-        supported_languages = set(self.supported_languages)
-        self.tr = (
-            translation(
-                self._entity_code,
-                fallback=language not in supported_languages,
-                languages=[language] if language in supported_languages else None,
-                localedir=str(Path(__file__).with_name("locale")),
-            ).gettext
-            if self._entity_code is not None
-            else gettext
-        )
         self.years = _normalize_arguments(int, years)
 
         # Populate holidays.
         for year in self.years:
-            self._populate(year)
+            self._populate_tracked(year)
 
     def __add__(self, other: Union[int, "HolidayBase", "HolidaySum"]) -> "HolidayBase":
         """Add another dictionary of public holidays creating a
@@ -416,6 +762,18 @@ class HolidayBase(Dict[date, str]):
 
         return dict.__contains__(cast("Dict[Any, Any]", self), self.__keytransform__(key))
 
+    def __copy__(self) -> "HolidayBase":
+        holidays = type(self).__new__(type(self))
+        super(HolidayBase, holidays).update(dict.items(self))
+        holidays.__setstate__(self.__getstate__())
+
+        return holidays
+
+    def __delitem__(self, key: DateLike) -> None:
+        dt = self.__keytransform__(key)
+        dict.__delitem__(self, dt)
+        self._unindex_holiday(dt)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, HolidayBase):
             return False
@@ -541,35 +899,64 @@ class HolidayBase(Dict[date, str]):
             if not key.start or not key.stop:
                 raise ValueError("Both start and stop must be given.")
 
-            start = self.__keytransform__(key.start)
-            stop = self.__keytransform__(key.stop)
-
-            if key.step is None:
-                step = 1
-            elif isinstance(key.step, timedelta):
-                step = key.step.days
-            elif isinstance(key.step, int):
-                step = key.step
-            else:
-                raise TypeError(f"Cannot convert type '{type(key.step)}' to int.")
-
-            if step == 0:
-                raise ValueError("Step value must not be zero.")
-
-            date_diff = stop - start
-            if date_diff.days < 0 <= step or date_diff.days >= 0 > step:
-                step *= -1
+            # The days visited are `start + n * step` excluding `stop`, look
+            # them up in the holiday ordinals index within [first, last].
+            first, last, step = _get_slice_range(
+                self.__keytransform__(key.start), self.__keytransform__(key.stop), key.step
+            )
+            if first > last:
+                return []
+            start_ordinal = first if step > 0 else last
+
+            abs_step = abs(step)
+            first_year = date.fromordinal(first).year
+            last_year = date.fromordinal(last).year
+            if self.expand:
+                for year in range(first_year, last_year + 1):
+                    if year in self.years:
+                        continue
+                    # Populate only the years containing a visited day.
+                    year_first = max(first, _get_year_start_ordinal(year))
+                    year_last = min(
+                        last, _get_year_start_ordinal(year) + (365 if isleap(year) else 364)
+                    )
+                    if year_first + (start_ordinal - year_first) % abs_step <= year_last:
+                        self._populate_year(year)
 
+            holiday_ordinals = self._get_holiday_ordinals()
             days_in_range = []
-            for delta_days in range(0, date_diff.days, step):
-                day = _timedelta(start, delta_days)
-                if day in self:
-                    days_in_range.append(day)
+            for year in range(first_year, last_year + 1):
+                ordinals = holiday_ordinals.get(year)
+                if not ordinals:
+                    continue
+                days_in_range.extend(
+                    date.fromordinal(ordinal)
+                    for ordinal in ordinals[
+                        bisect_left(ordinals, first) : bisect_left(ordinals, last + 1)
+                    ]
+                    if (ordinal - start_ordinal) % abs_step == 0
+                )
+
+            if step < 0:
+                days_in_range.reverse()
 
             return days_in_range
 
         return dict.__getitem__(self, self.__keytransform__(key))
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for attribute_name in self._transient_attributes:
+            state.pop(attribute_name, None)
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.thread_safe:
+            self._populate_lock = RLock()
+            self._populating_years = set()
+
     def __keytransform__(self, key: DateLike) -> date:
         """Transforms the date from one of the following types:
 
@@ -581,39 +968,16 @@ class HolidayBase(Dict[date, str]):
 
         to :class:`datetime.date`, which is how it's stored by the class."""
 
-        # Try to catch `date` and `str` type keys first.
-        # Using type() here to skip date subclasses.
-        # Key is `date`.
-        if type(key) is date:
-            dt = key
-
-        # Key is `str` instance.
-        elif isinstance(key, str):
-            try:
-                dt = parse(key).date()
-            except (OverflowError, ValueError):
-                raise ValueError(f"Cannot parse date from string '{key}'")
-
-        # Key is `datetime` instance.
-        elif isinstance(key, datetime):
-            dt = key.date()
-
-        # Must go after the `isinstance(key, datetime)` check as datetime is `date` subclass.
-        elif isinstance(key, date):
-            dt = key
-
-        # Key is `float` or `int` instance.
-        elif isinstance(key, (float, int)):
-            dt = datetime.fromtimestamp(key, timezone.utc).date()
-
-        # Key is not supported.
-        else:
-            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+        # Catch `date` keys first. Using type() here to skip date subclasses.
+        dt = key if type(key) is date else _to_date(key)
 
         # Automatically expand for `expand=True` cases.
         if self.expand and dt.year not in self.years:
-            self.years.add(dt.year)
-            self._populate(dt.year)
+            self._populate_year(dt.year)
+            if self._year_records is not None and self._year_recording is None:
+                self._evict_years()
+        elif self._year_records is not None and self._year_recording is None:
+            self._use_year(dt.year)
 
         return dt
 
@@ -631,7 +995,7 @@ class HolidayBase(Dict[date, str]):
         return self.__add__(other)
 
     def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
-        return super().__reduce__()
+        return _from_serialized, self._serialize()
 
     def __repr__(self) -> str:
         if self:
@@ -654,20 +1018,56 @@ class HolidayBase(Dict[date, str]):
     def __setattr__(self, key: str, value: Any) -> None:
         dict.__setattr__(self, key, value)
 
+        if key in {"weekend", "weekend_workdays"} and self._workday_counts is not None:
+            self._workday_counts = None
+
         if self and key in {"categories", "observed"}:
-            self.clear()
-            for year in self.years:  # Re-populate holidays for each year.
-                self._populate(year)
+            self._repopulate()
 
     def __setitem__(self, key: DateLike, value: str) -> None:
-        if key in self:
+        dt = self.__keytransform__(key)
+        if dict.__contains__(cast("Dict[Any, Any]", self), dt):
             # If there are multiple holidays on the same date
             # order their names alphabetically.
-            holiday_names = set(self[key].split(HOLIDAY_NAME_DELIMITER))
-            holiday_names.update(value.split(HOLIDAY_NAME_DELIMITER))
-            value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
+            current_value = dict.__getitem__(self, dt)
+            multiple_holiday_names = self._multiple_holiday_names
+            if HOLIDAY_NAME_DELIMITER not in current_value:
+                current_names: Tuple[str, ...] = (current_value,)
+            elif (
+                multiple_holiday_names is not None
+                and (entry := multiple_holiday_names.get(dt)) is not None
+                and entry[0] is current_value
+            ):
+                current_names = entry[1]
+            else:
+                # Replaced bypassing __setitem__, so the names are sorted again.
+                current_names = ()
+                value = f"{current_value}{HOLIDAY_NAME_DELIMITER}{value}"
+
+            # The names are kept sorted, the new ones are inserted in place.
+            names = current_names
+            for name in (
+                value.split(HOLIDAY_NAME_DELIMITER)
+                if HOLIDAY_NAME_DELIMITER in value
+                else (value,)
+            ):
+                idx = bisect_left(names, name)
+                if idx == len(names) or names[idx] != name:
+                    names = (*names[:idx], name, *names[idx:])
 
-        dict.__setitem__(self, self.__keytransform__(key), value)
+            if names is current_names:
+                value = current_value
+            else:
+                value = HOLIDAY_NAME_DELIMITER.join(names)
+                if len(names) > 1:
+                    if multiple_holiday_names is None:
+                        multiple_holiday_names = self._multiple_holiday_names = {}
+                    multiple_holiday_names[dt] = (value, names)
+
+        dict.__setitem__(self, dt, value)
+        self._index_holiday(dt)
+        if self._year_recording is not None:
+            self._year_recording.holidays.append((dt, value))
 
     def __str__(self) -> str:
         if self:
@@ -711,6 +1111,12 @@ class HolidayBase(Dict[date, str]):
             .lower()
         )
 
+    @cached_property
+    def tr(self) -> Callable[[str], str]:
+        """The function translating the holiday names to the holidays language
+        (looked up on the first use)."""
+        return self._get_translation(self.language)
+
     @property
     def _sorted_categories(self):
         return (
@@ -728,6 +1134,269 @@ class HolidayBase(Dict[date, str]):
 
         return subdivision_aliases
 
+    def _get_following_year_days(
+        self, year: int
+    ) -> Tuple[Tuple[Tuple[date, str], ...], Tuple[date, ...]]:
+        """Return the holidays and the weekend working days the following year
+        adds to a year, if it's not populated yet.
+
+        The following year is populated into an isolated copy of the object
+        (or taken from the populate cache), so neither :attr:`years` nor the
+        holidays of the object change.
+        """
+        if not self.expand or year >= MAXYEAR or year + 1 in self.years:
+            return (), ()
+
+        options_key = self._get_populate_cache_key()
+        holidays, weekend_workdays, _ = (
+            self._get_populate_layer(options_key, year + 1)
+            if options_key is not None
+            else self._get_isolated_copy(year + 1)._populate_isolated(year + 1)
+        )
+
+        return (
+            tuple((dt, name) for dt, name in holidays if dt.year == year),
+            tuple(dt for dt in weekend_workdays if dt.year == year),
+        )
+
+    def _get_holiday_bitmaps(self) -> Dict[int, int]:
+        """Return day-of-year holiday bitmaps by year.
+
+        The bitmaps are built from the holidays dictionary on the first call
+        and kept in sync by the mutating methods afterwards.
+        """
+        if (bitmaps := self._holiday_bitmaps) is not None:
+            return bitmaps
+
+        with self._get_populate_lock():
+            bitmaps = {}
+            for dt in dict.keys(self):
+                year = dt.year
+                bitmaps[year] = bitmaps.get(year, 0) | 1 << (
+                    dt.toordinal() - _get_year_start_ordinal(year)
+                )
+            self._holiday_bitmaps = bitmaps
+
+        return bitmaps
+
+    def _get_names(self, dt: date, value: str) -> Tuple[str, ...]:
+        """Return the holiday names of a date given its dictionary value.
+
+        The names of dates with multiple holidays are kept as tuples when the
+        holidays are added, so they don't need to be split on every read.
+        """
+        if HOLIDAY_NAME_DELIMITER not in value:
+            return (value,)
+
+        if (
+            self._multiple_holiday_names is not None
+            and (entry := self._multiple_holiday_names.get(dt)) is not None
+            # The value may have been replaced since.
+            and entry[0] is value
+        ):
+            return entry[1]
+
+        return tuple(value.split(HOLIDAY_NAME_DELIMITER))
+
+    def _get_holiday_names(self, split_multiple_names: bool) -> "_HolidayNameIndex":
+        """Return the holiday name index.
+
+        The index is built on the first call and dropped on any change.
+        """
+        if (
+            self._holiday_names is not None
+            and (holiday_names := self._holiday_names.get(split_multiple_names)) is not None
+        ):
+            return holiday_names
+
+        with self._get_populate_lock():
+            holiday_names = _HolidayNameIndex(
+                (dt, self._get_names(dt, value) if split_multiple_names else (value,))
+                for dt, value in dict.items(self)
+            )
+            if self._holiday_names is None:
+                self._holiday_names = {}
+            self._holiday_names[split_multiple_names] = holiday_names
+
+        return holiday_names
+
+    def _get_holiday_ordinals(self) -> Dict[int, List[int]]:
+        """Return sorted holiday date ordinals by year.
+
+        The index is built from the holidays dictionary on the first call and
+        kept in sync by the mutating methods afterwards.
+        """
+        if (holiday_ordinals := self._holiday_ordinals) is not None:
+            return holiday_ordinals
+
+        with self._get_populate_lock():
+            holiday_ordinals = {}
+            for dt in dict.keys(self):
+                holiday_ordinals.setdefault(dt.year, []).append(dt.toordinal())
+            for ordinals in holiday_ordinals.values():
+                ordinals.sort()
+            self._holiday_ordinals = holiday_ordinals
+
+        return holiday_ordinals
+
+    def _get_workday_counts(self, year: int) -> "array[int]":
+        """Return cumulative working day counts for a year.
+
+        The item at index `n` is the number of working days among the first
+        `n` days of the year, so the last item is the year's total. The counts
+        are built on demand and dropped whenever the year's holidays, the
+        weekend or the weekend working days change.
+
+        For `expand=True` objects the days the following year adds to the year
+        (e.g., its substituted holidays moving working days to the end of the
+        year) are counted too, without populating it (see
+        :meth:`_get_following_year_days`).
+        """
+        if self.expand and year not in self.years:
+            self._populate_year(year)
+
+        if (
+            self._workday_counts is not None
+            and (counts := self._workday_counts.get(year)) is not None
+        ):
+            return counts
+
+        with self._get_populate_lock():
+            return self._build_workday_counts(year)
+
+    def _build_workday_counts(self, year: int) -> "array[int]":
+        """Build and keep the cumulative working day counts of a year (see
+        :meth:`_get_workday_counts`)."""
+        if self._workday_counts is None:
+            self._workday_counts = {}
+
+        start = _get_year_start_ordinal(year)
+        holidays_bits = self._get_holiday_bitmaps().get(year, 0)
+        weekend_workdays_bits = 0
+        for dt in self.weekend_workdays:
+            if dt.year == year:
+                weekend_workdays_bits |= 1 << (dt.toordinal() - start)
+        following_holidays, following_weekend_workdays = self._get_following_year_days(year)
+        for dt, _ in following_holidays:
+            holidays_bits |= 1 << (dt.toordinal() - start)
+        for dt in following_weekend_workdays:
+            weekend_workdays_bits |= 1 << (dt.toordinal() - start)
+
+        weekend = self.weekend
+        first_weekday = (start + 6) % 7  # The same formula as date.weekday() uses.
+        counts = array("H", (0,))
+        total = 0
+        for day in range(366 if isleap(year) else 365):
+            if (first_weekday + day) % 7 in weekend:
+                total += weekend_workdays_bits >> day & 1
+            else:
+                total += not holidays_bits >> day & 1
+            counts.append(total)
+
+        self._workday_counts[year] = counts
+        return counts
+
+    def _index_holiday(self, dt: date) -> None:
+        """Update the derived indexes (if built) after a holiday was added."""
+        if (bitmaps := self._holiday_bitmaps) is not None:
+            year = dt.year
+            bit = 1 << (dt.toordinal() - _get_year_start_ordinal(year))
+            bitmaps[year] = bitmaps.get(year, 0) | bit
+
+        if (holiday_ordinals := self._holiday_ordinals) is not None:
+            ordinals = holiday_ordinals.setdefault(dt.year, [])
+            ordinal = dt.toordinal()
+            idx = bisect_left(ordinals, ordinal)
+            if idx == len(ordinals) or ordinals[idx] != ordinal:
+                ordinals.insert(idx, ordinal)
+
+        if self._holiday_names is not None:
+            self._holiday_names = None
+        if self._workday_counts:
+            self._workday_counts.pop(dt.year, None)
+
+    def _unindex_holiday(self, dt: date) -> None:
+        """Update the derived indexes (if built) after a holiday was removed."""
+        if (bitmaps := self._holiday_bitmaps) is not None and (year := dt.year) in bitmaps:
+            bitmaps[year] &= ~(1 << (dt.toordinal() - _get_year_start_ordinal(year)))
+
+        if (holiday_ordinals := self._holiday_ordinals) is not None and (
+            ordinals := holiday_ordinals.get(dt.year)
+        ):
+            ordinal = dt.toordinal()
+            idx = bisect_left(ordinals, ordinal)
+            if idx < len(ordinals) and ordinals[idx] == ordinal:
+                del ordinals[idx]
+
+        if self._holiday_names is not None:
+            self._holiday_names = None
+        if self._multiple_holiday_names:
+            self._multiple_holiday_names.pop(dt, None)
+        if self._workday_counts:
+            self._workday_counts.pop(dt.year, None)
+
+    def _evict_years(self) -> None:
+        """Evict the least recently used years exceeding max_years."""
+        records = self._year_records
+        if not self.expand or self.max_years is None or records is None:
+            return None
+
+        self._evict_lru_years(records, max(self.max_years, 1))
+
+    def _evict_lru_years(self, records: Dict[int, "_YearRecord"], max_years: int) -> None:
+        """Evict the least recently used years until at most max_years left."""
+        while len(records) > max_years:
+            year = next(iter(records))
+            record = records.pop(year)
+            self.years.discard(year)
+
+            # Keep what the adjacent years added too (e.g., observed holidays).
+            kept_holidays: Set[Tuple[date, str]] = set()
+            kept_weekend_workdays: Set[date] = set()
+            for adjacent_year in (year - 1, year + 1):
+                if (adjacent_record := records.get(adjacent_year)) is not None:
+                    for dt, value in adjacent_record.holidays:
+                        kept_holidays.update(
+                            (dt, name) for name in value.split(HOLIDAY_NAME_DELIMITER)
+                        )
+                    kept_weekend_workdays.update(adjacent_record.weekend_workdays)
+
+            evicted_names: Dict[date, Set[str]] = {}
+            for dt, value in record.holidays:
+                evicted_names.setdefault(dt, set()).update(
+                    name
+                    for name in value.split(HOLIDAY_NAME_DELIMITER)
+                    if (dt, name) not in kept_holidays
+                )
+            for dt, names in evicted_names.items():
+                if not names or (current_value := dict.get(self, dt)) is None:
+                    continue
+                if holiday_names := tuple(
+                    name for name in self._get_names(dt, current_value) if name not in names
+                ):
+                    dict.__setitem__(self, dt, HOLIDAY_NAME_DELIMITER.join(holiday_names))
+                    self._index_holiday(dt)
+                else:
+                    dict.__delitem__(self, dt)
+                    self._unindex_holiday(dt)
+
+            self.weekend_workdays.difference_update(
+                dt for dt in record.weekend_workdays if dt not in kept_weekend_workdays
+            )
+            self._workday_counts = None
+            self._year_cache_stats[2] += 1  # type: ignore[index]
+
+    def _use_year(self, year: int) -> None:
+        """Mark a populated year as the most recently used one."""
+        records = self._year_records
+        if records is not None and (record := records.pop(year, None)) is not None:
+            records[year] = record
+        self._year_cache_stats[0] += 1  # type: ignore[index]
+
+        # Years populated in bulk (e.g., by workday methods) are evicted here.
+        if records is not None and len(records) > max(self.max_years or 0, 1):
+            self._evict_years()
+
     def _is_leap_year(self) -> bool:
         """
         Returns True if the year is leap. Returns False otherwise.
@@ -770,7 +1439,12 @@ class HolidayBase(Dict[date, str]):
                         to_month,
                         to_day,
                     )
-                    self.weekend_workdays.add(from_date)
+                    if from_date not in self.weekend_workdays:
+                        self.weekend_workdays.add(from_date)
+                        if self._year_recording is not None:
+                            self._year_recording.weekend_workdays.append(from_date)
+                    if self._workday_counts:
+                        self._workday_counts.pop(from_date.year, None)
 
     def _check_weekday(self, weekday: int, *args) -> bool:
         """
@@ -832,6 +1506,298 @@ class HolidayBase(Dict[date, str]):
         self._populate_common_holidays()
         self._populate_subdiv_holidays()
 
+    def _populate_year(self, year: int) -> None:
+        """Add a not yet calculated year to the object and populate it.
+
+        For thread_safe objects the year is populated under the lock and added
+        to :attr:`years` only afterwards, so other threads never see it
+        partially populated. Lookups of the year while it's being populated
+        by the same thread don't populate it again.
+        """
+        if self._populate_lock is None:
+            self.years.add(year)
+            self._populate_tracked(year)
+            return None
+
+        with self._populate_lock:
+            populating_years = self._populating_years
+            if year in self.years or year in populating_years:  # type: ignore[operator]
+                return None
+
+            populating_years.add(year)  # type: ignore[union-attr]
+            try:
+                self._populate_tracked(year)
+            finally:
+                populating_years.discard(year)  # type: ignore[union-attr]
+            self.years.add(year)
+
+    def _get_populate_lock(self) -> ContextManager[Any]:
+        """Return the lock to read the holidays under while building the
+        derived indexes, so that thread_safe objects aren't expanded
+        meanwhile (a no-op context for the other objects)."""
+        if self._populate_lock is None:
+            return nullcontext()
+
+        return self._populate_lock
+
+    def _get_populate_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        """Return the populate cache key of the object options.
+
+        The key must cover everything the holidays depend on except for the
+        categories and the year, which are added to it per cache entry.
+        Entities with extra options extend it, None means the object can't be
+        cached.
+        """
+        # The language holiday names are actually translated to (if any).
+        translations = getattr(self.tr, "__self__", None)
+        return (
+            type(self),
+            self.subdiv,
+            self.observed,
+            translations.info().get("language") if translations is not None else None,
+            frozenset(self.weekend),
+        )
+
+    def _populate_cached(self, year: int) -> None:
+        """Populate a year, reusing the process-wide populate cache results
+        if it's enabled.
+
+        On a cache miss the year is populated into an empty copy of the object
+        first, so the cached results don't depend on the other years. Objects
+        populated by layers (see :meth:`_repopulate`) reuse the year layers.
+        """
+        cache = _populate_cache
+        if (cache is None and self._populate_layers is None) or (
+            options_key := self._get_populate_cache_key()
+        ) is None:
+            self._populate(year)
+            return None
+
+        holidays, weekend_workdays, state = self._get_populate_layer(options_key, year)
+
+        self._year = year
+        self._set_populate_state(state)
+        for dt, value in holidays:
+            self[dt] = value
+        for dt in weekend_workdays:
+            if dt not in self.weekend_workdays:
+                self.weekend_workdays.add(dt)
+                if self._year_recording is not None:
+                    self._year_recording.weekend_workdays.append(dt)
+            if self._workday_counts:
+                self._workday_counts.pop(dt.year, None)
+
+    def _get_populate_layer(self, options_key: Tuple[Any, ...], year: int) -> "_PopulateResult":
+        """Return the results of populating a year.
+
+        All the categories are populated together, as some of them depend on
+        the others (e.g., the observed rules shifting holidays to the days
+        taken by the other categories holidays). The layers are computed once
+        per options, categories and year (or taken from the populate cache if
+        it's enabled) and kept only if the object is populated by layers.
+        """
+        key = (options_key, frozenset(self.categories), year)
+        layers = self._populate_layers
+        if layers is not None and (layer := layers.get(key)) is not None:
+            return layer
+
+        cache = _populate_cache
+        if cache is None or (layer := cache.get(key)) is None:
+            layer = self._get_isolated_copy(year)._populate_isolated(year)
+            if cache is not None:
+                cache.put(key, layer)
+        if layers is not None:
+            layers[key] = layer
+
+        return layer
+
+    def _get_isolated_copy(self, year: int, **attributes) -> "HolidayBase":
+        """Return an empty non-expanding copy of the object, so that a year
+        can be populated regardless of the other years.
+
+        :param attributes:
+            The attributes to override (e.g., categories).
+        """
+        holidays = type(self).__new__(type(self))
+        state = self.__getstate__()
+        state.update(
+            expand=False,
+            max_years=None,
+            thread_safe=False,
+            weekend_workdays=set(),
+            years={year},
+            **attributes,
+        )
+        holidays.__dict__.update(state)
+
+        return holidays
+
+    def _serialize(self) -> Tuple[Any, ...]:
+        """Return the compact serialized form of the object.
+
+        The holidays are stored as date ordinals and indexes into a table of
+        distinct names. The translation function is not stored but recreated
+        from the language.
+        """
+        state = self.__getstate__()
+        for attribute_name in ("tr", "weekend_workdays", "years"):
+            state.pop(attribute_name, None)
+
+        name_ids: Dict[str, int] = {}
+        ordinals = array("i")
+        ids = []
+        for dt, name in dict.items(self):
+            ordinals.append(dt.toordinal())
+            ids.append(name_ids.setdefault(name, len(name_ids)))
+        # The smallest array type fitting all the name indexes.
+        typecode = next(
+            typecode
+            for size, typecode in _NAME_ID_TYPECODES.items()
+            if len(name_ids) <= 1 << (8 * size)
+        )
+
+        return (
+            type(self),
+            state,
+            tuple(sorted(self.years)),
+            _array_to_bytes(ordinals),
+            tuple(name_ids),
+            _array_to_bytes(array(typecode, ids)),
+            _array_to_bytes(array("i", sorted(dt.toordinal() for dt in self.weekend_workdays))),
+        )
+
+    def _get_translation(self, language: Optional[str]) -> Callable[[str], str]:
+        """Return the function translating the holiday names to the language.
+
+        Unsupported languages fall back to the language set by the locale
+        environment variables (if supported).
+        """
+        # Not an entity or a sum of entities.
+        if not isinstance(self._entity_code, str):
+            from gettext import gettext
+
+            return gettext
+
+        if language is not None:
+            language = next(
+                (
+                    supported_language
+                    for supported_language in self.supported_languages
+                    if supported_language.lower() == language.lower()
+                ),
+                None,
+            )
+
+        return _get_translation_function(
+            self._entity_code,
+            language,
+            ()
+            if language is not None
+            else tuple(os.environ.get(name) for name in _LOCALE_ENVIRONMENT_VARIABLES),
+        )
+
+    def _get_observed_view(self, observed: bool) -> "HolidayBase":
+        """Return a copy of the object with the observed value set, sharing
+        the populated years layers with the object."""
+        if self._populate_layers is None:
+            self._populate_layers = {}
+        view = self.copy()
+        view._populate_layers = self._populate_layers
+        # Not to be shared by the shallow copy.
+        view.weekend_workdays = set(self.weekend_workdays)
+        view.years = set(self.years)
+        if view.observed != observed:
+            view.observed = observed
+
+        return view
+
+    def _populate_isolated(self, year: int) -> "_PopulateResult":
+        """Populate a year of an isolated copy (see :meth:`_get_isolated_copy`).
+
+        :return:
+            The holidays and the weekend working days added by the year, and
+            the object state left by populating it (see
+            :meth:`_get_populate_state`).
+        """
+        self._populate(year)
+
+        return tuple(dict.items(self)), tuple(self.weekend_workdays), self._get_populate_state()
+
+    def _get_populate_state(self) -> Tuple[Any, ...]:
+        """Return the object attributes populating a year may change.
+
+        Some entities change the weekend days while populating a year (e.g.,
+        Saudi Arabia before 2013), so the populated years results restore them
+        the same way populating the year does.
+        """
+        return (tuple(sorted(self.weekend)),)
+
+    def _set_populate_state(self, state: Sequence[Any]) -> None:
+        """Restore the object attributes returned by :meth:`_get_populate_state`."""
+        weekend = set(state[0])
+        if weekend != self.weekend:
+            self.weekend = weekend
+
+    def _repopulate(self) -> None:
+        """Populate all the years again after :attr:`observed` or
+        :attr:`categories` change.
+
+        The results of each year are kept as layers per options and
+        categories, so only the years not computed yet for the new
+        :attr:`observed` and :attr:`categories` values are populated and the
+        holidays are recomposed from the layers.
+        """
+        self.clear()
+        if self._get_populate_cache_key() is None or self._year_records is not None:
+            for year in tuple(self.years):
+                self._populate_tracked(year)
+            return None
+
+        if self._populate_layers is None:
+            self._populate_layers = {}
+        years = self.years
+        for year in tuple(years):
+            # The options may depend on the state left by the previous year.
+            options_key = cast("Tuple[Any, ...]", self._get_populate_cache_key())
+            holidays, weekend_workdays, state = self._get_populate_layer(options_key, year)
+            self._set_populate_state(state)
+            for dt, value in holidays:
+                if dt.year in years and not dict.__contains__(cast("Dict[Any, Any]", self), dt):
+                    dict.__setitem__(self, dt, value)
+                else:  # Merge the names or expand to another year.
+                    self[dt] = value
+            self.weekend_workdays.update(weekend_workdays)
+
+        # The holidays were added bypassing the indexes.
+        self._holiday_bitmaps = None
+        self._holiday_ordinals = None
+
+    def _populate_tracked(self, year: int) -> None:
+        """Populate a year.
+
+        If max_years is set, the holidays and weekend working days added by
+        the year are recorded so that it can be evicted later.
+        """
+        if self.max_years is None:
+            self._populate_cached(year)
+            return None
+
+        if self._year_records is None:
+            self._year_cache_stats = [0, 0, 0]
+            self._year_records = {}
+
+        # Years may be populated while populating another one.
+        outer_recording = self._year_recording
+        self._year_recording = record = _YearRecord()
+        try:
+            self._populate_cached(year)
+        finally:
+            self._year_recording = outer_recording
+
+        self._year_records.pop(year, None)
+        self._year_records[year] = record
+        self._year_cache_stats[1] += 1  # type: ignore[index]
+
     def _populate_common_holidays(self):
         """Populate entity common holidays."""
         for category in self._sorted_categories:
@@ -862,14 +1828,88 @@ class HolidayBase(Dict[date, str]):
                 for category in self._sorted_categories
             )
 
+    def actual_view(self) -> "HolidayBase":
+        """Return a copy of the object without observed holidays, i.e., with
+        the holidays on their actual dates.
+
+        The copy shares the populated years layers with the object and its
+        other views (see :meth:`observed_view`), so each year is populated
+        once per observed value for all of them.
+        """
+        return self._get_observed_view(observed=False)
+
     def append(self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]) -> None:
         """Alias for :meth:`update` to mimic list type."""
         return self.update(*args)
 
+    def clear(self) -> None:
+        """Remove all holidays from the object."""
+        super().clear()
+        if self._holiday_bitmaps is not None:
+            self._holiday_bitmaps.clear()
+        if self._holiday_ordinals is not None:
+            self._holiday_ordinals.clear()
+        self._holiday_names = None
+        self._multiple_holiday_names = None
+        self._workday_counts = None
+        if self._year_records:
+            self._year_records.clear()
+
+    def contains_many(self, keys: Any) -> "np.ndarray":
+        """Return a boolean mask marking which of the dates are holidays.
+
+        This is a vectorized batch version of the ``in`` operator. All distinct
+        years of the dates are populated up front and the membership of the
+        whole batch is resolved in a single NumPy pass. NumPy is imported only
+        when this method is used.
+
+        :param keys:
+            An array-like of :class:`datetime.date` /
+            :class:`datetime.datetime` objects, ``datetime64`` values (e.g.
+            a pandas ``Series``), POSIX timestamps or any other keys
+            supported by the ``in`` operator.
+
+        :return:
+            A boolean :class:`numpy.ndarray` shaped as **keys**.
+        """
+        from holidays.vectorized import holiday_mask
+
+        return holiday_mask(self, keys)
+
     def copy(self):
         """Return a copy of the object."""
         return copy.copy(self)
 
+    def freeze(self, years: Optional[YearArg] = None) -> "FrozenHolidays":
+        """Return an immutable snapshot of the holidays.
+
+        :param years:
+            The years to include in the snapshot, populated first if needed.
+            If not given, the currently populated years are used.
+
+        :return:
+            A :class:`FrozenHolidays` object.
+        """
+        return FrozenHolidays(self, years)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HolidayBase":
+        """Return the object serialized by :meth:`to_bytes`.
+
+        As the data is unpickled, it must come from a trusted source.
+
+        :param data:
+            The bytes returned by :meth:`to_bytes`.
+        """
+        import pickle
+        import zlib
+
+        holidays = pickle.loads(zlib.decompress(data))
+        if not isinstance(holidays, cls):
+            raise TypeError(f"Data doesn't represent a '{cls.__name__}' object.")
+
+        return holidays
+
     def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """Return the holiday name for a date if date is a holiday, else
         default. If default is not given, it defaults to None, so that this
@@ -905,7 +1945,28 @@ class HolidayBase(Dict[date, str]):
             * or a :class:`float` or :class:`int` representing a POSIX
               timestamp.
         """
-        return [name for name in self.get(key, "").split(HOLIDAY_NAME_DELIMITER) if name]
+        return list(self.get_names(key))
+
+    def get_names(self, key: DateLike) -> Tuple[str, ...]:
+        """Return a tuple of all holiday names for a date if date is a holiday,
+        else empty tuple.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+        """
+        dt = self.__keytransform__(key)
+        if (value := dict.get(self, dt)) is None:
+            return ()
+
+        names = self._get_names(dt, value)
+        return names if all(names) else tuple(name for name in names if name)
 
     def get_named(
         self, holiday_name: str, lookup="icontains", split_multiple_names=True
@@ -931,63 +1992,177 @@ class HolidayBase(Dict[date, str]):
         :return:
             A list of all holiday dates matching the provided holiday name.
         """
-        holiday_name_dates = (
-            ((k, name) for k, v in self.items() for name in v.split(HOLIDAY_NAME_DELIMITER))
-            if split_multiple_names
-            else ((k, v) for k, v in self.items())
-        )
+        holiday_names = self._get_holiday_names(split_multiple_names)
 
+        # Match the distinct names first, then collect their dates.
         if lookup == "icontains":
             holiday_name_lower = holiday_name.lower()
-            return [dt for dt, name in holiday_name_dates if holiday_name_lower in name.lower()]
+            names = [
+                name
+                for name_lower, names in holiday_names.names_by_lower.items()
+                if holiday_name_lower in name_lower
+                for name in names
+            ]
         elif lookup == "exact":
-            return [dt for dt, name in holiday_name_dates if holiday_name == name]
+            names = (
+                [holiday_name]
+                if isinstance(holiday_name, str) and holiday_name in holiday_names.entries
+                else []
+            )
         elif lookup == "contains":
-            return [dt for dt, name in holiday_name_dates if holiday_name in name]
+            names = [name for name in holiday_names.names if holiday_name in name]
         elif lookup == "startswith":
-            return [
-                dt for dt, name in holiday_name_dates if holiday_name == name[: len(holiday_name)]
-            ]
+            sorted_names = holiday_names.names
+            names = []
+            for idx in range(bisect_left(sorted_names, holiday_name), len(sorted_names)):
+                if sorted_names[idx][: len(holiday_name)] != holiday_name:
+                    break
+                names.append(sorted_names[idx])
         elif lookup == "iexact":
-            holiday_name_lower = holiday_name.lower()
-            return [dt for dt, name in holiday_name_dates if holiday_name_lower == name.lower()]
+            names = holiday_names.names_by_lower.get(holiday_name.lower(), [])
         elif lookup == "istartswith":
             holiday_name_lower = holiday_name.lower()
-            return [
-                dt
-                for dt, name in holiday_name_dates
+            names = [
+                name
+                for name in holiday_names.names
                 if holiday_name_lower == name[: len(holiday_name)].lower()
             ]
+        else:
+            raise AttributeError(f"Unknown lookup type: {lookup}")
 
-        raise AttributeError(f"Unknown lookup type: {lookup}")
+        entries = holiday_names.entries
+        if len(names) == 1:
+            return [dt for _, dt in entries[names[0]]]
+
+        return [dt for _, dt in sorted(entry for name in names for entry in entries[name])]
 
     def get_nth_workday(self, key: DateLike, n: int) -> date:
         """Return n-th working day from provided date (if n is positive)
         or n-th working day before provided date (if n is negative).
+
+        The date is located with a binary search over per-year cumulative
+        working day counts instead of checking the days one by one.
         """
-        direction = +1 if n > 0 else -1
-        dt = self.__keytransform__(key)
-        for _ in range(abs(n)):
-            dt = _timedelta(dt, direction)
-            while not self.is_workday(dt):
-                dt = _timedelta(dt, direction)
-        return dt
+        return _get_nth_workday(self._get_workday_counts, self.__keytransform__(key), n)
 
     def get_workdays_number(self, key1: DateLike, key2: DateLike) -> int:
-        """Return the number of working days between two dates (not including the start date)."""
-        dt1 = self.__keytransform__(key1)
-        dt2 = self.__keytransform__(key2)
-        if dt1 == dt2:
-            return 0
-        if dt1 > dt2:
-            dt1, dt2 = dt2, dt1
+        """Return the number of working days between two dates (not including the start date).
 
-        return sum(self.is_workday(_timedelta(dt1, n)) for n in range(1, (dt2 - dt1).days + 1))
+        The result is computed from per-year cumulative working day counts,
+        so it costs two lookups plus one addition per calendar year spanned.
+        """
+        return _get_workdays_number(
+            self._get_workday_counts, self.__keytransform__(key1), self.__keytransform__(key2)
+        )
 
     def is_workday(self, key: DateLike) -> bool:
         """Return True if date is a working day (not a holiday or a weekend)."""
         dt = self.__keytransform__(key)
-        return dt in self.weekend_workdays if self._is_weekend(dt) else dt not in self
+        if not self._is_weekend(dt):
+            return dt not in self
+        if dt in self.weekend_workdays:
+            return True
+
+        # The following year not populated yet may move working days to the
+        # end of the year, they're found by the year working day counts.
+        year = dt.year
+        if not self.expand or year >= MAXYEAR or year + 1 in self.years:
+            return False
+        counts = self._get_workday_counts(year)
+        day = dt.toordinal() - _get_year_start_ordinal(year)
+
+        return counts[day + 1] > counts[day]
+
+    def is_workday_many(self, keys: Any) -> "np.ndarray":
+        """Return a boolean mask marking which of the dates are working days.
+
+        This is a vectorized batch version of :meth:`is_workday` combining the
+        entity's weekend days, its holidays and its working days moved to
+        weekends in NumPy operations. NumPy is imported only when this method
+        is used.
+
+        :param keys:
+            The dates in any form supported by :meth:`contains_many`.
+
+        :return:
+            A boolean :class:`numpy.ndarray` shaped as **keys**.
+        """
+        from holidays.vectorized import workday_mask
+
+        return workday_mask(self, keys)
+
+    def iter_holidays(self, start: DateLike, end: DateLike) -> Iterator[Tuple[date, str]]:
+        """Iterate over (date, name) pairs of holidays in date order.
+
+        The holidays are read from a sorted holiday dates index one year at a
+        time. For expand=True objects each year is populated only when the
+        iteration reaches it, together with its adjacent years as those may
+        add holidays (e.g., observed ones) to it.
+
+        :param start:
+            The first date of the range (inclusive).
+        :param end:
+            The last date of the range (inclusive). The holidays are yielded
+            in reverse date order if it's before the start date.
+        """
+        start_dt = self.__keytransform__(start)
+        end_dt = self.__keytransform__(end)
+        first, last = start_dt.toordinal(), end_dt.toordinal()
+        reverse = first > last
+        if reverse:
+            first, last = last, first
+
+        step = -1 if reverse else 1
+        for year in range(start_dt.year, end_dt.year + step, step):
+            if self.expand:
+                for y in range(max(year - 1, MINYEAR), min(year + 1, MAXYEAR) + 1):
+                    if y not in self.years:
+                        self._populate_year(y)
+
+            ordinals = self._get_holiday_ordinals().get(year)
+            if not ordinals:
+                continue
+
+            year_ordinals = ordinals[bisect_left(ordinals, first) : bisect_right(ordinals, last)]
+            if reverse:
+                year_ordinals.reverse()
+            for ordinal in year_ordinals:
+                dt = date.fromordinal(ordinal)
+                # Skip holidays removed while iterating.
+                if (name := dict.get(self, dt)) is not None:
+                    yield dt, name
+
+    def next_holiday(self, key: Optional[DateLike] = None) -> Optional[Tuple[date, str]]:
+        """Return the first holiday after the date and its name.
+
+        The year of the date and the following one are searched (populating
+        them for expand=True objects) as well as any later populated years.
+
+        :param key:
+            The date expressed in any type supported by :meth:`get`.
+            Defaults to the current date.
+
+        :return:
+            A (date, name) tuple or None if no holiday was found.
+        """
+        dt = self.__keytransform__(date.today() if key is None else key)
+        if dt.year == MAXYEAR and (dt.month, dt.day) == (12, 31):
+            return None
+
+        last_year = min(max(dt.year + 1, max(self.years, default=dt.year)), MAXYEAR)
+        return next(
+            self.iter_holidays(date.fromordinal(dt.toordinal() + 1), date(last_year, 12, 31)),
+            None,
+        )
+
+    def observed_view(self) -> "HolidayBase":
+        """Return a copy of the object with observed holidays.
+
+        The copy shares the populated years layers with the object and its
+        other views (see :meth:`actual_view`), so each year is populated once
+        per observed value for all of them.
+        """
+        return self._get_observed_view(observed=True)
 
     def pop(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """If date is a holiday, remove it and return its date, else return
@@ -1012,10 +2187,14 @@ class HolidayBase(Dict[date, str]):
         :raise:
             KeyError if date is not a holiday and default is not given.
         """
+        dt = self.__keytransform__(key)
         if default is None:
-            return dict.pop(self, self.__keytransform__(key))
+            value = dict.pop(self, dt)
+        else:
+            value = dict.pop(self, dt, default)
+        self._unindex_holiday(dt)
 
-        return dict.pop(self, self.__keytransform__(key), default)
+        return value
 
     def pop_named(self, name: str) -> List[date]:
         """Remove (no longer treat at as holiday) all dates matching the
@@ -1040,25 +2219,81 @@ class HolidayBase(Dict[date, str]):
             raise KeyError(name)
 
         popped = []
+        name_lower = name.lower()
         for dt in dts:
-            holiday_names = self[dt].split(HOLIDAY_NAME_DELIMITER)
+            holiday_names = self._get_names(dt, dict.__getitem__(self, dt))
             self.pop(dt)
             popped.append(dt)
 
             # Keep the rest of holidays falling on the same date.
             if not use_exact_name:
-                name_lower = name.lower()
-                holiday_names = [
+                holiday_names = tuple(
                     holiday_name
                     for holiday_name in holiday_names
                     if name_lower not in holiday_name.lower()
-                ]
+                )
 
                 if len(holiday_names) > 0:
                     self[dt] = HOLIDAY_NAME_DELIMITER.join(holiday_names)
 
         return popped
 
+    def popitem(self) -> Tuple[date, str]:
+        """Remove and return the most recently added (date, name) pair."""
+        dt, name = super().popitem()
+        self._unindex_holiday(dt)
+
+        return dt, name
+
+    def previous_holiday(self, key: Optional[DateLike] = None) -> Optional[Tuple[date, str]]:
+        """Return the last holiday before the date and its name.
+
+        The year of the date and the preceding one are searched (populating
+        them for expand=True objects) as well as any earlier populated years.
+
+        :param key:
+            The date expressed in any type supported by :meth:`get`.
+            Defaults to the current date.
+
+        :return:
+            A (date, name) tuple or None if no holiday was found.
+        """
+        dt = self.__keytransform__(date.today() if key is None else key)
+        if dt.year == MINYEAR and (dt.month, dt.day) == (1, 1):
+            return None
+
+        first_year = max(min(dt.year - 1, min(self.years, default=dt.year)), MINYEAR)
+        return next(
+            self.iter_holidays(date.fromordinal(dt.toordinal() - 1), date(first_year, 1, 1)),
+            None,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Return the object serialized to compressed bytes.
+
+        The entity parameters, the populated years and the holidays (as date
+        ordinals and indexes into a table of distinct names) are stored, so
+        :meth:`from_bytes` recreates the object without populating any of
+        the years again. Pickling the object uses the same format, only
+        uncompressed.
+        """
+        import pickle
+        import zlib
+
+        return zlib.compress(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def year_cache_info(self) -> YearCacheInfo:
+        """Return the populated years cache statistics.
+
+        The hits and misses count date lookups of already populated and not
+        yet populated years respectively. The statistics are kept only if
+        max_years is set.
+        """
+        hits, misses, evictions = self._year_cache_stats or (0, 0, 0)
+        return YearCacheInfo(
+            hits, misses, evictions, self.max_years, len(self._year_records or ())
+        )
+
     def update(  # type: ignore[override]
         self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]
     ) -> None:
@@ -1090,6 +2325,249 @@ class HolidayBase(Dict[date, str]):
                 self[arg] = "Holiday"
 
 
+class _HolidayNameIndex:
+    """Holiday dates by holiday name.
+
+    Each date is stored along with the position of its date and name pair in
+    the holidays iteration, so lookups return the dates in the same order as
+    a scan over the holidays does.
+    """
+
+    __slots__ = ("entries", "names", "names_by_lower")
+
+    def __init__(self, items: Iterable[Tuple[date, Tuple[str, ...]]]) -> None:
+        self.entries: Dict[str, List[Tuple[int, date]]] = {}
+        order = 0
+        for dt, names in items:
+            for name in names:
+                self.entries.setdefault(name, []).append((order, dt))
+                order += 1
+
+        self.names: List[str] = sorted(self.entries)
+        self.names_by_lower: Dict[str, List[str]] = {}
+        for name in self.names:
+            self.names_by_lower.setdefault(name.lower(), []).append(name)
+
+
+_PopulateResult = Tuple[Tuple[Tuple[date, str], ...], Tuple[date, ...], Tuple[Any, ...]]
+
+
+class _PopulateCache:
+    """A bounded LRU cache of populated years results shared by all holidays
+    objects of the process, optionally backed by a persistent store."""
+
+    __slots__ = ("evictions", "hits", "lock", "maxsize", "misses", "results", "store")
+
+    def __init__(self, maxsize: int, store: Optional["_PopulateCacheStore"] = None) -> None:
+        self.evictions = 0
+        self.hits = 0
+        self.lock = Lock()
+        self.maxsize = maxsize
+        self.misses = 0
+        self.results: Dict[Tuple[Any, ...], _PopulateResult] = {}
+        self.store = store
+
+    def _evict(self) -> None:
+        """Evict the least recently used results exceeding the cache size."""
+        results = self.results
+        while len(results) > self.maxsize:
+            del results[next(iter(results))]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop the cached results and reset the statistics."""
+        with self.lock:
+            self.results.clear()
+            self.evictions = self.hits = self.misses = 0
+            if self.store is not None:
+                self.store.clear()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[_PopulateResult]:
+        """Return the results cached for the key marking them as the most
+        recently used ones, or None."""
+        with self.lock:
+            if (result := self.results.pop(key, None)) is None and (
+                self.store is None or (result := self.store.get(key)) is None
+            ):
+                self.misses += 1
+                return None
+
+            self.results[key] = result
+            self.hits += 1
+            self._evict()
+            return result
+
+    def info(self) -> YearCacheInfo:
+        """Return the cache statistics."""
+        with self.lock:
+            return YearCacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self.results)
+            )
+
+    def put(self, key: Tuple[Any, ...], result: _PopulateResult) -> None:
+        """Cache the results evicting the least recently used ones if needed."""
+        with self.lock:
+            results = self.results
+            results.pop(key, None)
+            results[key] = result
+            self._evict()
+            if self.store is not None:
+                self.store.put(key, result)
+
+
+class _PopulateCacheStore:
+    """A SQLite database of populated years results shared by the processes
+    using the same file.
+
+    The results are stored per package version, so the installations of
+    different versions sharing the file don't use (or drop) each other's
+    results. Only the package's own
+    entities results are stored, as the custom entities may change with no
+    version change. Failing database operations are treated as cache misses.
+    """
+
+    __slots__ = ("_connection", "_pid", "path", "version")
+
+    def __init__(self, path: Path, version: str) -> None:
+        """
+        :param path:
+            The database file, created along with its directory if missing.
+
+        :param version:
+            The package version the results are stored for.
+        """
+        self._connection: Optional["sqlite3.Connection"] = None
+        self._pid: Optional[int] = None
+        self.path = path
+        self.version = version
+        self._connect()
+
+    def _connect(self) -> "sqlite3.Connection":
+        """Return the database connection of the current process.
+
+        The connection isn't shared with the processes forked after it was
+        opened, they open their own ones.
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        import sqlite3
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "version TEXT NOT NULL, key TEXT NOT NULL, result TEXT NOT NULL, "
+            "PRIMARY KEY (version, key))"
+        )
+        self._connection = connection
+        self._pid = os.getpid()
+
+        return connection
+
+    @staticmethod
+    def _get_store_key(key: Tuple[Any, ...]) -> Optional[str]:
+        """Return the database key of the populate cache key, or None if the
+        results can't be stored."""
+        options_key, categories, year = key
+        entity_cls = options_key[0]
+        if not entity_cls.__module__.startswith("holidays."):
+            return None
+
+        return repr(
+            (
+                f"{entity_cls.__module__}.{entity_cls.__qualname__}",
+                *(
+                    tuple(sorted(option)) if isinstance(option, frozenset) else option
+                    for option in options_key[1:]
+                ),
+                tuple(sorted(categories)),
+                year,
+            )
+        )
+
+    def clear(self) -> None:
+        """Drop the stored results."""
+        import sqlite3
+
+        try:
+            self._connect().execute("DELETE FROM results")
+        except sqlite3.Error:
+            pass
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[_PopulateResult]:
+        """Return the results stored for the key, or None."""
+        import json
+        import sqlite3
+
+        if (store_key := self._get_store_key(key)) is None:
+            return None
+
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT result FROM results WHERE version = ? AND key = ?",
+                    (self.version, store_key),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+
+        try:
+            holidays, weekend_workdays, state = json.loads(row[0])
+        except ValueError:  # Stored in another format.
+            return None
+        return (
+            tuple((date.fromordinal(ordinal), name) for ordinal, name in holidays),
+            tuple(map(date.fromordinal, weekend_workdays)),
+            tuple(state),
+        )
+
+    def put(self, key: Tuple[Any, ...], result: _PopulateResult) -> None:
+        """Store the results for the key."""
+        import json
+        import sqlite3
+
+        if (store_key := self._get_store_key(key)) is None:
+            return None
+
+        holidays, weekend_workdays, state = result
+        value = json.dumps(
+            (
+                [(dt.toordinal(), name) for dt, name in holidays],
+                [dt.toordinal() for dt in weekend_workdays],
+                state,
+            ),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO results (version, key, result) VALUES (?, ?, ?)",
+                (self.version, store_key, value),
+            )
+        except sqlite3.Error:
+            pass
+
+
+class _YearRecord:
+    """Holidays and weekend working days added by populating a year."""
+
+    __slots__ = ("holidays", "weekend_workdays")
+
+    def __init__(self) -> None:
+        self.holidays: List[Tuple[date, str]] = []
+        self.weekend_workdays: List[date] = []
+
+
 class HolidaySum(HolidayBase):
     """
     Returns a :class:`dict`-like object resulting from the addition of two or
@@ -1188,7 +2666,538 @@ country_holidays('CA') + country_holidays('MX')
 
         HolidayBase.__init__(self, **kwargs)
 
+    def _get_populate_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        # The operands are populated (and cached) on their own.
+        return None
+
+    def _get_isolated_copy(self, year: int, **attributes) -> "HolidayBase":
+        holidays = super()._get_isolated_copy(year, **attributes)
+        # The operands are populated by the sum, so they're isolated too.
+        holidays.holidays = [operand._get_isolated_copy(year) for operand in self.holidays]
+
+        return holidays
+
     def _populate(self, year):
         for operand in self.holidays:
             operand._populate(year)
             self.update(cast("Dict[DateLike, str]", operand))
+
+
+class HolidayUnion(Mapping[date, str]):
+    """
+    Returns a read-only :class:`dict`-like view of the union of any number of
+    :class:`HolidayBase` objects (see :func:`holidays.utils.union`).
+
+    Unlike :class:`HolidaySum` the view doesn't copy the operands' holidays:
+    membership is answered from the operands themselves (which are expanded
+    according to their own :attr:`HolidayBase.expand` values) and the names
+    of the holidays shared by several operands are merged only when they are
+    requested. The expandable operands are populated for the years of all
+    the other operands once, when the view is created.
+    """
+
+    __slots__ = ("holidays",)
+
+    holidays: Tuple[HolidayBase, ...]
+    """The original HolidayBase objects included in the union."""
+
+    def __init__(
+        self,
+        holidays: Iterable[Union[HolidayBase, "HolidayUnion"]],
+        years: Optional[YearArg] = None,
+    ) -> None:
+        """
+        :param holidays:
+            The HolidayBase objects to join. Nested :class:`HolidaySum` and
+            :class:`HolidayUnion` objects are flattened.
+
+        :param years:
+            The years to populate the operands for.
+        """
+        operands: List[HolidayBase] = []
+        for operand in holidays:
+            if isinstance(operand, (HolidaySum, HolidayUnion)):
+                operands.extend(operand.holidays)
+            elif isinstance(operand, HolidayBase):
+                operands.append(operand)
+            else:
+                raise TypeError("Holiday objects can only be joined with other Holiday objects")
+        self.holidays = tuple(operands)
+
+        _align_years(self.holidays, years)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        dt = _to_date(key)
+        return any(dt in operand for operand in self.holidays)
+
+    def __getitem__(self, key: DateLike) -> Any:
+        if isinstance(key, slice):
+            if not key.start or not key.stop:
+                raise ValueError("Both start and stop must be given.")
+
+            _, _, step = _get_slice_range(_to_date(key.start), _to_date(key.stop), key.step)
+            return sorted(
+                set().union(*(operand[key] for operand in self.holidays)), reverse=step < 0
+            )
+
+        dt = _to_date(key)
+        names = self.get_names(dt)
+        if not names:
+            raise KeyError(dt)
+
+        return HOLIDAY_NAME_DELIMITER.join(names)
+
+    def __iter__(self) -> Iterator[date]:
+        return iter(sorted(self._get_dates()))
+
+    def __len__(self) -> int:
+        return len(self._get_dates())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.holidays)!r})"
+
+    def _get_dates(self) -> Set[date]:
+        return set().union(*(dict.keys(operand) for operand in self.holidays))
+
+    @property
+    def years(self) -> Set[int]:
+        """The years calculated by all the operands."""
+        return set().union(*(operand.years for operand in self.holidays))
+
+    def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
+        """Return the holiday name for a date if date is a holiday, else
+        default (see :meth:`HolidayBase.get`)."""
+        names = self.get_names(key)
+        return HOLIDAY_NAME_DELIMITER.join(names) if names else default
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date if date is a holiday,
+        else empty list (see :meth:`HolidayBase.get_list`)."""
+        return list(self.get_names(key))
+
+    def get_names(self, key: DateLike) -> Tuple[str, ...]:
+        """Return a tuple of all holiday names for a date if date is a holiday,
+        else empty tuple (see :meth:`HolidayBase.get_names`).
+
+        The names of a date found in several operands are merged and sorted
+        alphabetically the way :class:`HolidaySum` does it.
+        """
+        return _get_merged_names(self.holidays, _to_date(key))
+
+
+class HolidayQuorum(Mapping[date, str]):
+    """
+    Returns a read-only :class:`dict`-like view of the dates that are holidays
+    in at least :attr:`quorum` of several :class:`HolidayBase` objects (see
+    :func:`holidays.utils.intersection` and :func:`holidays.utils.closed_count`).
+
+    The view supports membership tests, slices and working day arithmetic. A
+    date is a working day of the view unless at least :attr:`quorum` of the
+    operands are closed (i.e., have a holiday or a weekend day) on it.
+
+    The operands' per-year holiday and closed days bitmaps are combined when
+    a year is used for the first time and kept: later changes to the
+    operands' holidays for that year are not reflected in the view.
+    """
+
+    __slots__ = ("_holiday_bitmaps", "_workday_counts", "holidays", "quorum")
+
+    _holiday_bitmaps: Dict[int, int]
+    _workday_counts: Dict[int, "array[int]"]
+
+    holidays: Tuple[HolidayBase, ...]
+    """The original HolidayBase objects included in the view."""
+    quorum: int
+    """The number of operands a date must be a holiday in."""
+
+    def __init__(
+        self,
+        holidays: Iterable[HolidayBase],
+        quorum: Optional[int] = None,
+        years: Optional[YearArg] = None,
+    ) -> None:
+        """
+        :param holidays:
+            The HolidayBase objects to combine.
+
+        :param quorum:
+            The number of operands a date must be a holiday in, all of them
+            if not given.
+
+        :param years:
+            The years to populate the operands for.
+        """
+        self.holidays = tuple(holidays)
+        for operand in self.holidays:
+            if not isinstance(operand, HolidayBase):
+                raise TypeError("Holiday objects can only be combined with other Holiday objects")
+
+        self.quorum = len(self.holidays) if quorum is None else quorum
+        if not 1 <= self.quorum <= len(self.holidays):
+            raise ValueError(
+                f"Quorum must be between 1 and {len(self.holidays)}, got {self.quorum}."
+            )
+
+        self._holiday_bitmaps = {}
+        self._workday_counts = {}
+        _align_years(self.holidays, years)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        dt = _to_date(key)
+        year = dt.year
+        return (
+            self._get_holiday_bitmap(year) >> (dt.toordinal() - _get_year_start_ordinal(year)) & 1
+            == 1
+        )
+
+    def __getitem__(self, key: DateLike) -> Any:
+        if isinstance(key, slice):
+            if not key.start or not key.stop:
+                raise ValueError("Both start and stop must be given.")
+
+            first, last, step = _get_slice_range(_to_date(key.start), _to_date(key.stop), key.step)
+            start_ordinal = first if step > 0 else last
+            abs_step = abs(step)
+            days_in_range = [
+                dt
+                for year in range(date.fromordinal(first).year, date.fromordinal(last).year + 1)
+                for dt in self._iter_year(year)
+                if first <= dt.toordinal() <= last
+                and (dt.toordinal() - start_ordinal) % abs_step == 0
+            ]
+            if step < 0:
+                days_in_range.reverse()
+
+            return days_in_range
+
+        dt = _to_date(key)
+        if dt not in self:
+            raise KeyError(dt)
+
+        return HOLIDAY_NAME_DELIMITER.join(_get_merged_names(self.holidays, dt))
+
+    def __iter__(self) -> Iterator[date]:
+        for year in sorted(self.years):
+            yield from self._iter_year(year)
+
+    def __len__(self) -> int:
+        return sum(bin(self._get_holiday_bitmap(year)).count("1") for year in self.years)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.holidays)!r}, quorum={self.quorum})"
+
+    def _get_holiday_bitmap(self, year: int) -> int:
+        """Return the view's holiday day-of-year bitmap for a year."""
+        if (bitmap := self._holiday_bitmaps.get(year)) is not None:
+            return bitmap
+
+        bitmaps = []
+        for operand in self.holidays:
+            if operand.expand and year not in operand.years:
+                operand._populate_year(year)
+            bitmaps.append(operand._get_holiday_bitmaps().get(year, 0))
+
+        bitmap = self._holiday_bitmaps[year] = self._get_quorum_bitmap(bitmaps, year)
+        return bitmap
+
+    def _get_quorum_bitmap(self, bitmaps: Iterable[int], year: int) -> int:
+        """Return the bitmap of the days set in at least :attr:`quorum` of
+        the operands' bitmaps."""
+        # The days set in at least `n` of the bitmaps for `n` up to the quorum.
+        counts = [(1 << (366 if isleap(year) else 365)) - 1] + [0] * self.quorum
+        for bitmap in bitmaps:
+            for n in range(self.quorum, 0, -1):
+                counts[n] |= counts[n - 1] & bitmap
+
+        return counts[-1]
+
+    def _get_workday_counts(self, year: int) -> "array[int]":
+        """Return cumulative working day counts for a year (see
+        :meth:`HolidayBase._get_workday_counts`)."""
+        if (counts := self._workday_counts.get(year)) is not None:
+            return counts
+
+        days = 366 if isleap(year) else 365
+        bitmaps = []
+        for operand in self.holidays:
+            operand_counts = operand._get_workday_counts(year)
+            bitmap = 0
+            for day in range(days):
+                if operand_counts[day + 1] == operand_counts[day]:
+                    bitmap |= 1 << day
+            bitmaps.append(bitmap)
+        closed_bitmap = self._get_quorum_bitmap(bitmaps, year)
+
+        counts = array("H", (0,))
+        total = 0
+        for day in range(days):
+            total += not closed_bitmap >> day & 1
+            counts.append(total)
+
+        self._workday_counts[year] = counts
+        return counts
+
+    def _iter_year(self, year: int) -> Iterator[date]:
+        """Iterate over the view's holidays of a year in date order."""
+        bits = self._get_holiday_bitmap(year)
+        start = _get_year_start_ordinal(year)
+        while bits:
+            low_bit = bits & -bits
+            yield date.fromordinal(start + low_bit.bit_length() - 1)
+            bits ^= low_bit
+
+    @property
+    def years(self) -> Set[int]:
+        """The years calculated by all the operands."""
+        return set().union(*(operand.years for operand in self.holidays))
+
+    def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
+        """Return the holiday name for a date if date is a holiday, else
+        default (see :meth:`HolidayBase.get`)."""
+        names = self.get_names(key)
+        return HOLIDAY_NAME_DELIMITER.join(names) if names else default
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date if date is a holiday,
+        else empty list (see :meth:`HolidayBase.get_list`)."""
+        return list(self.get_names(key))
+
+    def get_names(self, key: DateLike) -> Tuple[str, ...]:
+        """Return a tuple of all holiday names for a date if date is a holiday,
+        else empty tuple.
+
+        The names of the date in all the operands having a holiday on it are
+        merged (see :meth:`HolidayUnion.get_names`).
+        """
+        dt = _to_date(key)
+        return _get_merged_names(self.holidays, dt) if dt in self else ()
+
+    def get_nth_workday(self, key: DateLike, n: int) -> date:
+        """Return n-th working day from provided date (if n is positive)
+        or n-th working day before provided date (if n is negative)."""
+        return _get_nth_workday(self._get_workday_counts, _to_date(key), n)
+
+    def get_workdays_number(self, key1: DateLike, key2: DateLike) -> int:
+        """Return the number of working days between two dates (not including the start date)."""
+        return _get_workdays_number(self._get_workday_counts, _to_date(key1), _to_date(key2))
+
+    def is_workday(self, key: DateLike) -> bool:
+        """Return True if date is a working day, i.e., fewer than :attr:`quorum`
+        operands are closed on it."""
+        dt = _to_date(key)
+        counts = self._get_workday_counts(dt.year)
+        day = dt.toordinal() - _get_year_start_ordinal(dt.year)
+        return counts[day + 1] != counts[day]
+
+
+class FrozenHolidays(Mapping[date, str]):
+    """
+    Returns an immutable snapshot of a :class:`HolidayBase` object holidays
+    for a fixed set of years (see :meth:`HolidayBase.freeze`).
+
+    The snapshot supports the read-only part of the :class:`HolidayBase` API.
+    It never populates other years: dates outside of :attr:`years` are not
+    holidays. As it can't change it is hashable, safe to share between
+    threads and cheap to pickle: the holidays are stored as a sorted array of
+    date ordinals and a tuple of the matching names.
+    """
+
+    __slots__ = (
+        "_hash",
+        "_names",
+        "_ordinals",
+        "categories",
+        "country",
+        "language",
+        "market",
+        "observed",
+        "subdiv",
+        "weekend",
+        "weekend_workdays",
+        "years",
+    )
+
+    _hash: Optional[int]
+    _names: Tuple[str, ...]
+    _ordinals: "array[int]"
+
+    categories: FrozenSet[str]
+    """The categories of the holidays."""
+    country: Optional[str]
+    """The country's ISO 3166-1 alpha-2 code."""
+    language: Optional[str]
+    """The language the holiday names are translated to."""
+    market: Optional[str]
+    """The market's ISO 3166-1 alpha-2 code."""
+    observed: bool
+    """Whether observed holidays are included."""
+    subdiv: Optional[Union[str, Tuple[str, ...]]]
+    """The subdivision code(s)."""
+    weekend: FrozenSet[int]
+    """The weekend days."""
+    weekend_workdays: FrozenSet[date]
+    """The working days moved to weekends."""
+    years: FrozenSet[int]
+    """The years included in the snapshot."""
+
+    def __init__(self, holidays: HolidayBase, years: Optional[YearArg] = None) -> None:
+        """
+        :param holidays:
+            The :class:`HolidayBase` object to take the snapshot of.
+
+        :param years:
+            The years to include in the snapshot, populated first if needed.
+            If not given, the currently populated years are used.
+        """
+        if years is None:
+            frozen_years = frozenset(holidays.years)
+            items = sorted(dict.items(holidays))
+            weekend_workdays = frozenset(holidays.weekend_workdays)
+        else:
+            frozen_years = frozenset(_normalize_arguments(int, years))
+            populate_years = set(frozen_years)
+            if holidays.expand:
+                # Adjacent years may add holidays (e.g., observed ones) too.
+                populate_years.update(
+                    adjacent_year
+                    for year in frozen_years
+                    for adjacent_year in (year - 1, year + 1)
+                    if MINYEAR <= adjacent_year <= MAXYEAR
+                )
+            for year in sorted(populate_years):
+                if year not in holidays.years:
+                    holidays._populate_year(year)
+
+            items = sorted(
+                (dt, value) for dt, value in dict.items(holidays) if dt.year in frozen_years
+            )
+            weekend_workdays = frozenset(
+                dt for dt in holidays.weekend_workdays if dt.year in frozen_years
+            )
+
+        subdiv: Any = holidays.subdiv
+        for name, value in (
+            ("_hash", None),
+            ("_names", tuple(value for _, value in items)),
+            ("_ordinals", array("i", (dt.toordinal() for dt, _ in items))),
+            ("categories", frozenset(holidays.categories)),
+            ("country", getattr(holidays, "country", None)),
+            ("language", holidays.language),
+            ("market", getattr(holidays, "market", None)),
+            ("observed", holidays.observed),
+            ("subdiv", tuple(subdiv) if isinstance(subdiv, list) else subdiv),
+            ("weekend", frozenset(holidays.weekend)),
+            ("weekend_workdays", weekend_workdays),
+            ("years", frozen_years),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        return self._find(_to_date(key)) >= 0
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenHolidays):
+            return NotImplemented
+
+        return self.__getstate__() == other.__getstate__()
+
+    def __getitem__(self, key: DateLike) -> Any:
+        if isinstance(key, slice):
+            if not key.start or not key.stop:
+                raise ValueError("Both start and stop must be given.")
+
+            first, last, step = _get_slice_range(_to_date(key.start), _to_date(key.stop), key.step)
+            start_ordinal = first if step > 0 else last
+            abs_step = abs(step)
+            ordinals = self._ordinals
+            days_in_range = [
+                date.fromordinal(ordinal)
+                for ordinal in ordinals[
+                    bisect_left(ordinals, first) : bisect_right(ordinals, last)
+                ]
+                if (ordinal - start_ordinal) % abs_step == 0
+            ]
+            if step < 0:
+                days_in_range.reverse()
+
+            return days_in_range
+
+        dt = _to_date(key)
+        if (idx := self._find(dt)) < 0:
+            raise KeyError(dt)
+
+        return self._names[idx]
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        # All the attributes but the cached hash.
+        return tuple(getattr(self, name) for name in self.__slots__[1:])
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            names, ordinals, *attributes = self.__getstate__()
+            object.__setattr__(self, "_hash", hash((names, ordinals.tobytes(), *attributes)))
+
+        return self._hash  # type: ignore[return-value]
+
+    def __iter__(self) -> Iterator[date]:
+        return map(date.fromordinal, self._ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(zip(self, self._names))!r})"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        object.__setattr__(self, "_hash", None)
+        for name, value in zip(self.__slots__[1:], state):
+            object.__setattr__(self, name, value)
+
+    def _find(self, dt: date) -> int:
+        """Return the index of a date in the snapshot, or -1 if it's not a holiday."""
+        ordinal = dt.toordinal()
+        ordinals = self._ordinals
+        idx = bisect_left(ordinals, ordinal)
+        return idx if idx < len(ordinals) and ordinals[idx] == ordinal else -1
+
+    def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
+        """Return the holiday name for a date if date is a holiday, else
+        default (see :meth:`HolidayBase.get`)."""
+        idx = self._find(_to_date(key))
+        return self._names[idx] if idx >= 0 else default
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date if date is a holiday,
+        else empty list (see :meth:`HolidayBase.get_list`)."""
+        return list(self.get_names(key))
+
+    def get_names(self, key: DateLike) -> Tuple[str, ...]:
+        """Return a tuple of all holiday names for a date if date is a holiday,
+        else empty tuple (see :meth:`HolidayBase.get_names`)."""
+        if (idx := self._find(_to_date(key))) < 0:
+            return ()
+
+        return tuple(name for name in self._names[idx].split(HOLIDAY_NAME_DELIMITER) if name)
+
+    def is_workday(self, key: DateLike) -> bool:
+        """Return True if date is a working day (not a holiday or a weekend)."""
+        dt = _to_date(key)
+        if dt.weekday() in self.weekend:
+            return dt in self.weekend_workdays
+
+        return self._find(dt) < 0
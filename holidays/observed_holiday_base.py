@@ -11,7 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
-from typing import Dict, Optional, Tuple, Set
+from typing import Any, Dict, Optional, Sequence, Tuple, Set
 
 from holidays.calendars.gregorian import MON, TUE, WED, THU, FRI, SAT, SUN, _timedelta
 from holidays.holiday_base import DateArg, HolidayBase
@@ -109,6 +109,21 @@ class ObservedHolidayBase(HolidayBase):
         self._observed_since = observed_since
         super().__init__(*args, **kwargs)
 
+    def _get_populate_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        if (key := super()._get_populate_cache_key()) is None:
+            return None
+
+        return (*key, tuple(sorted(self._observed_rule.items())), self._observed_since)
+
+    def _get_populate_state(self) -> Tuple[Any, ...]:
+        return (*super()._get_populate_state(), tuple(sorted(self._observed_rule.items())))
+
+    def _set_populate_state(self, state: Sequence[Any]) -> None:
+        super()._set_populate_state(state)
+        observed_rule = ObservedRule(state[-1])
+        if observed_rule != self._observed_rule:
+            self._observed_rule = observed_rule
+
     def _is_observed(self, *args, **kwargs) -> bool:
         return self._observed_since is None or self._year >= self._observed_since
 
@@ -168,7 +183,7 @@ class ObservedHolidayBase(HolidayBase):
 
             estimated_label_text = estimated_label.strip("%s ()")
             # Use observed_estimated_label instead of observed_label for estimated dates.
-            for name in (name,) if name else self.get_list(dt):
+            for name in (name,) if name else self.get_names(dt):
                 holiday_name = self.tr(name)
                 observed_estimated_label = None
                 if len(estimated_label_text) > 0 and estimated_label_text in holiday_name:
@@ -179,7 +194,7 @@ class ObservedHolidayBase(HolidayBase):
                     (observed_estimated_label or observed_label) % holiday_name, dt_observed
                 )
         else:
-            for name in (name,) if name else self.get_list(dt):
+            for name in (name,) if name else self.get_names(dt):
                 super()._add_holiday(name, dt_observed)
 
         return True, dt_observed
@@ -202,7 +217,7 @@ class ObservedHolidayBase(HolidayBase):
             if not self._is_observed(dt):
                 continue
             if multiple:
-                for name in self.get_list(dt):
+                for name in self.get_names(dt):
                     self._add_observed(dt, name)
             else:
                 self._add_observed(dt)
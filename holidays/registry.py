@@ -180,6 +180,16 @@ FINANCIAL: RegistryDict = {
     "ny_stock_exchange": ("NewYorkStockExchange", "NYSE", "XNYS"),
 }
 
+# The entity name to the entity module name mapping used for the `holidays`
+# package attributes lazy loading. The aliases are defined as subclasses
+# in the entity modules, so the entity name is also its module attribute name.
+ENTITY_MODULES: Dict[str, str] = {
+    entity: f"holidays.{prefix}.{module}"
+    for prefix, entity_mapping in (("countries", COUNTRIES), ("financial", FINANCIAL))
+    for module, entities in entity_mapping.items()
+    for entity in entities
+}
+
 # A re-entrant lock. Once a thread has acquired a re-entrant lock,
 # the same thread may acquire it again without blocking.
 # https://docs.python.org/3/library/threading.html#rlock-objects
@@ -0,0 +1,250 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("IndexEntry", "ReverseIndex")
+
+import json
+from datetime import date
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from holidays.holiday_base import DateLike, HolidayBase, YearArg, _to_date
+from holidays.helpers import _normalize_arguments
+from holidays.registry import EntityLoader
+
+
+class IndexEntry(NamedTuple):
+    """An entity, subdivision and holiday category combination."""
+
+    code: str
+    """The country or market code."""
+    subdiv: Optional[str]
+    """The subdivision code or None for the entity-wide holidays."""
+    category: str
+    """The holiday category."""
+
+
+def _iter_entities(
+    years: Iterable[int],
+    countries: Optional[Iterable[str]] = None,
+    markets: Optional[Iterable[str]] = None,
+    language: Optional[str] = None,
+) -> Iterator[Tuple[IndexEntry, HolidayBase]]:
+    """Iterate over the registered entities' holidays for the years.
+
+    Every entity is populated for each of its subdivisions (and once for its
+    entity-wide holidays) and each of its supported categories, the same way
+    the holiday snapshots are generated.
+
+    :param years:
+        The years to populate.
+
+    :param countries:
+        The country codes to use, all supported countries by default.
+
+    :param markets:
+        The market codes to use, all supported markets by default.
+
+    :param language:
+        The language of the holiday names, the entities' default by default.
+
+    :return:
+        An iterator of :class:`IndexEntry` and holidays object pairs.
+    """
+    # Imported here to avoid a circular import.
+    import holidays
+
+    codes: List[str] = []
+    for entity_codes, supported_codes in (
+        (countries, EntityLoader.get_country_codes(include_aliases=False)),
+        (markets, EntityLoader.get_financial_codes(include_aliases=False)),
+    ):
+        supported = set(supported_codes)
+        entity_codes = supported if entity_codes is None else list(entity_codes)
+        if unknown_codes := set(entity_codes).difference(supported):
+            raise ValueError(f"Entities {', '.join(sorted(unknown_codes))} not available")
+        codes.extend(sorted(entity_codes))
+
+    years = tuple(years)
+    for code in codes:
+        entity_cls = getattr(holidays, code)
+        for subdiv in (None, *entity_cls.subdivisions):
+            for category in entity_cls.supported_categories:
+                yield (
+                    IndexEntry(code, subdiv, category),
+                    entity_cls(
+                        subdiv=subdiv, years=years, categories=(category,), language=language
+                    ),
+                )
+
+
+class ReverseIndex:
+    """
+    A date to entities index answering which countries and markets (and their
+    subdivisions and holiday categories) have a holiday on a given date.
+
+    The index is built once for a range of years from all the registered
+    entities (see :meth:`build`), can be saved to and loaded from a JSON file
+    and answers each date with a single dictionary lookup.
+    """
+
+    entries: Dict[date, FrozenSet[IndexEntry]]
+    """The index entries by date."""
+    years: Tuple[int, int]
+    """The first and the last year indexed."""
+
+    def __init__(self, entries: Dict[date, FrozenSet[IndexEntry]], years: Tuple[int, int]) -> None:
+        """
+        :param entries:
+            The index entries by date.
+
+        :param years:
+            The first and the last year indexed.
+        """
+        self.entries = entries
+        self.years = years
+
+    def __contains__(self, key: DateLike) -> bool:
+        return _to_date(key) in self.entries
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ReverseIndex):
+            return NotImplemented
+
+        return self.years == other.years and self.entries == other.entries
+
+    def __getitem__(self, key: DateLike) -> FrozenSet[IndexEntry]:
+        return self.get(key)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"ReverseIndex(years={self.years}, dates={len(self.entries)})"
+
+    def _get_date(self, key: DateLike) -> date:
+        dt = _to_date(key)
+        if not self.years[0] <= dt.year <= self.years[1]:
+            raise KeyError(f"Date out of the index range: {dt}.")
+
+        return dt
+
+    @classmethod
+    def build(
+        cls,
+        years: YearArg,
+        countries: Optional[Iterable[str]] = None,
+        markets: Optional[Iterable[str]] = None,
+    ) -> "ReverseIndex":
+        """Build the index from the registered entities.
+
+        Every entity is indexed for each of its subdivisions (and once for its
+        entity-wide holidays) and each of its supported categories.
+
+        :param years:
+            The years to index. The index spans from the first to the last
+            of them.
+
+        :param countries:
+            The country codes to index, all supported countries by default.
+
+        :param markets:
+            The market codes to index, all supported markets by default.
+
+        :return:
+            A :class:`ReverseIndex` object.
+        """
+        years_set = _normalize_arguments(int, years)
+        if not years_set:
+            raise ValueError("At least one year must be given.")
+        first_year, last_year = min(years_set), max(years_set)
+
+        index: Dict[date, set] = {}
+        for entry, holidays in _iter_entities(
+            range(first_year, last_year + 1), countries=countries, markets=markets
+        ):
+            for dt in holidays:
+                if first_year <= dt.year <= last_year:
+                    index.setdefault(dt, set()).add(entry)
+
+        return cls(
+            {dt: frozenset(entries) for dt, entries in sorted(index.items())},
+            (first_year, last_year),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ReverseIndex":
+        """Load the index from a file created by :meth:`save`."""
+        with open(path, encoding="utf-8") as index_file:
+            data = json.load(index_file)
+
+        entries = [IndexEntry(*entry) for entry in data["entries"]]
+        return cls(
+            {
+                date.fromisoformat(dt): frozenset(entries[idx] for idx in entry_ids)
+                for dt, entry_ids in data["dates"].items()
+            },
+            tuple(data["years"]),  # type: ignore[arg-type]
+        )
+
+    def get(self, key: DateLike) -> FrozenSet[IndexEntry]:
+        """Return the index entries having a holiday on the date.
+
+        :param key:
+            The date expressed in any form supported by :class:`HolidayBase`.
+
+        :return:
+            A frozenset of :class:`IndexEntry` objects, empty if no indexed
+            entity has a holiday on the date.
+        """
+        return self.entries.get(self._get_date(key), frozenset())
+
+    def get_codes(self, key: DateLike, category: Optional[str] = None) -> FrozenSet[str]:
+        """Return the codes of the entities having a holiday on the date.
+
+        :param key:
+            The date expressed in any form supported by :class:`HolidayBase`.
+
+        :param category:
+            The holiday category to look for, any category by default.
+
+        :return:
+            A frozenset of the entity codes, with the subdivision code
+            appended (e.g., ``US-CA``) for subdivision-specific entries.
+        """
+        return frozenset(
+            f"{entry.code}-{entry.subdiv}" if entry.subdiv else entry.code
+            for entry in self.get(key)
+            if category is None or entry.category == category
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the index to a JSON file.
+
+        The distinct entries are stored once and referred to by their
+        position from the dates.
+        """
+        entries = sorted(
+            {entry for date_entries in self.entries.values() for entry in date_entries},
+            key=lambda entry: (entry.code, entry.subdiv or "", entry.category),
+        )
+        entry_ids = {entry: idx for idx, entry in enumerate(entries)}
+        data = {
+            "years": list(self.years),
+            "entries": [list(entry) for entry in entries],
+            "dates": {
+                dt.isoformat(): sorted(entry_ids[entry] for entry in date_entries)
+                for dt, date_entries in self.entries.items()
+            },
+        }
+        with open(path, "w", encoding="utf-8") as index_file:
+            json.dump(data, index_file, separators=(",", ":"))
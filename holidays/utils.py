@@ -13,20 +13,38 @@
 __all__ = (
     "country_holidays",
     "CountryHoliday",
+    "clear_populate_cache",
+    "closed_count",
+    "disable_parse_cache",
+    "disable_populate_cache",
+    "enable_parse_cache",
+    "enable_populate_cache",
     "financial_holidays",
+    "get_parse_cache_info",
+    "get_populate_cache_info",
+    "intersection",
     "list_localized_countries",
     "list_localized_financial",
     "list_supported_countries",
     "list_supported_financial",
+    "matrix",
+    "union",
 )
 
+import os
+import sys
 import warnings
 from functools import lru_cache
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 
-from holidays.holiday_base import HolidayBase
+from holidays import holiday_base
+from holidays.holiday_base import HolidayBase, HolidayQuorum, HolidayUnion, YearCacheInfo
 from holidays.registry import EntityLoader
 
+if TYPE_CHECKING:
+    from holidays.vectorized import HolidayMatrix
+
 
 def country_holidays(
     country: str,
@@ -38,6 +56,8 @@ def country_holidays(
     state: Optional[str] = None,
     language: Optional[str] = None,
     categories: Optional[Tuple[str]] = None,
+    max_years: Optional[int] = None,
+    thread_safe: bool = False,
 ) -> HolidayBase:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
@@ -72,11 +92,21 @@ def country_holidays(
         The language which the returned holiday names will be translated
         into. It must be an ISO 639-1 (2-letter) language code. If the
         language translation is not supported the original holiday names
-        will be used.
+        will be used. The language is matched case-insensitively (e.g.,
+        "en_us" is the same as "en_US").
 
     :param categories:
         Requested holiday categories.
 
+    :param max_years:
+        The maximum number of populated years to keep, the least recently
+        used years are evicted and populated again on demand.
+
+    :param thread_safe:
+        Whether years are populated under a lock for objects shared between
+        threads, lookups of already populated years stay lock-free.
+        Can't be combined with max_years.
+
     :return:
         A :py:class:`HolidayBase` object matching the **country**.
 
@@ -194,6 +224,8 @@ def country_holidays(
             state=state,
             language=language,
             categories=categories,
+            max_years=max_years,
+            thread_safe=thread_safe,
         )
     except AttributeError:
         raise NotImplementedError(f"Country {country} not available")
@@ -206,6 +238,8 @@ def financial_holidays(
     expand: bool = True,
     observed: bool = True,
     language: Optional[str] = None,
+    max_years: Optional[int] = None,
+    thread_safe: bool = False,
 ) -> HolidayBase:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
@@ -234,7 +268,17 @@ def financial_holidays(
         The language which the returned holiday names will be translated
         into. It must be an ISO 639-1 (2-letter) language code. If the
         language translation is not supported the original holiday names
-        will be used.
+        will be used. The language is matched case-insensitively (e.g.,
+        "en_us" is the same as "en_US").
+
+    :param max_years:
+        The maximum number of populated years to keep, the least recently
+        used years are evicted and populated again on demand.
+
+    :param thread_safe:
+        Whether years are populated under a lock for objects shared between
+        threads, lookups of already populated years stay lock-free.
+        Can't be combined with max_years.
 
     :return:
         A :py:class:`HolidayBase` object matching the **market**.
@@ -256,6 +300,8 @@ def financial_holidays(
             expand=expand,
             observed=observed,
             language=language,
+            max_years=max_years,
+            thread_safe=thread_safe,
         )
     except AttributeError:
         raise NotImplementedError(f"Financial market {market} not available")
@@ -282,6 +328,126 @@ def CountryHoliday(  # noqa: N802
     return country_holidays(country, subdiv, years, expand, observed, prov, state)
 
 
+def enable_parse_cache(maxsize: int = 1024) -> None:
+    """
+    Enable a bounded LRU cache of date strings parsed by holidays objects.
+
+    Useful when the same date strings are looked up repeatedly. The cache is
+    shared by all holidays objects and replaced on every call.
+
+    :param maxsize:
+        The maximum number of parsed date strings to keep.
+    """
+    holiday_base._parse_date = lru_cache(maxsize=maxsize)(holiday_base._parse_date_string)
+
+
+def disable_parse_cache() -> None:
+    """
+    Disable the date string parse cache and drop its content.
+    """
+    holiday_base._parse_date = holiday_base._parse_date_string
+
+
+def get_parse_cache_info():
+    """
+    Get the date string parse cache statistics.
+
+    :return:
+        A named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``
+        or None if the parse cache is not enabled.
+    """
+    parse_date = holiday_base._parse_date
+    return parse_date.cache_info() if hasattr(parse_date, "cache_info") else None
+
+
+def enable_populate_cache(
+    maxsize: int = 1024, persistent: bool = False, path: Optional[Union[str, Path]] = None
+) -> None:
+    """
+    Enable a bounded LRU cache of populated years shared by all holidays
+    objects of the process.
+
+    Each year's holidays are then computed once per entity class, subdivision,
+    categories, observed and holiday names language combination (and other entity specific
+    options). New objects, as well as expansions of existing ones, copy the
+    cached results instead of populating the year again. The cache is replaced
+    on every call.
+
+    Custom entity classes whose holidays depend on anything else (e.g., on the
+    other populated years) shouldn't be used with the cache enabled.
+
+    If persistent, the populated years are also stored in a SQLite database
+    file shared by all the processes using it, so that short-lived processes
+    load the years populated by the previous ones instead of populating them
+    again. The years are stored per package version, a file per version by
+    default. Only the supported entities' years are stored, not the custom
+    entity classes' ones.
+
+    :param maxsize:
+        The maximum number of populated years to keep in memory.
+
+    :param persistent:
+        Whether to store the populated years in the database file.
+
+    :param path:
+        The database file path, ``holidays/populate_cache-<version>.sqlite3``
+        in the user cache directory by default.
+    """
+    store = None
+    if persistent:
+        # Imported here to avoid a circular import.
+        from holidays import __version__
+
+        store = holiday_base._PopulateCacheStore(
+            Path(path)
+            if path is not None
+            else _get_cache_dir() / f"populate_cache-{__version__}.sqlite3",
+            __version__,
+        )
+    holiday_base._populate_cache = holiday_base._PopulateCache(maxsize, store)
+
+
+def disable_populate_cache() -> None:
+    """
+    Disable the populate cache and drop its content.
+    """
+    holiday_base._populate_cache = None
+
+
+def clear_populate_cache() -> None:
+    """
+    Drop the populate cache content (including the persistent one) and reset
+    its statistics.
+    """
+    if (populate_cache := holiday_base._populate_cache) is not None:
+        populate_cache.clear()
+
+
+def get_populate_cache_info() -> Optional[YearCacheInfo]:
+    """
+    Get the populate cache statistics.
+
+    :return:
+        A named tuple of ``hits``, ``misses``, ``evictions``, ``maxsize`` and
+        ``currsize`` or None if the populate cache is not enabled.
+    """
+    populate_cache = holiday_base._populate_cache
+    return populate_cache.info() if populate_cache is not None else None
+
+
+def _get_cache_dir() -> Path:
+    """Return the package directory in the platform-specific user cache
+    directory."""
+    if sys.platform == "win32":
+        cache_dir = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        cache_dir = Path.home() / "Library" / "Caches"
+    else:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+    return cache_dir / "holidays"
+
+
 def _list_localized_entities(entity_codes: Iterable[str]) -> Dict[str, List[str]]:
     """
     Get all localized entities and languages they support.
@@ -386,3 +552,141 @@ def list_supported_financial(include_aliases=True) -> Dict[str, List[str]]:
         supported subdivision codes.
     """
     return _list_supported_entities(EntityLoader.get_financial_codes(include_aliases))
+
+
+def union(
+    holidays: Iterable[HolidayBase],
+    years: Optional[Union[int, Iterable[int]]] = None,
+) -> HolidayUnion:
+    """
+    Join any number of holidays objects into a single read-only view.
+
+    Unlike adding the objects together (``h1 + h2 + ...``), which builds a
+    :class:`HolidaySum` for every addition and copies all holidays of its
+    operands each time, the view is built in one pass and answers membership
+    from the operands themselves. The holiday names of dates shared by
+    several operands are merged only when requested.
+
+    :param holidays:
+        The holidays objects to join.
+
+    :param years:
+        The years to populate the holidays objects for.
+
+    :return:
+        A :class:`HolidayUnion` object.
+
+    Example:
+
+    >>> from holidays import country_holidays, union
+    >>> eu_holidays = union(
+    ...     (country_holidays(code) for code in ("AT", "BE", "DE")), years=2024
+    ... )
+    >>> "2024-10-03" in eu_holidays
+    True
+    >>> eu_holidays.get_list("2024-05-01")
+    ['Dag van de Arbeid', 'Erster Mai', 'Staatsfeiertag']
+    """
+    return HolidayUnion(holidays, years)
+
+
+def intersection(
+    holidays: Iterable[HolidayBase],
+    years: Optional[Union[int, Iterable[int]]] = None,
+) -> HolidayQuorum:
+    """
+    Get a read-only view of the dates that are holidays in all the holidays
+    objects.
+
+    The view supports membership tests, slices and working day arithmetic:
+    a date is a working day unless all the objects are closed on it.
+
+    :param holidays:
+        The holidays objects to intersect.
+
+    :param years:
+        The years to populate the holidays objects for.
+
+    :return:
+        A :class:`HolidayQuorum` object.
+
+    Example:
+
+    >>> from holidays import financial_holidays, intersection
+    >>> closed = intersection(
+    ...     (financial_holidays("ECB"), financial_holidays("NYSE")), years=2024
+    ... )
+    >>> "2024-12-25" in closed
+    True
+    >>> closed.is_workday("2024-11-28")
+    True
+    """
+    return HolidayQuorum(holidays, years=years)
+
+
+def closed_count(
+    holidays: Iterable[HolidayBase],
+    count: int,
+    years: Optional[Union[int, Iterable[int]]] = None,
+) -> HolidayQuorum:
+    """
+    Get a read-only view of the dates that are holidays in at least **count**
+    of the holidays objects.
+
+    The view supports membership tests, slices and working day arithmetic:
+    a date is a working day unless at least **count** of the objects are
+    closed on it.
+
+    :param holidays:
+        The holidays objects to combine.
+
+    :param count:
+        The number of objects a date must be a holiday in.
+
+    :param years:
+        The years to populate the holidays objects for.
+
+    :return:
+        A :class:`HolidayQuorum` object.
+    """
+    return HolidayQuorum(holidays, count, years)
+
+
+def matrix(
+    entities: Iterable[Union[str, HolidayBase]],
+    years: Union[int, Iterable[int]],
+    workers: Optional[int] = None,
+) -> "HolidayMatrix":
+    """
+    Get a compact entities by days matrix of holidays and working days.
+
+    Each entity is populated and dropped right away, keeping only its bitsets
+    (one bit per day), so many entities over many years fit in a few
+    megabytes. NumPy is imported only when this function is used.
+
+    :param entities:
+        Country codes or holidays objects.
+
+    :param years:
+        The years to cover. The matrix spans from the first to the last of
+        them.
+
+    :param workers:
+        The number of processes to populate the entities in. By default, the
+        entities are populated one by one in the current process.
+
+    :return:
+        A :class:`holidays.vectorized.HolidayMatrix` object.
+
+    Example:
+
+    >>> from holidays import matrix
+    >>> m = matrix(("DE", "FR", "US"), years=range(2020, 2030))
+    >>> m.get_off("2024-07-04")
+    ['US']
+    >>> m.first_common_workday("2024-12-25")
+    datetime.date(2024, 12, 27)
+    """
+    from holidays.vectorized import HolidayMatrix
+
+    return HolidayMatrix(entities, years, workers)
@@ -0,0 +1,375 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("HolidayMatrix", "holiday_mask", "workday_mask")
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import MAXYEAR, MINYEAR, date
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import DateLike, HolidayBase, YearArg, _to_date
+
+# The proleptic Gregorian ordinal of the NumPy datetime64 epoch (1970-01-01).
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def _to_ordinals(holidays: HolidayBase, keys: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert a batch of dates to proleptic Gregorian ordinals.
+
+    :param holidays:
+        The holidays object used for converting keys NumPy can't handle.
+
+    :param keys:
+        An array-like of :class:`datetime.date` / :class:`datetime.datetime`
+        objects, ``datetime64`` values (e.g. a pandas ``Series``) or any other
+        keys supported by :class:`HolidayBase`. Numbers are POSIX timestamps
+        regardless of the array type, the same as for :class:`HolidayBase`.
+
+    :return:
+        A tuple of an ``int64`` array of ordinals and a boolean array marking
+        valid (non ``NaT``) items, both shaped as **keys**.
+    """
+    values = np.asarray(keys)
+
+    if values.dtype.kind in "iu":
+        # The UTC dates of POSIX timestamps, the same way HolidayBase converts
+        # the integer keys.
+        ordinals = np.floor_divide(values, SECONDS_PER_DAY).astype(np.int64) + EPOCH_ORDINAL
+        if ordinals.size and (
+            ordinals.min() < date.min.toordinal() or ordinals.max() > date.max.toordinal()
+        ):
+            raise ValueError("Timestamp out of the supported dates range.")
+        return ordinals, np.ones(values.shape, dtype=bool)
+
+    if values.dtype.kind == "M":
+        valid = ~np.isnat(values)
+        ordinals = values.astype("datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+        ordinals[~valid] = EPOCH_ORDINAL
+        return ordinals, valid
+
+    # Python objects (dates, datetimes, strings, timestamps) are converted the
+    # same way HolidayBase converts its keys.
+    keytransform = holidays.__keytransform__
+    ordinals = np.fromiter(
+        (
+            key.toordinal() if type(key) is date else keytransform(key).toordinal()
+            for key in values.flat
+        ),
+        dtype=np.int64,
+        count=values.size,
+    ).reshape(values.shape)
+
+    return ordinals, np.ones(values.shape, dtype=bool)
+
+
+def _ordinals_to_years(ordinals: np.ndarray) -> np.ndarray:
+    """Return the calendar years of the ordinals."""
+    return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[Y]").astype(
+        np.int64
+    ) + 1970
+
+
+def _populate_years(holidays: HolidayBase, ordinals: np.ndarray) -> None:
+    """Populate all distinct years of the ordinals (for `expand=True` objects)."""
+    if not holidays.expand or ordinals.size == 0:
+        return None
+
+    years = np.unique(_ordinals_to_years(ordinals))
+    for year in years.tolist():
+        if MINYEAR <= year <= MAXYEAR and year not in holidays.years:
+            holidays._populate_year(year)
+
+
+def _isin_range(ordinals: np.ndarray, member_ordinals: Iterable[int]) -> np.ndarray:
+    """Return a boolean mask of ordinals found among the member ordinals.
+
+    The lookup is done against a dense table covering the range of the
+    ordinals, so the cost is linear in the sizes of both inputs.
+    """
+    min_ordinal = int(ordinals.min())
+    max_ordinal = int(ordinals.max())
+    members = np.fromiter(member_ordinals, dtype=np.int64)
+    members = members[(members >= min_ordinal) & (members <= max_ordinal)]
+
+    table = np.zeros(max_ordinal - min_ordinal + 1, dtype=bool)
+    table[members - min_ordinal] = True
+
+    return table[ordinals - min_ordinal]
+
+
+def holiday_mask(holidays: HolidayBase, keys: Any) -> np.ndarray:
+    """Return a boolean mask marking which of the dates are holidays.
+
+    All distinct years of **keys** are populated up front (unless the object was
+    created with ``expand=False``), then membership of every date is resolved in
+    a single vectorized lookup against a dense table of the holidays found
+    within the range of the requested dates.
+
+    :param holidays:
+        The holidays object to check the dates against.
+
+    :param keys:
+        An array-like of :class:`datetime.date` / :class:`datetime.datetime`
+        objects, ``datetime64`` values (e.g. a pandas ``Series``), POSIX
+        timestamps or any other keys supported by
+        :class:`HolidayBase`.
+
+    :return:
+        A boolean :class:`numpy.ndarray` shaped as **keys**. ``NaT`` values are
+        never holidays.
+    """
+    ordinals, valid = _to_ordinals(holidays, keys)
+    mask = np.zeros(ordinals.shape, dtype=bool)
+    if not valid.any():
+        return mask
+
+    valid_ordinals = ordinals[valid]
+    _populate_years(holidays, valid_ordinals)
+    with holidays._get_populate_lock():
+        mask[valid] = _isin_range(valid_ordinals, (dt.toordinal() for dt in dict.keys(holidays)))
+
+    return mask
+
+
+def workday_mask(holidays: HolidayBase, keys: Any) -> np.ndarray:
+    """Return a boolean mask marking which of the dates are working days.
+
+    This is a vectorized version of :meth:`HolidayBase.is_workday`: a weekend
+    date (according to the entity's ``weekend``) is a working day only if it is
+    listed in ``weekend_workdays`` (e.g. a substituted make-up day), any other
+    date is a working day unless it is a holiday.
+
+    :param holidays:
+        The holidays object to check the dates against.
+
+    :param keys:
+        The dates in any form supported by :func:`holiday_mask`.
+
+    :return:
+        A boolean :class:`numpy.ndarray` shaped as **keys**. ``NaT`` values are
+        never working days.
+    """
+    ordinals, valid = _to_ordinals(holidays, keys)
+    mask = np.zeros(ordinals.shape, dtype=bool)
+    if not valid.any():
+        return mask
+
+    valid_ordinals = ordinals[valid]
+    _populate_years(holidays, valid_ordinals)
+
+    # The same formula as date.weekday() uses: the ordinal 1 is a Monday.
+    is_weekend = np.isin((valid_ordinals + 6) % 7, list(holidays.weekend))
+    with holidays._get_populate_lock():
+        is_holiday = _isin_range(valid_ordinals, (dt.toordinal() for dt in dict.keys(holidays)))
+        weekend_workday_ordinals = [dt.toordinal() for dt in holidays.weekend_workdays]
+        # The following years not populated yet may move working days to the
+        # end of the years, the same way HolidayBase.is_workday finds them.
+        for year in np.unique(_ordinals_to_years(valid_ordinals)).tolist():
+            _, following_weekend_workdays = holidays._get_following_year_days(year)
+            weekend_workday_ordinals.extend(dt.toordinal() for dt in following_weekend_workdays)
+        is_weekend_workday = _isin_range(valid_ordinals, weekend_workday_ordinals)
+    mask[valid] = np.where(is_weekend, is_weekend_workday, ~is_holiday)
+
+    return mask
+
+
+def _get_entity_bitsets(
+    entity: Union[str, HolidayBase], years: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return an entity's packed holidays and working days bitsets.
+
+    The entity is created (or copied), populated and dropped right away, so
+    only its bitsets are kept. This runs in the worker processes too.
+
+    :param entity:
+        A country code or a holidays object.
+
+    :param years:
+        The first and the last year to cover.
+
+    :return:
+        A tuple of the holidays and the working days ``uint8`` arrays packed
+        with :func:`numpy.packbits`, one bit per day.
+    """
+    # Imported here to avoid a circular import.
+    from holidays.utils import country_holidays
+
+    first_year, last_year = years
+    if isinstance(entity, str):
+        holidays = country_holidays(entity, years=range(first_year, last_year + 1))
+    else:
+        holidays = entity.copy()
+        # Not to be shared by the shallow copy.
+        holidays.weekend_workdays = set(entity.weekend_workdays)
+        holidays.years = set(entity.years)
+        for year in range(first_year, last_year + 1):
+            if year not in holidays.years:
+                holidays._populate_year(year)
+
+    dates = np.arange(
+        np.datetime64(date(first_year, 1, 1), "D"),
+        np.datetime64(date(last_year, 12, 31), "D") + np.timedelta64(1, "D"),
+    )
+    return (
+        np.packbits(holiday_mask(holidays, dates)),
+        np.packbits(workday_mask(holidays, dates)),
+    )
+
+
+class HolidayMatrix:
+    """A compact entities by days matrix of holidays and working days.
+
+    Each entity's holidays and working days over a span of years are kept as
+    bitsets (one bit per day, the days being the columns), so questions about
+    all the entities at once (which of them are off on a date, how many are
+    off each day, when do all of them work again) are answered with NumPy
+    operations over the whole matrix.
+    """
+
+    entities: Tuple[str, ...]
+    """The entity labels in the matrix rows order."""
+    index: Dict[str, int]
+    """The entity labels to matrix rows mapping."""
+    start: date
+    """The first day of the matrix."""
+    end: date
+    """The last day of the matrix."""
+
+    def __init__(
+        self,
+        entities: Iterable[Union[str, HolidayBase]],
+        years: YearArg,
+        workers: Optional[int] = None,
+    ) -> None:
+        """
+        :param entities:
+            Country codes or holidays objects. The objects are copied and not
+            modified.
+
+        :param years:
+            The years to cover. The matrix spans from the first to the last
+            of them.
+
+        :param workers:
+            The number of processes to populate the entities in. By default,
+            the entities are populated one by one in the current process.
+        """
+        entities = tuple(entities)
+        years_set = _normalize_arguments(int, years)
+        if not years_set:
+            raise ValueError("At least one year must be given.")
+        first_year, last_year = min(years_set), max(years_set)
+
+        self.entities = tuple(
+            entity
+            if isinstance(entity, str)
+            else "-".join(filter(None, (entity._entity_code, entity.subdiv)))
+            for entity in entities
+        )
+        self.index = {entity: idx for idx, entity in enumerate(self.entities)}
+        self.start = date(first_year, 1, 1)
+        self.end = date(last_year, 12, 31)
+
+        span = ((first_year, last_year),) * len(entities)
+        if workers is not None and workers > 1 and len(entities) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                bitsets = list(
+                    executor.map(
+                        _get_entity_bitsets,
+                        entities,
+                        span,
+                        chunksize=max(1, len(entities) // (workers * 4)),
+                    )
+                )
+        else:
+            bitsets = list(map(_get_entity_bitsets, entities, span))
+
+        days = self.end.toordinal() - self.start.toordinal() + 1
+        row_size = (days + 7) // 8
+        self._holidays = np.zeros((len(entities), row_size), dtype=np.uint8)
+        self._workdays = np.zeros((len(entities), row_size), dtype=np.uint8)
+        for idx, (holidays, workdays) in enumerate(bitsets):
+            self._holidays[idx] = holidays
+            self._workdays[idx] = workdays
+        self._days = days
+
+    def __repr__(self) -> str:
+        return f"HolidayMatrix({list(self.entities)!r}, {self.start}, {self.end})"
+
+    def _get_day(self, key: DateLike) -> int:
+        """Return the column of a date."""
+        dt = _to_date(key)
+        day = dt.toordinal() - self.start.toordinal()
+        if not 0 <= day < self._days:
+            raise KeyError(f"Date out of the matrix range: {dt}.")
+
+        return day
+
+    def _get_column(self, bitsets: np.ndarray, key: DateLike) -> np.ndarray:
+        """Return the entities' bits of a date as a boolean array."""
+        day = self._get_day(key)
+        return (bitsets[:, day >> 3] >> (7 - (day & 7)) & 1).astype(bool)
+
+    @property
+    def dates(self) -> np.ndarray:
+        """The ``datetime64[D]`` dates of the matrix columns."""
+        return np.arange(
+            np.datetime64(self.start, "D"), np.datetime64(self.end, "D") + np.timedelta64(1, "D")
+        )
+
+    @property
+    def holidays(self) -> np.ndarray:
+        """The entities by days boolean matrix of holidays."""
+        return np.unpackbits(self._holidays, axis=1, count=self._days).astype(bool)
+
+    @property
+    def workdays(self) -> np.ndarray:
+        """The entities by days boolean matrix of working days."""
+        return np.unpackbits(self._workdays, axis=1, count=self._days).astype(bool)
+
+    def first_common_workday(self, key: DateLike) -> Optional[date]:
+        """Return the first date starting from the given one that is a
+        working day for all the entities, or None if there is none in the
+        matrix."""
+        day = self._get_day(key)
+        common = np.unpackbits(
+            np.bitwise_and.reduce(self._workdays, axis=0), count=self._days
+        ).astype(bool)
+        days = np.flatnonzero(common[day:])
+        return date.fromordinal(self.start.toordinal() + day + int(days[0])) if days.size else None
+
+    def get_holiday_counts(self) -> np.ndarray:
+        """Return the numbers of entities having a holiday for every day."""
+        return np.unpackbits(self._holidays, axis=1, count=self._days).sum(axis=0)
+
+    def get_off(self, key: DateLike) -> List[str]:
+        """Return the entities not working (having a holiday or a weekend
+        day) on a date."""
+        return [self.entities[idx] for idx in np.flatnonzero(self.is_off(key))]
+
+    def get_off_counts(self) -> np.ndarray:
+        """Return the numbers of entities not working for every day."""
+        return len(self.entities) - np.unpackbits(self._workdays, axis=1, count=self._days).sum(
+            axis=0
+        )
+
+    def is_holiday(self, key: DateLike) -> np.ndarray:
+        """Return a boolean array marking the entities having a holiday on a date."""
+        return self._get_column(self._holidays, key)
+
+    def is_off(self, key: DateLike) -> np.ndarray:
+        """Return a boolean array marking the entities not working on a date."""
+        return ~self._get_column(self._workdays, key)
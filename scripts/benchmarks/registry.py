@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import subprocess
+import sys
+import timeit
+import warnings
+from pathlib import Path
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+import holidays  # noqa: E402
+from holidays.registry import ENTITY_MODULES, EntityLoader  # noqa: E402
+
+IMPORT_SCRIPT = (
+    "import time; start = time.perf_counter(); import holidays; "
+    "print(time.perf_counter() - start)"
+)
+
+
+class RegistryBenchmark:
+    """Compares the package attributes lazy loading with the loader objects."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-c", "--country", default="US", help="Country code to benchmark", type=str
+        )
+        arg_parser.add_argument(
+            "-r", "--repeat", default=10, help="Number of the imports to time", type=int
+        )
+        self.args = arg_parser.parse_args()
+
+    def run(self):
+        """Runs the benchmark and prints the results."""
+        import_times = [
+            float(
+                subprocess.run(
+                    (sys.executable, "-W", "ignore", "-c", IMPORT_SCRIPT),
+                    capture_output=True,
+                    check=True,
+                    cwd=Path.cwd(),
+                    text=True,
+                ).stdout
+            )
+            for _ in range(self.args.repeat)
+        ]
+        print(f"import holidays: {min(import_times) * 1000:.1f}ms")
+
+        loader_start = timeit.default_timer()
+        for prefix, entity_mapping in (("countries", {}), ("financial", {})):
+            EntityLoader.load(prefix, entity_mapping)
+        print(
+            f"EntityLoader.load: {(timeit.default_timer() - loader_start) * 1000:.3f}ms "
+            f"for {len(ENTITY_MODULES)} entities"
+        )
+
+        code = self.args.country
+        loader = EntityLoader(f"{ENTITY_MODULES[code]}.{code}")
+        first_access_start = timeit.default_timer()
+        getattr(holidays, code)
+        print(
+            f"first holidays.{code} access: "
+            f"{(timeit.default_timer() - first_access_start) * 1000:.3f}ms"
+        )
+
+        number = 1_000_000
+        for name, statement in (
+            (f"holidays.{code}", lambda: getattr(holidays, code)),
+            ("EntityLoader(...).subdivisions", lambda: loader.subdivisions),
+            (f"holidays.{code}.subdivisions", lambda: getattr(holidays, code).subdivisions),
+        ):
+            access_time = min(timeit.repeat(statement, number=number, repeat=3))
+            print(f"{name}: {access_time / number * 1e9:.1f}ns")
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    RegistryBenchmark().run()
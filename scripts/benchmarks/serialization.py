@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import pickle
+import sys
+import timeit
+import warnings
+from pathlib import Path
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+from holidays import country_holidays  # noqa: E402
+from holidays.holiday_base import HolidayBase  # noqa: E402
+
+
+def dumps_legacy(holidays):
+    """The dictionary and instance state pickling the compact format replaced."""
+    return pickle.dumps((dict(holidays), {**holidays.__getstate__(), "tr": holidays.tr}))
+
+
+class SerializationBenchmark:
+    """Compares the compact serialization with the legacy pickling."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-c", "--country", default="US", help="Country code to benchmark", type=str
+        )
+        arg_parser.add_argument(
+            "-l", "--language", default=None, help="Language to benchmark", type=str
+        )
+        arg_parser.add_argument(
+            "-y",
+            "--years",
+            default=(1950, 2050),
+            help="The first and the last year to populate",
+            nargs=2,
+            type=int,
+        )
+        self.args = arg_parser.parse_args()
+
+    def run(self):
+        """Runs the benchmark and prints the results."""
+        first_year, last_year = self.args.years
+        instance = country_holidays(
+            self.args.country,
+            language=self.args.language,
+            years=range(first_year, last_year + 1),
+        )
+
+        print(f"{self.args.country}, {first_year}-{last_year}, {len(instance)} holidays")
+        for name, dumps, loads in (
+            ("legacy pickle", dumps_legacy, pickle.loads),
+            ("pickle", pickle.dumps, pickle.loads),
+            ("to_bytes", HolidayBase.to_bytes, HolidayBase.from_bytes),
+        ):
+            try:
+                data = dumps(instance)
+            except Exception:
+                print(f"{name:>13}: n/a")
+                continue
+
+            dumps_time = min(timeit.repeat(lambda: dumps(instance), number=100, repeat=3))
+            loads_time = min(timeit.repeat(lambda: loads(data), number=100, repeat=3))
+            print(
+                f"{name:>13}: {len(data):>7} bytes, dumps {dumps_time * 10:.3f}ms, "
+                f"loads {loads_time * 10:.3f}ms"
+            )
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    SerializationBenchmark().run()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import random
+import sys
+import timeit
+import warnings
+from datetime import date
+from pathlib import Path
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+from holidays import country_holidays  # noqa: E402
+from holidays.calendars.gregorian import _timedelta  # noqa: E402
+
+
+def get_nth_workday_loop(holidays, dt, n):
+    """The day by day implementation the workday index replaced."""
+    direction = +1 if n > 0 else -1
+    for _ in range(abs(n)):
+        dt = _timedelta(dt, direction)
+        while not holidays.is_workday(dt):
+            dt = _timedelta(dt, direction)
+    return dt
+
+
+def get_workdays_number_loop(holidays, dt1, dt2):
+    """The day by day implementation the workday index replaced."""
+    if dt1 > dt2:
+        dt1, dt2 = dt2, dt1
+    return sum(holidays.is_workday(_timedelta(dt1, n)) for n in range(1, (dt2 - dt1).days + 1))
+
+
+class WorkdaysBenchmark:
+    """Compares the workday index with the day by day workdays arithmetic."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-c", "--country", default="US", help="Country code to benchmark", type=str
+        )
+        arg_parser.add_argument(
+            "-n",
+            "--workdays",
+            default=(10, 250, 2_500),
+            help="Numbers of working days to move by",
+            nargs="+",
+            type=int,
+        )
+        arg_parser.add_argument(
+            "-q", "--queries", default=200, help="Queries per measurement", type=int
+        )
+        self.args = arg_parser.parse_args()
+
+    def run(self):
+        """Runs the benchmark and prints the results."""
+        instance = country_holidays(self.args.country, years=range(1950, 2061))
+        start, end = date(1960, 1, 1).toordinal(), date(2040, 12, 31).toordinal()
+        dates = [date.fromordinal(random.randint(start, end)) for _ in range(self.args.queries)]
+
+        print(f"{self.args.country}, {self.args.queries} queries per measurement")
+        for n in self.args.workdays:
+            results = {}
+            for name, func in (
+                ("loop", lambda: [get_nth_workday_loop(instance, dt, n) for dt in dates]),
+                ("index", lambda: [instance.get_nth_workday(dt, n) for dt in dates]),
+            ):
+                results[name] = min(timeit.repeat(func, number=1, repeat=3))
+            print(
+                f"get_nth_workday(n={n:>5}): loop {results['loop']:.4f}s, "
+                f"index {results['index']:.4f}s, x{results['loop'] / results['index']:.0f}"
+            )
+
+            ends = [instance.get_nth_workday(dt, n) for dt in dates]
+            for name, func in (
+                (
+                    "loop",
+                    lambda: [get_workdays_number_loop(instance, *dts) for dts in zip(dates, ends)],
+                ),
+                (
+                    "index",
+                    lambda: [instance.get_workdays_number(*dts) for dts in zip(dates, ends)],
+                ),
+            ):
+                results[name] = min(timeit.repeat(func, number=1, repeat=3))
+            print(
+                f"get_workdays_number(n={n:>5}): loop {results['loop']:.4f}s, "
+                f"index {results['index']:.4f}s, x{results['loop'] / results['index']:.0f}"
+            )
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    WorkdaysBenchmark().run()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import sys
+import warnings
+from pathlib import Path
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+from holidays.reverse_index import ReverseIndex  # noqa: E402
+
+
+class ReverseIndexGenerator:
+    """Creates a date to entities reverse index of supported entities."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-c",
+            "--country",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Country codes to index",
+            required=False,
+            type=str,
+        )
+        arg_parser.add_argument(
+            "-m",
+            "--market",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Market codes to index",
+            required=False,
+            type=str,
+        )
+        arg_parser.add_argument(
+            "-y",
+            "--years",
+            default=(1950, 2050),
+            help="The first and the last year to index",
+            nargs=2,
+            type=int,
+        )
+        arg_parser.add_argument(
+            "-o", "--output", default="reverse_index.json", help="Output file path", type=str
+        )
+        self.args = arg_parser.parse_args()
+
+    def run(self):
+        """Runs reverse index generation process."""
+        # All the entities are indexed unless some are listed explicitly.
+        countries = self.args.country or None
+        markets = self.args.market or None
+        if countries or markets:
+            countries, markets = countries or [], markets or []
+
+        first_year, last_year = self.args.years
+        ReverseIndex.build(
+            range(first_year, last_year + 1), countries=countries, markets=markets
+        ).save(self.args.output)
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    ReverseIndexGenerator().run()
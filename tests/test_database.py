@@ -0,0 +1,144 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+import tempfile
+import unittest
+from datetime import date
+from itertools import combinations
+from pathlib import Path
+
+from holidays.constants import OPTIONAL, PUBLIC, UNOFFICIAL
+from holidays.countries import Germany, HongKong, Ukraine, UnitedStates
+from holidays.database import HolidayDatabase
+from holidays.financial import NewYorkStockExchange
+
+
+class TestHolidayDatabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.path = Path(cls.tmp_dir.name) / "holidays.db"
+        HolidayDatabase.build(
+            cls.path,
+            range(2023, 2025),
+            countries=("DE", "HK", "US"),
+            markets=(),
+            language="en_US",
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        self.database = HolidayDatabase(self.path)
+
+    def tearDown(self):
+        self.database.close()
+
+    def test_build(self):
+        self.assertTupleEqual(self.database.years, (2023, 2024))
+        self.assertEqual(self.database.language, "en_US")
+        self.assertIn(("DE", "BE", PUBLIC), self.database.entries)
+        self.assertIn(("US", None, UNOFFICIAL), self.database.entries)
+        self.assertNotIn(("NYSE", None, PUBLIC), self.database.entries)
+
+        self.assertRaises(ValueError, lambda: HolidayDatabase.build(self.path, ()))
+        self.assertRaises(
+            ValueError, lambda: HolidayDatabase.build(self.path, 2024, countries=("XX",))
+        )
+
+        path = Path(self.tmp_dir.name) / "markets.db"
+        HolidayDatabase.build(path, 2021, countries=("UA",), markets=("NYSE",))
+        with HolidayDatabase(path) as database:
+            self.assertIsNone(database.language)
+            self.assertDictEqual(
+                dict(database.get_holidays("NYSE")), dict(NewYorkStockExchange(years=2021))
+            )
+            self.assertDictEqual(dict(database.get_holidays("UA")), dict(Ukraine(years=2021)))
+
+    def test_get_holidays(self):
+        for subdiv in (None, *UnitedStates.subdivisions):
+            for categories in (PUBLIC, UNOFFICIAL, (PUBLIC, UNOFFICIAL)):
+                us_holidays = UnitedStates(
+                    subdiv=subdiv, categories=categories, years=2023, language="en_US"
+                )
+                db_holidays = self.database.get_holidays("US", subdiv, categories)
+                self.assertListEqual(
+                    [dt for dt in db_holidays if dt.year == 2023], sorted(us_holidays)
+                )
+                for dt, name in us_holidays.items():
+                    self.assertIn(dt, db_holidays)
+                    self.assertListEqual(
+                        sorted(db_holidays.get_list(dt)), sorted(us_holidays.get_list(dt))
+                    )
+                    if isinstance(categories, str):
+                        self.assertEqual(db_holidays[dt], name)
+
+        de_holidays = self.database.get_holidays("DE", "BE")
+        self.assertEqual(
+            len(de_holidays), len(Germany(subdiv="BE", years=(2023, 2024), language="en_US"))
+        )
+        self.assertEqual(de_holidays["2024-10-03"], "German Unity Day")
+        self.assertIsNone(de_holidays.get(date(2024, 10, 4)))
+        self.assertEqual(de_holidays.get("2024-10-04", "-"), "-")
+        self.assertListEqual(de_holidays.get_list("2024-10-04"), [])
+        self.assertNotIn("2024-10-04", de_holidays)
+        self.assertRaises(KeyError, lambda: de_holidays["2024-10-04"])
+
+        # Dates out of the database range.
+        self.assertIsNone(de_holidays.get("2025-01-01"))
+        self.assertEqual(de_holidays.get("2025-01-01", "-"), "-")
+        self.assertListEqual(de_holidays.get_list("2025-01-01"), [])
+        self.assertNotIn("2022-12-31", de_holidays)
+        self.assertRaises(KeyError, lambda: de_holidays["2025-01-01"])
+        self.assertRaises(KeyError, lambda: self.database.get_holidays("DE", "XX"))
+        self.assertRaises(KeyError, lambda: self.database.get_holidays("NYSE"))
+        self.assertRaises(
+            KeyError, lambda: self.database.get_holidays("DE", categories=UNOFFICIAL)
+        )
+
+    def test_get_holidays_categories(self):
+        for entity_cls, subdivs in ((HongKong, (None,)), (UnitedStates, (None, "MA", "PR"))):
+            for subdiv in subdivs:
+                for size in range(2, len(entity_cls.supported_categories) + 1):
+                    for categories in combinations(entity_cls.supported_categories, size):
+                        entity_holidays = entity_cls(
+                            categories=categories, language="en_US", subdiv=subdiv, years=2023
+                        )
+                        db_holidays = self.database.get_holidays(
+                            entity_cls.country, subdiv, categories
+                        )
+                        self.assertDictEqual(
+                            {dt: name for dt, name in db_holidays.items() if dt.year == 2023},
+                            {dt: name for dt, name in entity_holidays.items() if dt.year == 2023},
+                        )
+
+        hk_holidays = self.database.get_holidays("HK", categories=(OPTIONAL, PUBLIC))
+        self.assertEqual(hk_holidays["2023-10-02"], "National Day (observed)")
+        self.assertEqual(hk_holidays["2023-10-03"], "The day following National Day")
+        self.assertEqual(hk_holidays["2023-12-25"], "Christmas Day")
+        # Only the categories which can't be merged are stored together.
+        self.assertIn(("HK", None, f"{OPTIONAL},{PUBLIC}"), self.database._entries)
+        self.assertNotIn(("HK", None, f"{OPTIONAL},{PUBLIC}"), self.database.entries)
+        self.assertNotIn(("US", None, f"{PUBLIC},{UNOFFICIAL}"), self.database._entries)
+
+    def test_open(self):
+        self.assertEqual(
+            repr(self.database),
+            f"HolidayDatabase(years=(2023, 2024), entries={len(self.database.entries)})",
+        )
+
+        path = Path(self.tmp_dir.name) / "invalid.db"
+        for data in (b"HLDB", b"\0" * 64):
+            path.write_bytes(data)
+            self.assertRaises(ValueError, lambda: HolidayDatabase(path))
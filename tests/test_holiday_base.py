@@ -10,16 +10,26 @@
 #  Website: https://github.com/vacanza/python-holidays
 #  License: MIT (see LICENSE file)
 
+import os
 import pickle
+import random
+import sys
+import threading
 import unittest
 from datetime import date, datetime
+from functools import lru_cache
 from datetime import timedelta as td
+from unittest import mock
 
 from holidays.calendars.gregorian import JAN, FEB, OCT, DEC, MON, TUE, SAT, SUN
 from holidays.constants import HOLIDAY_NAME_DELIMITER, OPTIONAL, PUBLIC, SCHOOL
+from holidays.countries.belarus import BY
+from holidays.countries.hongkong import HK
+from holidays.countries.ukraine import UA
+from holidays.countries.united_states import US
 from holidays.groups.christian import ChristianHolidays
 from holidays.groups.custom import StaticHolidays
-from holidays.holiday_base import HolidayBase
+from holidays.holiday_base import FrozenHolidays, HolidayBase, HolidayQuorum, HolidayUnion
 
 
 class EntityStubStaticHolidays:
@@ -178,6 +188,31 @@ class TestArgs(unittest.TestCase):
         self.assertIn("2012-01-01", hb)
         self.assertNotIn("2012-01-02", hb)
 
+    def test_language(self):
+        # The translations are looked up on the first use.
+        ua_holidays = UA(language="EN_US")
+        self.assertEqual(ua_holidays.language, "en_us")
+        self.assertNotIn("tr", ua_holidays.__dict__)
+        self.assertEqual(ua_holidays.get("2021-01-01"), "New Year's Day")
+        self.assertIn("tr", ua_holidays.__dict__)
+        self.assertIs(UA(language="en_US").tr, ua_holidays.tr)
+        self.assertEqual((ua_holidays + CountryStub1()).tr("Test holiday"), "Test holiday")
+
+        # The languages are matched case-insensitively.
+        for language in ("en_US", "en_us", "EN_US"):
+            ua_holidays = UA(language=language, years=2021)
+            self.assertEqual(ua_holidays.language, "en_us")
+            self.assertEqual(ua_holidays["2021-01-01"], "New Year's Day")
+            self.assertEqual(
+                pickle.loads(pickle.dumps(ua_holidays))["2021-01-01"], "New Year's Day"
+            )
+
+        # Unsupported languages fall back to the environment one.
+        with mock.patch.dict(os.environ, {"LANGUAGE": "en_US"}):
+            self.assertEqual(UA(language="xx", years=2021).get("2021-01-01"), "New Year's Day")
+        with mock.patch.dict(os.environ, {"LANGUAGE": "uk"}):
+            self.assertEqual(UA(language="xx", years=2021).get("2021-01-01"), "Новий рік")
+
     def test_subdivision(self):
         self.assertEqual(CountryStub1(subdiv="Subdiv 1").subdiv, "Subdiv 1")
         self.assertEqual(CountryStub1(subdiv=3).subdiv, "3")
@@ -222,6 +257,71 @@ class TestArgs(unittest.TestCase):
         self.assertSetEqual(HolidayBase(years=2015.0).years, {2015})
 
 
+class TestHolidayBitmaps(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1(years=2014)
+
+    def assertBitmapsEqual(self, hb=None):  # noqa: N802
+        hb = hb or self.hb
+        expected = CountryStub1(expand=False)
+        expected._holiday_bitmaps = None
+        dict.update(expected, dict.items(hb))
+        self.assertDictEqual(hb._get_holiday_bitmaps(), expected._get_holiday_bitmaps())
+
+    def test_equal_to_dict(self):
+        hb = CountryStub1(years=range(2000, 2030))
+        bitmaps = hb._get_holiday_bitmaps()
+        self.assertSetEqual(set(bitmaps), set(range(2000, 2030)))
+
+        dt = date(2000, 1, 1)
+        for delta in range((date(2030, 1, 1) - dt).days):
+            day = dt + td(days=delta)
+            year = day.year
+            self.assertEqual(
+                bitmaps.get(year, 0) >> (day.toordinal() - date(year, 1, 1).toordinal()) & 1 == 1,
+                day in hb,
+                day,
+            )
+
+    def test_mutations(self):
+        self.hb._get_holiday_bitmaps()
+
+        self.hb.update(["2016-02-29", "2016-12-31"])
+        self.assertBitmapsEqual()
+
+        self.hb["2014-01-02"] = "Custom holiday"
+        self.assertBitmapsEqual()
+        self.assertFalse(self.hb.is_workday("2014-01-02"))
+
+        self.hb.pop("2014-01-02")
+        self.assertBitmapsEqual()
+        self.assertTrue(self.hb.is_workday("2014-01-02"))
+
+        del self.hb["2014-01-01"]
+        self.assertBitmapsEqual()
+
+        self.hb.popitem()
+        self.assertBitmapsEqual()
+
+        self.hb.observed = False
+        self.assertBitmapsEqual()
+
+        self.hb.clear()
+        self.assertEqual(self.hb._get_holiday_bitmaps(), {})
+
+    def test_pickle(self):
+        self.assertIsNotNone(self.hb._get_holiday_bitmaps())
+
+        hb = pickle.loads(pickle.dumps(self.hb))
+        self.assertIsNone(hb._holiday_bitmaps)
+        self.assertEqual(hb, self.hb)
+
+        hb_copy = self.hb.copy()
+        hb_copy["2014-01-02"] = "Custom holiday"
+        self.assertBitmapsEqual(hb_copy)
+        self.assertBitmapsEqual()
+
+
 class TestCategories(unittest.TestCase):
     class CustomCategoryClass(HolidayBase):
         country = "CCC"
@@ -286,6 +386,78 @@ class TestCategories(unittest.TestCase):
                 for dt in categories[category]:
                     self.assertIn(dt, ccc)
 
+    def test_populate_layers(self):
+        ccc = TestCategories.CustomCategoryClass(years=range(2023, 2025), categories="CC")
+        self.assertIsNone(ccc._populate_layers)
+
+        for categories, expected_layers in (
+            ({"CC", "CC_1"}, 2),
+            ({"CC_1", "CC_2"}, 4),
+            ({"CC"}, 6),
+        ):
+            ccc.categories = categories
+            self.assertEqual(len(ccc._populate_layers), expected_layers)
+            self.assertDictEqual(
+                ccc,
+                TestCategories.CustomCategoryClass(years=range(2023, 2025), categories=categories),
+            )
+
+        hb = CountryStub1(years=range(2020, 2024), subdiv="Subdiv 1")
+        for observed, categories, expected_layers in (
+            (False, {PUBLIC}, 4),
+            (True, {PUBLIC}, 8),
+            (False, {PUBLIC, SCHOOL}, 12),
+            (True, {PUBLIC, SCHOOL}, 16),
+            (False, {PUBLIC}, 16),
+        ):
+            hb.observed = observed
+            hb.categories = categories
+            self.assertEqual(len(hb._populate_layers), expected_layers)
+            self.assertDictEqual(
+                hb,
+                CountryStub1(
+                    years=range(2020, 2024),
+                    subdiv="Subdiv 1",
+                    observed=observed,
+                    categories=categories,
+                ),
+            )
+            self.assertSetEqual(hb.years, set(range(2020, 2024)))
+            self.assertListEqual(
+                hb["2020-01-01":"2023-12-31"], sorted(dt for dt in hb if dt < date(2023, 12, 31))
+            )
+
+        # Objects with evictable years are populated as a whole.
+        hb = CountryStub1(years=2024, max_years=2)
+        hb.observed = False
+        self.assertIsNone(hb._populate_layers)
+        self.assertDictEqual(hb, CountryStub1(years=2024, observed=False))
+
+    def test_populate_layers_dependent_categories(self):
+        # The observed rules depend on the holidays of the other categories.
+        for cls, kwargs in (
+            (HK, {"categories": (OPTIONAL, PUBLIC), "years": range(2018, 2025)}),
+            (
+                US,
+                {
+                    "categories": US.supported_categories,
+                    "subdiv": "MA",
+                    "years": range(2018, 2025),
+                },
+            ),
+        ):
+            hb = cls(language="en_US", **kwargs)
+            hb.observed = False
+            self.assertDictEqual(hb, cls(language="en_US", observed=False, **kwargs))
+            hb.observed = True
+            self.assertDictEqual(hb, cls(language="en_US", **kwargs))
+
+        hk = HK(categories=(OPTIONAL, PUBLIC), language="en_US", years=2023)
+        hk.observed = False
+        hk.observed = True
+        self.assertEqual(hk["2023-10-02"], "National Day (observed)")
+        self.assertEqual(hk["2023-10-03"], "The day following National Day")
+
 
 class TestDeprecationWarnings(unittest.TestCase):
     def test_prov_deprecation(self):
@@ -373,6 +545,127 @@ class TestEqualityInequality(unittest.TestCase):
         self.assertFalse(hb_3 != hb_3)
 
 
+class TestFreeze(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub6()
+
+    def test_freeze(self):
+        frozen = self.hb.freeze(years=2024)
+        self.assertIsInstance(frozen, FrozenHolidays)
+        self.assertSetEqual(frozen.years, {2024})
+        self.assertDictEqual(dict(frozen), {dt: self.hb[dt] for dt in self.hb if dt.year == 2024})
+        self.assertEqual(len(frozen), len(self.hb.freeze(years=2024)))
+
+        self.assertIn("2024-05-01", frozen)
+        self.assertIn(date(2024, 5, 2), frozen)
+        self.assertNotIn(datetime(2024, 5, 3), frozen)
+        self.assertRaises(TypeError, lambda: None in frozen)
+        self.assertEqual(frozen["2024-05-01"], "Labor Day")
+        self.assertRaises(KeyError, lambda: frozen["2024-05-03"])
+        self.assertEqual(frozen.get("2024-05-02"), "Labor Day Two")
+        self.assertEqual(frozen.get("2024-05-03", "default"), "default")
+
+        # Other years are never populated.
+        self.assertNotIn("2025-05-01", frozen)
+        self.assertSetEqual(frozen.years, {2024})
+
+    def test_freeze_populated_years(self):
+        self.hb.get("2023-01-01")
+        self.hb.get("2024-01-01")
+        frozen = self.hb.freeze()
+        self.assertSetEqual(frozen.years, {2023, 2024})
+        self.assertDictEqual(dict(frozen), dict(self.hb))
+
+        self.assertEqual(len(HolidayBase().freeze()), 0)
+
+    def test_adjacent_years(self):
+        class YearEveStub(HolidayBase):
+            def _populate(self, year):
+                super()._populate(year)
+                if year - 1 in self.years:
+                    self[date(year - 1, DEC, 31)] = f"{year} Eve"
+
+        frozen = YearEveStub().freeze(years=2021)
+        self.assertEqual(frozen["2021-12-31"], "2022 Eve")
+        self.assertNotIn("2020-12-31", frozen)
+
+        frozen = YearEveStub(expand=False).freeze(years=2021)
+        self.assertNotIn("2021-12-31", frozen)
+
+    def test_get_names(self):
+        self.hb["2024-05-01"] = "Extra Holiday"
+        frozen = self.hb.freeze(years=2024)
+        self.assertTupleEqual(frozen.get_names("2024-05-01"), ("Extra Holiday", "Labor Day"))
+        self.assertListEqual(frozen.get_list("2024-05-01"), ["Extra Holiday", "Labor Day"])
+        self.assertTupleEqual(frozen.get_names("2024-05-02"), ("Labor Day Two",))
+        self.assertTupleEqual(frozen.get_names("2024-05-03"), ())
+
+    def test_hash(self):
+        frozen = self.hb.freeze(years=2024)
+        self.assertEqual(frozen, CountryStub6().freeze(years=2024))
+        self.assertEqual(hash(frozen), hash(CountryStub6().freeze(years=2024)))
+        self.assertNotEqual(frozen, self.hb.freeze(years=2023))
+        self.assertNotEqual(frozen, CountryStub6(observed=False).freeze(years=2024))
+        self.assertNotEqual(frozen, dict(frozen))
+
+        @lru_cache
+        def count_holidays(holidays):
+            return len(holidays)
+
+        count_holidays(frozen)
+        count_holidays(CountryStub6().freeze(years=2024))
+        self.assertEqual(count_holidays.cache_info().hits, 1)
+
+        frozen = (CountryStub1(subdiv="Subdiv 1") + CountryStub1(subdiv="Subdiv 2")).freeze(2024)
+        self.assertTupleEqual(frozen.subdiv, ("Subdiv 1", "Subdiv 2"))
+        self.assertIsInstance(hash(frozen), int)
+
+    def test_immutable(self):
+        frozen = self.hb.freeze(years=2022)
+        with self.assertRaises(AttributeError):
+            frozen.years = {2025}
+        with self.assertRaises(AttributeError):
+            del frozen.observed
+        with self.assertRaises(TypeError):
+            frozen["2024-01-02"] = "New Holiday"
+
+        self.hb["2022-01-04"] = "New Holiday"
+        self.hb.pop("2022-05-02")
+        self.hb.observed = False
+        self.assertNotIn("2022-01-04", frozen)
+        self.assertIn("2022-05-02", frozen)
+        self.assertIn("2022-06-20", frozen)
+
+    def test_is_workday(self):
+        frozen = self.hb.freeze(years=2024)
+        for dt in (date(2024, 1, 1) + td(days=n) for n in range(366)):
+            self.assertEqual(frozen.is_workday(dt), self.hb.is_workday(dt), dt)
+
+    def test_pickle(self):
+        frozen = self.hb.freeze(years=range(2020, 2025))
+        loaded_frozen = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual(loaded_frozen, frozen)
+        self.assertEqual(hash(loaded_frozen), hash(frozen))
+        self.assertDictEqual(dict(loaded_frozen), dict(frozen))
+        self.assertEqual(loaded_frozen.country, "CS6")
+
+    def test_slice(self):
+        frozen = self.hb.freeze(years=range(2020, 2025))
+        for start, stop, step in (
+            ("2020-01-01", "2025-01-01", None),
+            ("2020-01-01", "2025-01-01", 7),
+            ("2024-12-31", "2020-01-01", td(days=-3)),
+            ("2024-01-01", "2023-01-01", None),
+            ("2024-05-01", "2024-05-01", None),
+        ):
+            self.assertListEqual(frozen[start:stop:step], self.hb[start:stop:step])
+        self.assertListEqual(frozen["2018-01-01":"2020-01-01"], [])
+
+        self.assertRaises(ValueError, lambda: frozen[:"2024-01-01"])
+        self.assertRaises(ValueError, lambda: frozen["2024-01-01":"2024-02-01":0])
+        self.assertRaises(TypeError, lambda: frozen["2024-01-01":"2024-02-01":"1"])
+
+
 class TestGetList(unittest.TestCase):
     def test_get_list_multiple_countries(self):
         hb_country_1 = CountryStub1(years=2021)
@@ -408,6 +701,43 @@ class TestGetList(unittest.TestCase):
             ["Subdiv 1 Custom Holiday", "Subdiv 2 Custom Holiday"],
         )
 
+    def test_get_names(self):
+        hb = CountryStub1(years=2021)
+        self.assertTupleEqual(hb.get_names("2021-12-20"), ())
+        self.assertTupleEqual(hb.get_names("2021-12-25"), ("Christmas Day",))
+
+        hb["2021-12-25"] = "Custom Holiday 2"
+        hb["2021-12-25"] = "Custom Holiday 1; Christmas Day"
+        self.assertEqual(hb["2021-12-25"], "Christmas Day; Custom Holiday 1; Custom Holiday 2")
+        self.assertTupleEqual(
+            hb.get_names("2021-12-25"), ("Christmas Day", "Custom Holiday 1", "Custom Holiday 2")
+        )
+
+        # Adding the names already there keeps the value.
+        value = dict.__getitem__(hb, date(2021, 12, 25))
+        hb["2021-12-25"] = "Custom Holiday 1"
+        hb["2021-12-25"] = "Custom Holiday 2; Christmas Day"
+        self.assertIs(dict.__getitem__(hb, date(2021, 12, 25)), value)
+
+        # Values replaced bypassing __setitem__ are split again.
+        dict.__setitem__(hb, date(2021, 12, 25), "Custom Holiday 3; Custom Holiday 4")
+        self.assertTupleEqual(hb.get_names("2021-12-25"), ("Custom Holiday 3", "Custom Holiday 4"))
+
+        # And sorted when the next names are added.
+        dict.__setitem__(hb, date(2021, 12, 25), "Custom Holiday 4; Custom Holiday 3")
+        hb["2021-12-25"] = "Custom Holiday 4"
+        self.assertEqual(hb["2021-12-25"], "Custom Holiday 3; Custom Holiday 4")
+        hb["2021-12-25"] = "Custom Holiday 0"
+        self.assertTupleEqual(
+            hb.get_names("2021-12-25"),
+            ("Custom Holiday 0", "Custom Holiday 3", "Custom Holiday 4"),
+        )
+
+        hb.pop("2021-12-25")
+        self.assertTupleEqual(hb.get_names("2021-12-25"), ())
+        hb["2021-12-25"] = "Christmas Day"
+        self.assertTupleEqual(hb.get_names("2021-12-25"), ("Christmas Day",))
+
 
 class TestGetNamed(unittest.TestCase):
     def test_contains(self):
@@ -477,6 +807,34 @@ class TestGetNamed(unittest.TestCase):
         self.assertListEqual(hb.get_named("independence day", lookup="iexact"), [date(2022, 7, 4)])
         self.assertSetEqual(hb.years, {2022})
 
+    def test_index(self):
+        hb = CountryStub1(years=2022)
+        self.assertListEqual(hb.get_named("Independence Day", lookup="exact"), [date(2022, 7, 4)])
+
+        hb["2022-01-03"] = "Independence Day"
+        hb["2022-01-03"] = "Custom Holiday"
+        hb.update(CountryStub1(years=2021))
+        self.assertListEqual(
+            hb.get_named("Independence Day", lookup="exact"),
+            [date(2022, 7, 4), date(2022, 1, 3), date(2021, 7, 4)],
+        )
+        self.assertListEqual(
+            hb.get_named("Custom Holiday; Independence Day", split_multiple_names=False),
+            [date(2022, 1, 3)],
+        )
+
+        hb.pop("2022-07-04")
+        del hb["2022-01-03"]
+        self.assertListEqual(hb.get_named("Independence Day", lookup="exact"), [date(2021, 7, 4)])
+        dt, name = hb.popitem()
+        self.assertNotIn(dt, hb.get_named(name, lookup="exact"))
+
+        hb.pop_named("Independence Day")
+        self.assertListEqual(hb.get_named("Independence Day"), [])
+
+        hb.clear()
+        self.assertListEqual(hb.get_named("Independence Day"), [])
+
     def test_invalid(self):
         hb = CountryStub1(years=2022)
         self.assertRaises(
@@ -583,6 +941,102 @@ class TestHelperMethods(unittest.TestCase):
             self.assertFalse(self.hb._is_weekend(*dt))
 
 
+class TestHolidayQuorum(unittest.TestCase):
+    def setUp(self):
+        self.operands = (
+            CountryStub1(subdiv="Subdiv 1", years=2023),
+            CountryStub2(years=2023),
+            CountryStub6(years=2023),
+        )
+        self.hb_all = HolidayQuorum(self.operands)
+        self.hb_any = HolidayQuorum(self.operands, 1)
+
+    def test_args(self):
+        self.assertEqual(self.hb_all.quorum, 3)
+        self.assertEqual(self.hb_any.quorum, 1)
+        self.assertTupleEqual(self.hb_all.holidays, self.operands)
+        self.assertSetEqual(self.hb_all.years, {2023})
+
+        self.assertRaises(TypeError, lambda: HolidayQuorum((self.operands[0], {})))
+        self.assertRaises(ValueError, lambda: HolidayQuorum(self.operands, 0))
+        self.assertRaises(ValueError, lambda: HolidayQuorum(self.operands, 4))
+
+        HolidayQuorum(self.operands, years=2024)
+        for operand in self.operands:
+            self.assertSetEqual(operand.years, {2023, 2024})
+
+    def test_contains(self):
+        self.assertIn("2023-07-04", self.hb_all)
+        self.assertNotIn("2023-03-01", self.hb_all)
+        self.assertNotIn("2023-07-05", self.hb_all)
+        for dt in ("2023-03-01", "2023-05-01", "2023-07-04", "2023-08-10"):
+            self.assertIn(dt, self.hb_any)
+        self.assertNotIn("2023-07-05", self.hb_any)
+        self.assertIn("2023-07-04", HolidayQuorum(self.operands, 2))
+        self.assertNotIn("2023-05-01", HolidayQuorum(self.operands, 2))
+        self.assertRaises(TypeError, lambda: {} in self.hb_all)
+
+        # The operands are expanded according to their own settings.
+        self.assertIn("2030-07-04", self.hb_all)
+        self.assertNotIn("2030-07-04", HolidayQuorum((self.operands[0], CountryStub3())))
+
+    def test_get(self):
+        self.assertEqual(self.hb_all["2023-07-04"], "Independence Day")
+        self.assertEqual(self.hb_any.get("2023-03-01"), "Custom March 1st Holiday")
+        self.assertIsNone(self.hb_all.get("2023-03-01"))
+        self.assertEqual(self.hb_all.get("2023-03-01", "default"), "default")
+        self.assertRaises(KeyError, lambda: self.hb_all["2023-03-01"])
+        self.assertListEqual(self.hb_all.get_list("2023-03-01"), [])
+        self.assertListEqual(self.hb_any.get_list("2023-05-01"), ["Labor Day"])
+        self.assertTupleEqual(self.hb_any.get_names("2023-07-05"), ())
+
+    def test_iter(self):
+        self.assertListEqual(
+            list(self.hb_all),
+            [
+                date(2023, 1, 1),
+                date(2023, 1, 2),
+                date(2023, 6, 19),
+                date(2023, 7, 4),
+                date(2023, 11, 23),
+                date(2023, 12, 25),
+            ],
+        )
+        self.assertEqual(len(self.hb_all), 6)
+        self.assertEqual(len(self.hb_any), 10)
+
+    def test_slice(self):
+        self.assertListEqual(
+            self.hb_all["2023-06-01":"2023-07-31"], [date(2023, 6, 19), date(2023, 7, 4)]
+        )
+        self.assertListEqual(
+            self.hb_all["2023-07-31":"2023-06-01"], [date(2023, 7, 4), date(2023, 6, 19)]
+        )
+        self.assertListEqual(
+            self.hb_any["2023-03-01":"2023-08-31":61], [date(2023, 3, 1), date(2023, 5, 1)]
+        )
+        self.assertListEqual(
+            self.hb_all["2022-12-01":"2024-01-31"][-3:],
+            [date(2023, 11, 23), date(2023, 12, 25), date(2024, 1, 1)],
+        )
+
+    def test_workdays(self):
+        self.assertFalse(self.hb_all.is_workday("2023-07-04"))
+        self.assertTrue(self.hb_all.is_workday("2023-03-01"))
+        self.assertFalse(self.hb_any.is_workday("2023-03-01"))
+        self.assertFalse(self.hb_all.is_workday("2023-03-04"))
+
+        self.assertEqual(self.hb_all.get_nth_workday("2023-06-30", 1), date(2023, 7, 3))
+        self.assertEqual(self.hb_all.get_nth_workday("2023-06-30", 2), date(2023, 7, 5))
+        self.assertEqual(self.hb_all.get_nth_workday("2023-07-05", -2), date(2023, 6, 30))
+        self.assertEqual(self.hb_any.get_nth_workday("2023-04-28", 1), date(2023, 5, 3))
+        self.assertEqual(self.hb_all.get_nth_workday("2023-12-29", 2), date(2024, 1, 3))
+
+        self.assertEqual(self.hb_all.get_workdays_number("2023-06-30", "2023-07-05"), 2)
+        self.assertEqual(self.hb_any.get_workdays_number("2023-04-28", "2023-05-03"), 1)
+        self.assertEqual(self.hb_any.get_workdays_number("2023-05-03", "2023-04-28"), 1)
+
+
 class TestHolidaySum(unittest.TestCase):
     def setUp(self) -> None:
         self.hb_1 = CountryStub1(years=2014)
@@ -664,6 +1118,89 @@ class TestHolidaySum(unittest.TestCase):
         self.assertEqual(self.hb_combined.subdiv, list(CountryStub1.subdivisions))
 
 
+class TestHolidayUnion(unittest.TestCase):
+    def setUp(self):
+        self.hb_1 = CountryStub1(years=2014, subdiv="Subdiv 1")
+        self.hb_2 = CountryStub1(years=2014, subdiv="Subdiv 2")
+        self.hb_3 = CountryStub2(expand=False, years=2015)
+        self.hb_union = HolidayUnion((self.hb_1, self.hb_2, self.hb_3))
+
+    def test_contains(self):
+        self.assertIn("2014-07-04", self.hb_union)
+        self.assertIn("2014-08-10", self.hb_union)
+        self.assertIn("2015-03-01", self.hb_union)
+        self.assertNotIn("2014-07-05", self.hb_union)
+        self.assertRaises(TypeError, lambda: {} in self.hb_union)
+
+        # The operands are expanded according to their own settings.
+        self.assertSetEqual(self.hb_1.years, {2014, 2015})
+        self.assertSetEqual(self.hb_3.years, {2015})
+        self.assertIn("2016-07-04", self.hb_union)
+        self.assertNotIn("2016-03-01", self.hb_union)
+        self.assertSetEqual(self.hb_1.years, {2014, 2015, 2016})
+        self.assertSetEqual(self.hb_3.years, {2015})
+        self.assertSetEqual(self.hb_union.years, {2014, 2015, 2016})
+
+    def test_equal_to_sum(self):
+        hb_sum = CountryStub1(years=2014, subdiv="Subdiv 1") + CountryStub1(
+            years=2014, subdiv="Subdiv 2"
+        )
+        hb_union = HolidayUnion(
+            (
+                CountryStub1(years=2014, subdiv="Subdiv 1"),
+                CountryStub1(years=2014, subdiv="Subdiv 2"),
+            )
+        )
+        self.assertEqual(hb_union, hb_sum)
+        self.assertListEqual(list(hb_union), sorted(hb_sum))
+        self.assertEqual(len(hb_union), len(hb_sum))
+        self.assertEqual(
+            hb_union["2014-08-10"], "Subdiv 1 Custom Holiday; Subdiv 2 Custom Holiday"
+        )
+
+    def test_flatten(self):
+        hb_union = HolidayUnion((self.hb_1 + self.hb_2, HolidayUnion((self.hb_3,))))
+        self.assertTupleEqual(hb_union.holidays, (self.hb_1, self.hb_2, self.hb_3))
+        self.assertEqual(hb_union, self.hb_union)
+
+        self.assertRaises(TypeError, lambda: HolidayUnion((self.hb_1, {})))
+
+    def test_get(self):
+        self.assertEqual(self.hb_union.get("2014-07-04"), "Independence Day")
+        self.assertEqual(
+            self.hb_union.get("2014-08-10"), "Subdiv 1 Custom Holiday; Subdiv 2 Custom Holiday"
+        )
+        self.assertIsNone(self.hb_union.get("2014-07-05"))
+        self.assertEqual(self.hb_union.get("2014-07-05", "default"), "default")
+        self.assertRaises(KeyError, lambda: self.hb_union["2014-07-05"])
+
+        self.assertListEqual(
+            self.hb_union.get_list("2014-08-10"),
+            ["Subdiv 1 Custom Holiday", "Subdiv 2 Custom Holiday"],
+        )
+        self.assertListEqual(self.hb_union.get_list("2014-07-05"), [])
+        self.assertTupleEqual(self.hb_union.get_names("2015-03-01"), ("Custom March 1st Holiday",))
+        self.assertTupleEqual(self.hb_union.get_names("2014-07-05"), ())
+
+    def test_slice(self):
+        self.assertListEqual(
+            self.hb_union["2014-07-01":"2014-08-31"], [date(2014, 7, 4), date(2014, 8, 10)]
+        )
+        self.assertListEqual(
+            self.hb_union["2014-08-31":"2014-07-01"], [date(2014, 8, 10), date(2014, 7, 4)]
+        )
+        self.assertListEqual(
+            self.hb_union["2014-07-04":"2014-08-31":37], [date(2014, 7, 4), date(2014, 8, 10)]
+        )
+
+    def test_years(self):
+        hb_union = HolidayUnion((self.hb_1, self.hb_3), years=(2017, 2018))
+        self.assertSetEqual(self.hb_1.years, {2014, 2015, 2017, 2018})
+        self.assertSetEqual(self.hb_3.years, {2015, 2017, 2018})
+        self.assertSetEqual(hb_union.years, {2014, 2015, 2017, 2018})
+        self.assertIn("2018-03-01", hb_union)
+
+
 class TestInheritance(unittest.TestCase):
     def setUp(self):
         self.hb = CountryStub1()
@@ -693,6 +1230,86 @@ class TestInheritance(unittest.TestCase):
         self.assertIn("2020-07-13", hb)
 
 
+class TestIterHolidays(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1()
+
+    def test_iter_holidays(self):
+        holidays_2014 = list(self.hb.iter_holidays("2014-01-01", "2014-12-31"))
+        self.assertListEqual(
+            holidays_2014, sorted((dt, name) for dt, name in self.hb.items() if dt.year == 2014)
+        )
+        self.assertSetEqual(self.hb.years, {2013, 2014, 2015})
+        self.assertListEqual(
+            list(self.hb.iter_holidays("2014-12-31", "2014-01-01")), holidays_2014[::-1]
+        )
+        self.assertListEqual(
+            list(self.hb.iter_holidays("2021-12-24", "2022-01-01")),
+            [
+                (date(2021, 12, 24), "Christmas Day (observed)"),
+                (date(2021, 12, 25), "Christmas Day"),
+                (date(2021, 12, 31), "New Year's Day (observed)"),
+                (date(2022, 1, 1), "New Year's Day"),
+            ],
+        )
+        self.assertListEqual(list(self.hb.iter_holidays("2014-01-02", "2014-01-02")), [])
+
+    def test_iter_holidays_lazy(self):
+        holidays_iter = self.hb.iter_holidays("2014-01-01", "2050-12-31")
+        self.assertEqual(next(holidays_iter), (date(2014, 1, 1), "New Year's Day"))
+        # Only the range ends and the years adjacent to the current one are populated.
+        self.assertSetEqual(self.hb.years, {2013, 2014, 2015, 2050})
+
+        self.hb.pop("2014-06-19")
+        self.assertEqual(next(holidays_iter), (date(2014, 7, 4), "Independence Day"))
+
+    def test_iter_holidays_no_expand(self):
+        self.hb = CountryStub1(years=2014, expand=False)
+        self.assertListEqual(
+            [dt for dt, _ in self.hb.iter_holidays("2013-01-01", "2015-12-31")],
+            sorted(self.hb.keys()),
+        )
+        self.assertSetEqual(self.hb.years, {2014})
+
+    def test_next_holiday(self):
+        self.assertEqual(
+            self.hb.next_holiday("2014-01-01"),
+            (date(2014, 6, 19), "Juneteenth National Independence Day"),
+        )
+        self.assertEqual(self.hb.next_holiday("2014-12-25"), (date(2015, 1, 1), "New Year's Day"))
+        self.assertEqual(
+            self.hb.next_holiday(date(2021, 12, 25)),
+            (date(2021, 12, 31), "New Year's Day (observed)"),
+        )
+        self.assertIsNotNone(self.hb.next_holiday())
+        self.assertIsNone(HolidayBase().next_holiday("2014-01-01"))
+        self.assertIsNone(self.hb.next_holiday(date.max))
+
+        hb = CountryStub1(years=(2014, 2020), expand=False)
+        self.assertEqual(hb.next_holiday("2014-12-25"), (date(2020, 1, 1), "New Year's Day"))
+        self.assertIsNone(hb.next_holiday("2020-12-25"))
+
+    def test_previous_holiday(self):
+        self.assertEqual(
+            self.hb.previous_holiday("2014-01-01"), (date(2013, 12, 25), "Christmas Day")
+        )
+        self.assertEqual(
+            self.hb.previous_holiday("2014-06-20"),
+            (date(2014, 6, 19), "Juneteenth National Independence Day"),
+        )
+        self.assertEqual(
+            self.hb.previous_holiday(date(2022, 1, 1)),
+            (date(2021, 12, 31), "New Year's Day (observed)"),
+        )
+        self.assertIsNotNone(self.hb.previous_holiday())
+        self.assertIsNone(HolidayBase().previous_holiday("2014-01-01"))
+        self.assertIsNone(self.hb.previous_holiday(date.min))
+
+        hb = CountryStub1(years=(2014, 2020), expand=False)
+        self.assertEqual(hb.previous_holiday("2020-01-01"), (date(2014, 12, 25), "Christmas Day"))
+        self.assertIsNone(hb.previous_holiday("2014-01-01"))
+
+
 class TestKeyTransforms(unittest.TestCase):
     def setUp(self):
         self.hb = CountryStub1()
@@ -745,6 +1362,24 @@ class TestKeyTransforms(unittest.TestCase):
         self.assertNotIn("2014-03-01", self.hb)
         self.assertEqual(self.hb.pop("01/03/2014"), "Fake Holiday")
 
+    def test_string_iso(self):
+        for key in (
+            "2014-01-01",
+            "2014-01-01T13:45",
+            "2014-01-01 13:45:30.123",
+            "2014-01-01T23:45:00+05:00",
+            "2014-01-01T23:45:00Z",
+            "20140101",
+        ):
+            self.assertIn(key, self.hb)
+            self.assertEqual(self.hb[key], "New Year's Day")
+
+        for key in ("2014-01-02", "2014-01-02T00:00:00", "2014-02-01 00:00"):
+            self.assertNotIn(key, self.hb)
+
+        self.assertRaises(ValueError, lambda: "2014-02-30" in self.hb)
+        self.assertRaises(ValueError, lambda: "2014-13-01T00:00" in self.hb)
+
     def test_timestamp(self):
         self.assertIn(1388552400, self.hb)
         self.assertEqual(self.hb[1388552400], "New Year's Day")
@@ -757,6 +1392,81 @@ class TestKeyTransforms(unittest.TestCase):
         self.assertNotIn(1388725201, self.hb)
 
 
+class TestObservedViews(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1(years=range(2020, 2024))
+
+    def test_categories(self):
+        for cls, kwargs in (
+            (HK, {"categories": (OPTIONAL, PUBLIC), "years": range(2018, 2025)}),
+            (
+                US,
+                {
+                    "categories": US.supported_categories,
+                    "subdiv": "MA",
+                    "years": range(2018, 2025),
+                },
+            ),
+        ):
+            actual_hb = cls(language="en_US", observed=False, **kwargs)
+            observed_hb = actual_hb.observed_view()
+            self.assertDictEqual(observed_hb, cls(language="en_US", **kwargs))
+            self.assertDictEqual(observed_hb.actual_view(), actual_hb)
+            self.assertDictEqual(
+                cls(language="en_US", **kwargs).actual_view(),
+                cls(language="en_US", observed=False, **kwargs),
+            )
+
+        us = US(
+            categories=US.supported_categories,
+            language="en_US",
+            observed=False,
+            subdiv="MA",
+            years=2019,
+        )
+        self.assertListEqual(
+            us.observed_view().get_list("2019-03-18"),
+            ["Evacuation Day (observed)", "St. Patrick's Day (observed)"],
+        )
+
+    def test_views(self):
+        actual_hb = self.hb.actual_view()
+        observed_hb = self.hb.observed_view()
+        self.assertFalse(actual_hb.observed)
+        self.assertTrue(observed_hb.observed)
+        self.assertTrue(self.hb.observed)
+        self.assertEqual(actual_hb, CountryStub1(years=range(2020, 2024), observed=False))
+        self.assertEqual(observed_hb, self.hb)
+        self.assertIn("2021-12-31", observed_hb)
+        self.assertNotIn("2021-12-31", actual_hb)
+
+        # The layers are shared and computed once per observed value.
+        self.assertIs(actual_hb._populate_layers, self.hb._populate_layers)
+        self.assertIs(observed_hb._populate_layers, self.hb._populate_layers)
+        self.assertEqual(len(self.hb._populate_layers), 4)
+        actual_hb.observed = True
+        self.assertEqual(len(self.hb._populate_layers), 8)
+        self.assertEqual(actual_hb, self.hb)
+        observed_hb.observed = False
+        self.hb.actual_view()
+        self.assertEqual(len(self.hb._populate_layers), 8)
+
+    def test_expand(self):
+        actual_hb = self.hb.actual_view()
+        observed_hb = self.hb.observed_view()
+        for hb in (actual_hb, observed_hb):
+            self.assertIn("2025-01-01", hb)
+        self.assertSetEqual(self.hb.years, set(range(2020, 2024)))
+        self.assertEqual(len(self.hb._populate_layers), 6)
+
+        actual_hb.observed = True
+        self.assertEqual(len(self.hb._populate_layers), 10)
+        self.assertEqual(actual_hb, observed_hb)
+        observed_hb.observed = False
+        self.assertEqual(len(self.hb._populate_layers), 10)
+        self.assertEqual(actual_hb, CountryStub1(years=(*range(2020, 2024), 2025), observed=True))
+
+
 class TestPop(unittest.TestCase):
     def setUp(self):
         self.hb = CountryStub1()
@@ -864,6 +1574,52 @@ class TestSerialization(unittest.TestCase):
         self.assertEqual(loaded_holidays, self.hb)
         self.assertIn(dt, self.hb)
 
+    def test_copy(self):
+        self.hb._populate(2020)
+        hb_copy = self.hb.copy()
+        self.assertEqual(hb_copy, self.hb)
+
+        hb_copy["2020-07-10"] = "Custom holiday"
+        self.assertIn("2020-07-10", hb_copy)
+        self.assertNotIn("2020-07-10", self.hb)
+
+    def test_from_bytes(self):
+        self.hb.update({"2020-07-10": "Custom holiday"})
+        self.hb._populate(2021)
+        loaded_holidays = CountryStub1.from_bytes(self.hb.to_bytes())
+        self.assertEqual(loaded_holidays, self.hb)
+        self.assertEqual(list(loaded_holidays.items()), list(self.hb.items()))
+        self.assertEqual(loaded_holidays.years, {2020, 2021})
+        self.assertEqual(loaded_holidays.get("2020-07-10"), "Custom holiday")
+
+        # The serialized years aren't populated again.
+        with mock.patch.object(CountryStub1, "_populate") as populate:
+            loaded_holidays = HolidayBase.from_bytes(self.hb.to_bytes())
+            self.assertIn("2020-01-01", loaded_holidays)
+            populate.assert_not_called()
+
+    def test_from_bytes_wrong_class(self):
+        self.assertRaises(TypeError, lambda: CountryStub2.from_bytes(self.hb.to_bytes()))
+
+    def test_pickle_holiday_sum(self):
+        hb_sum = CountryStub1(years=2020) + CountryStub2(years=2020)
+        loaded_holidays = pickle.loads(pickle.dumps(hb_sum))
+        self.assertEqual(loaded_holidays, hb_sum)
+        self.assertEqual(len(loaded_holidays.holidays), 2)
+
+    def test_pickle_size(self):
+        self.hb = CountryStub1(years=range(1950, 2051))
+        self.assertLess(len(self.hb.to_bytes()), len(pickle.dumps(self.hb)))
+
+    def test_pickle_translation(self):
+        ua_holidays = UA(language="en_US", years=2020)
+        self.assertNotIn("tr", ua_holidays.__reduce__()[1][1])
+
+        loaded_holidays = pickle.loads(pickle.dumps(ua_holidays))
+        self.assertEqual(loaded_holidays, ua_holidays)
+        self.assertEqual(loaded_holidays.get("2020-01-01"), ua_holidays.get("2020-01-01"))
+        self.assertEqual(loaded_holidays.tr("Новий рік"), "New Year's Day")
+
 
 class TestSpecialHolidays(unittest.TestCase):
     def setUp(self):
@@ -1005,6 +1761,35 @@ class TestStandardMethods(unittest.TestCase):
         self.assertRaises(TypeError, lambda: self.hb["2014-01-01":"2014-01-02":""])
         self.assertRaises(ValueError, lambda: self.hb["2014-01-01":"2014-01-02":0])
 
+    def test_getitem_slice_index(self):
+        holidays_2010_2015 = self.hb["2010-01-01":"2016-01-01"]
+        self.assertSetEqual(self.hb.years, set(range(2010, 2017)))
+        self.assertListEqual(
+            holidays_2010_2015, sorted(dt for dt in self.hb if 2010 <= dt.year <= 2015)
+        )
+        self.assertListEqual(
+            self.hb["2015-12-31":"2009-12-31":-1], list(reversed(holidays_2010_2015))
+        )
+        self.assertListEqual(
+            self.hb["2010-01-01" : "2016-01-01" : td(days=730)],
+            [date(2010, 1, 1), date(2012, 1, 1)],
+        )
+
+        self.hb["2014-02-03"] = "Custom Holiday"
+        self.hb["2014-02-03"] = "Another Custom Holiday"
+        del self.hb["2014-01-01"]
+        self.assertListEqual(self.hb["2014-02-28":"2013-12-31":-1], [date(2014, 2, 3)])
+        self.hb.pop("2014-02-03")
+        self.assertListEqual(self.hb["2014-01-01":"2014-03-01"], [])
+        self.hb.clear()
+        self.assertListEqual(self.hb["2014-01-01":"2014-12-31"], [])
+
+        hb = CountryStub1()
+        self.assertListEqual(
+            hb["2010-01-01" : "2016-01-01" : td(days=730)], [date(2010, 1, 1), date(2012, 1, 1)]
+        )
+        self.assertSetEqual(hb.years, {2010, 2012, 2013, 2015, 2016})
+
     def test_radd(self):
         self.assertRaises(TypeError, lambda: 1 + CountryStub1())
 
@@ -1136,6 +1921,116 @@ class TestSubstitutedHolidays(unittest.TestCase):
         self.assertRaises(ValueError, lambda: self.CountryStub(SubstitutedHolidays))
 
 
+class TestThreadSafety(unittest.TestCase):
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        # Switch threads as often as possible to surface races.
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_concurrent_expansion(self):
+        # Belarus moves working days to the weekends around its holidays.
+        expected = BY(years=range(1998, 2102))
+        rnd = random.Random(0)
+        checks = []
+        for _ in range(8):
+            thread_checks = []
+            for _ in range(200):
+                start = date(rnd.randint(1998, 2100), 1, 1) + td(days=rnd.randint(0, 364))
+                end = start + td(days=rnd.randint(0, 60))
+                n = rnd.randint(-30, 30)
+                thread_checks.append(
+                    (
+                        start,
+                        end,
+                        n,
+                        expected.get(start),
+                        expected.is_workday(start),
+                        expected.get_workdays_number(start, end),
+                        expected.get_nth_workday(start, n),
+                        expected[start:end],
+                    )
+                )
+            checks.append(thread_checks)
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def lookup(hb, thread_checks):
+            barrier.wait()
+            try:
+                for start, end, n, *results in thread_checks:
+                    if [
+                        hb.get(start),
+                        hb.is_workday(start),
+                        hb.get_workdays_number(start, end),
+                        hb.get_nth_workday(start, n),
+                        hb[start:end],
+                    ] != results:
+                        errors.append(start)
+            except Exception as e:
+                errors.append(e)
+
+        for _ in range(5):
+            hb = BY(thread_safe=True)
+            threads = [threading.Thread(target=lookup, args=(hb, c)) for c in checks]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertListEqual(errors, [])
+            self.assertEqual(hb, BY(thread_safe=True, years=hb.years))
+            self.assertSetEqual(hb.weekend_workdays, BY(years=hb.years).weekend_workdays)
+
+    def test_copy_pickle(self):
+        hb = CountryStub1(thread_safe=True, years=2024)
+        for hb_copy in (hb.copy(), pickle.loads(pickle.dumps(hb))):
+            self.assertTrue(hb_copy.thread_safe)
+            self.assertIsNotNone(hb_copy._populate_lock)
+            self.assertIsNot(hb_copy._populate_lock, hb._populate_lock)
+            self.assertIn("2025-01-01", hb_copy)
+            self.assertSetEqual(hb_copy.years, {2024, 2025})
+
+    def test_max_years(self):
+        # Evicting a year could race with another thread reading it.
+        self.assertRaises(ValueError, lambda: CountryStub1(max_years=2, thread_safe=True))
+        self.assertRaises(ValueError, lambda: UA(max_years=2, thread_safe=True))
+
+        # Each thread using its own object with evictable years.
+        expected = CountryStub1(years=range(1950, 2051))
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def lookup(seed):
+            hb = CountryStub1(max_years=3)
+            rnd = random.Random(seed)
+            barrier.wait()
+            for _ in range(1000):
+                dt = date(rnd.randint(1950, 2050), 1, 1) + td(days=rnd.randint(0, 364))
+                if hb.get(dt) != expected.get(dt):
+                    errors.append(dt)
+            if len(hb.years) > 3:
+                errors.append(hb.years)
+
+        threads = [threading.Thread(target=lookup, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+
+    def test_nested_population(self):
+        hb = CountryStub1(thread_safe=True)
+        # 2022-01-01 is observed on 2021-12-31 while populating 2021.
+        self.assertIn("2021-12-31", hb)
+        self.assertIn("2022-01-01", hb)
+        self.assertSetEqual(hb.years, {2021, 2022})
+        self.assertSetEqual(hb._populating_years, set())
+
+
 class TestWorkdays(unittest.TestCase):
     def setUp(self):
         self.hb = CountryStub6(years=2024)
@@ -1174,6 +2069,50 @@ class TestWorkdays(unittest.TestCase):
         self.assertEqual(self.hb.get_nth_workday("2024-05-10", -7), date(2024, 4, 29))
         self.assertEqual(self.hb.get_nth_workday("2024-05-10", -5), date(2024, 5, 3))
 
+    def test_get_nth_workday_index(self):
+        hb = CountryStub6(years=range(2010, 2041))
+        for dt in (date(2024, 1, 4), date(2024, 12, 31), date(2025, 1, 1), date(2024, 2, 24)):
+            for n in range(-800, 800, 7):
+                day = dt
+                for _ in range(abs(n)):
+                    day += td(days=1 if n > 0 else -1)
+                    while not hb.is_workday(day):
+                        day += td(days=1 if n > 0 else -1)
+                self.assertEqual(hb.get_nth_workday(dt, n), day, (dt, n))
+
+    def test_get_nth_workday_next_year_substituted_holidays(self):
+        class SubstitutedHolidays:
+            special_public_holidays = {
+                2025: (JAN, 2, DEC, 28, 2024),
+            }
+            substituted_date_format = "%d/%m/%Y"
+            substituted_label = "From %s"
+
+        class CountryStub(CountryStub6):
+            def __init__(self, *args, **kwargs) -> None:
+                StaticHolidays.__init__(self, cls=SubstitutedHolidays)
+                HolidayBase.__init__(self, *args, **kwargs)
+
+        # 2024-12-28 is a Saturday moved to 2025-01-02 by the next year rules.
+        hb = CountryStub()
+        self.assertEqual(hb.get_nth_workday("2024-12-27", +1), date(2024, 12, 28))
+        self.assertEqual(hb.get_nth_workday("2024-12-30", -1), date(2024, 12, 28))
+        self.assertEqual(hb.get_workdays_number("2024-12-27", "2024-12-30"), 2)
+        self.assertTrue(hb.is_workday("2024-12-28"))
+        self.assertSetEqual(hb.years, {2024})
+        self.assertFalse(hb.is_workday("2025-01-02"))
+        self.assertSetEqual(hb.years, {2024, 2025})
+        self.assertIn(date(2024, 12, 28), hb.weekend_workdays)
+        self.assertEqual(hb.get_workdays_number("2024-12-27", "2024-12-30"), 2)
+
+        # The lookahead doesn't change the object.
+        hb = CountryStub()
+        self.assertTrue(hb.is_workday("2024-12-28"))
+        self.assertEqual(hb.get_nth_workday("2024-12-27", +1), date(2024, 12, 28))
+        self.assertSetEqual(hb.years, {2024})
+        self.assertEqual(len(hb), len(CountryStub(years=2024)))
+        self.assertSetEqual(hb.weekend_workdays, set())
+
     def test_get_workdays_number(self):
         self.assertEqual(self.hb.get_workdays_number("2024-01-03", "2024-01-23"), 14)
         self.assertEqual(self.hb.get_workdays_number("2024-01-23", "2024-01-03"), 14)
@@ -1188,3 +2127,99 @@ class TestWorkdays(unittest.TestCase):
         self.assertEqual(self.hb.get_workdays_number("2024-04-29", "2024-05-04"), 2)
         self.assertEqual(self.hb.get_workdays_number("2024-04-29", "2024-05-05"), 2)
         self.assertEqual(self.hb.get_workdays_number("2024-04-29", "2024-05-06"), 3)
+
+    def test_get_workdays_number_index(self):
+        hb = CountryStub6()
+        self.assertEqual(hb.get_workdays_number("2023-12-29", "2025-01-02"), 256)
+        self.assertEqual(hb.get_workdays_number("2025-01-02", "2023-12-29"), 256)
+        self.assertEqual(
+            hb.get_workdays_number("1990-01-01", "2030-01-01"),
+            sum(hb.is_workday(date(1990, 1, 1) + td(days=n)) for n in range(1, 14611)),
+        )
+        # The following year is looked ahead without populating it.
+        self.assertSetEqual(hb.years, set(range(1990, 2031)))
+
+        # Holidays changes.
+        self.assertEqual(hb.get_workdays_number("2024-02-05", "2024-02-09"), 4)
+        hb["2024-02-07"] = "Custom holiday"
+        self.assertEqual(hb.get_workdays_number("2024-02-05", "2024-02-09"), 3)
+        hb.pop("2024-02-07")
+        self.assertEqual(hb.get_workdays_number("2024-02-05", "2024-02-09"), 4)
+
+        # Weekend changes.
+        hb.weekend = {SUN}
+        self.assertEqual(hb.get_workdays_number("2024-02-05", "2024-02-12"), 6)
+        hb.weekend_workdays = {date(2024, 2, 11)}
+        self.assertEqual(hb.get_workdays_number("2024-02-05", "2024-02-12"), 7)
+
+        # Not expanded years.
+        hb = CountryStub6(years=2024, expand=False)
+        self.assertEqual(hb.get_workdays_number("2024-12-31", "2025-01-02"), 2)
+        self.assertSetEqual(hb.years, {2024})
+
+
+class TestYearCache(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1(max_years=2)
+
+    def test_eviction(self):
+        self.assertIn("2014-01-01", self.hb)
+        self.assertIn("2015-01-01", self.hb)
+        self.assertIn("2014-07-04", self.hb)
+        self.assertIn("2016-01-01", self.hb)
+        self.assertSetEqual(self.hb.years, {2014, 2016})
+        self.assertFalse(any(dt.year == 2015 for dt in self.hb))
+
+        # Evicted years are populated again transparently.
+        self.assertEqual(self.hb["2015-07-04"], "Independence Day")
+        self.assertSetEqual(self.hb.years, {2015, 2016})
+        self.assertEqual(self.hb.year_cache_info(), (1, 4, 2, 2, 2))
+
+    def test_adjacent_years(self):
+        class YearEndStub(HolidayBase):
+            def _populate(self, year):
+                super()._populate(year)
+                self._add_holiday_dec_31("New Year's Eve")
+                if year - 1 in self.years:
+                    self[date(year - 1, 12, 31)] = "New Year's Eve"
+
+        hb = YearEndStub(max_years=2)
+        for year in (2021, 2022, 2023):
+            self.assertIn(f"{year}-12-31", hb)
+        self.assertSetEqual(hb.years, {2022, 2023})
+        # Kept as also added by populating 2022.
+        self.assertListEqual(
+            sorted(hb), [date(2021, 12, 31), date(2022, 12, 31), date(2023, 12, 31)]
+        )
+
+        self.assertIn("2024-12-31", hb)
+        self.assertSetEqual(hb.years, {2023, 2024})
+        self.assertListEqual(
+            sorted(hb), [date(2022, 12, 31), date(2023, 12, 31), date(2024, 12, 31)]
+        )
+
+    def test_multiple_names(self):
+        self.hb["2014-07-04"] = "Custom Holiday"
+        self.assertIn("2015-01-01", self.hb)
+        self.assertIn("2016-01-01", self.hb)
+        self.assertSetEqual(self.hb.years, {2015, 2016})
+        # Holidays added outside of population are kept.
+        self.assertEqual(dict.get(self.hb, date(2014, 7, 4)), "Custom Holiday")
+        self.assertEqual(self.hb["2014-07-04"], "Custom Holiday; Independence Day")
+
+    def test_no_limit(self):
+        hb = CountryStub1(years=range(2010, 2020))
+        self.assertSetEqual(hb.years, set(range(2010, 2020)))
+        self.assertEqual(hb.year_cache_info(), (0, 0, 0, None, 0))
+
+    def test_weekend_workdays(self):
+        hb = CountryStub6(max_years=1)
+        self.assertIn("2024-02-19", hb)
+        self.assertSetEqual(hb.weekend_workdays, {date(2024, 2, 24)})
+        self.assertFalse(hb.is_workday("2024-02-19"))
+        self.assertTrue(hb.is_workday("2024-02-24"))
+
+        self.assertIn("2025-01-01", hb)
+        self.assertSetEqual(hb.weekend_workdays, set())
+        self.assertTrue(hb.is_workday("2024-02-24"))
+        self.assertSetEqual(hb.years, {2024})
@@ -10,6 +10,9 @@
 #  Website: https://github.com/vacanza/python-holidays
 #  License: MIT (see LICENSE file)
 
+import subprocess
+import sys
+from pathlib import Path
 from unittest import TestCase
 
 import holidays
@@ -36,6 +39,41 @@ class TestHolidaysImports(TestCase):
         for name in ("DateLike", "HolidayBase", "HolidaySum"):
             self.assertImport(name)
 
+    def _get_import_times(self):
+        """Return the `import holidays` cumulative import times by module."""
+        result = subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", "import holidays"),
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parents[1],
+            text=True,
+        )
+        # Lines of `import time: <self us> | <cumulative us> | <module name>` format.
+        import_times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative_time, name = line.split("|")
+            if cumulative_time.strip().isdigit():
+                import_times[name.strip()] = int(cumulative_time)
+
+        return import_times
+
+    def test_deferred_imports(self):
+        # Imported on the first use only.
+        import_times = self._get_import_times()
+        for name in (
+            "dateutil.parser",
+            "gettext",
+            "holidays.countries",
+            "holidays.financial",
+            "json",
+            "pickle",
+            "sqlite3",
+            "zlib",
+        ):
+            self.assertNotIn(name, import_times, f"`import holidays` imports {name}")
+
     def test_utils(self):
         for name in (
             "country_holidays",
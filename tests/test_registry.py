@@ -42,9 +42,9 @@ class TestEntityLoader(TestCase):
                 self.assertIsNotNone(loader_cls, entity)
                 self.assertIsNotNone(module_cls, entity)
                 self.assertEqual(countries_cls, module_cls)
-                self.assertIsInstance(loader_cls, registry.EntityLoader)
+                self.assertIs(loader_cls, module_cls)
+                self.assertIs(holidays.__dict__[entity], module_cls)
                 self.assertIsInstance(loader_cls(), countries_cls)
-                self.assertIsInstance(loader_cls(), module_cls)
 
                 loader_entities.add(loader_cls.__name__)
 
@@ -70,6 +70,30 @@ class TestEntityLoader(TestCase):
         PYTHON_VERSION != PYTHON_LATEST_SUPPORTED_VERSION,
         reason="Run once on the latest Python version only",
     )
+    def test_entity_modules(self):
+        self.assertEqual(
+            len(registry.ENTITY_MODULES),
+            sum(len(entities) for entities in registry.COUNTRIES.values())
+            + sum(len(entities) for entities in registry.FINANCIAL.values()),
+        )
+        self.assertEqual(registry.ENTITY_MODULES["US"], "holidays.countries.united_states")
+        self.assertEqual(registry.ENTITY_MODULES["XNYS"], "holidays.financial.ny_stock_exchange")
+
+        self.assertIn("UnitedStates", dir(holidays))
+        self.assertIn("NYSE", holidays.__all__)
+        self.assertIn("HolidayBase", holidays.__all__)
+        for name in ("ENTITY_MODULES", "IMPORT_LOCK", "importlib", "registry", "warnings"):
+            self.assertNotIn(name, holidays.__all__)
+        self.assertEqual(len(holidays.__all__), len(set(holidays.__all__)))
+        self.assertSetEqual(
+            set(holidays.constants.__all__),
+            {name for name in vars(holidays.constants) if not name.startswith("_")},
+        )
+        for name in holidays.__all__:
+            self.assertTrue(hasattr(holidays, name), name)
+        self.assertRaises(AttributeError, lambda: holidays.XX)
+        self.assertFalse(hasattr(holidays, "united_states"))
+
     def test_financial_imports(self):
         loader_entities = set()
         for module, entities in registry.FINANCIAL.items():
@@ -83,9 +107,9 @@ class TestEntityLoader(TestCase):
                 self.assertIsNotNone(loader_cls, entity)
                 self.assertIsNotNone(module_cls, entity)
                 self.assertEqual(financial_cls, module_cls)
-                self.assertIsInstance(loader_cls, registry.EntityLoader)
+                self.assertIs(loader_cls, module_cls)
+                self.assertIs(holidays.__dict__[entity], module_cls)
                 self.assertIsInstance(loader_cls(), financial_cls)
-                self.assertIsInstance(loader_cls(), module_cls)
 
                 loader_entities.add(loader_cls.__name__)
 
@@ -115,12 +139,10 @@ class TestEntityLoader(TestCase):
 
             return SubClass()
 
-        for cls in (holidays.UnitedStates, holidays.US, holidays.USA):
-            self.assertIsInstance(cls, holidays.registry.EntityLoader)
-            with self.assertRaises(TypeError):
-                create_instance(cls)
-
         for cls in (
+            holidays.UnitedStates,
+            holidays.US,
+            holidays.USA,
             holidays.countries.UnitedStates,
             holidays.countries.US,
             holidays.countries.USA,
@@ -0,0 +1,72 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/python-holidays
+#  License: MIT (see LICENSE file)
+
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from holidays.constants import PUBLIC, UNOFFICIAL
+from holidays.countries import Germany, UnitedStates
+from holidays.reverse_index import IndexEntry, ReverseIndex
+
+
+class TestReverseIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.index = ReverseIndex.build(range(2023, 2025), countries=("DE", "US"), markets=())
+
+    def test_build(self):
+        self.assertTupleEqual(self.index.years, (2023, 2024))
+        for dt in Germany(subdiv="BE", years=2024):
+            self.assertIn(IndexEntry("DE", "BE", PUBLIC), self.index[dt])
+        for dt in UnitedStates(years=2023):
+            self.assertIn(IndexEntry("US", None, PUBLIC), self.index[dt])
+        self.assertIn(IndexEntry("US", None, UNOFFICIAL), self.index["2024-10-31"])
+
+        self.assertRaises(ValueError, lambda: ReverseIndex.build(()))
+        self.assertRaises(ValueError, lambda: ReverseIndex.build(2024, countries=("XX",)))
+        self.assertRaises(ValueError, lambda: ReverseIndex.build(2024, markets=("XXXX",)))
+
+        index = ReverseIndex.build(2024, countries=(), markets=("NYSE",))
+        self.assertSetEqual(index.get_codes("2024-07-04"), {"NYSE"})
+        self.assertSetEqual(index.get_codes("2024-10-03"), set())
+
+    def test_get(self):
+        self.assertIn("2024-10-03", self.index)
+        self.assertNotIn("2024-10-04", self.index)
+        self.assertEqual(self.index.get("2024-10-04"), frozenset())
+        self.assertRaises(KeyError, lambda: self.index.get("2025-01-01"))
+        self.assertNotIn("2022-12-31", self.index)
+
+        codes = self.index.get_codes(date(2024, 10, 3))
+        self.assertIn("DE", codes)
+        self.assertNotIn("US", codes)
+        self.assertSetEqual(
+            self.index.get_codes("2024-11-01", category=PUBLIC),
+            {"DE-BW", "DE-BY", "DE-BYP", "DE-NW", "DE-RP", "DE-SL", "US-VI"},
+        )
+        codes = self.index.get_codes("2024-10-31", category=UNOFFICIAL)
+        self.assertIn("US", codes)
+        self.assertIn("US-CA", codes)
+        self.assertNotIn("DE-BB", codes)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "index.json"
+            self.index.save(path)
+            index = ReverseIndex.load(path)
+
+        self.assertEqual(index, self.index)
+        self.assertEqual(len(index), len(self.index))
+        self.assertEqual(index["2024-10-03"], self.index["2024-10-03"])
+        self.assertNotEqual(index, ReverseIndex({}, index.years))
@@ -10,8 +10,11 @@
 #  Website: https://github.com/vacanza/python-holidays
 #  License: MIT (see LICENSE file)
 
+import sqlite3
+import tempfile
 import unittest
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
 from unittest import mock
@@ -19,14 +22,27 @@ from unittest import mock
 import pytest
 
 import holidays
+from holidays import holiday_base
+from holidays.calendars.gregorian import THU, FRI, CHRISTMAS, WINTER_SOLSTICE
+from holidays.countries import Belarus, UnitedStates
 from holidays.utils import (
     CountryHoliday,
+    clear_populate_cache,
+    closed_count,
     country_holidays,
+    disable_parse_cache,
+    disable_populate_cache,
+    enable_parse_cache,
+    enable_populate_cache,
     financial_holidays,
+    get_parse_cache_info,
+    get_populate_cache_info,
+    intersection,
     list_localized_countries,
     list_localized_financial,
     list_supported_countries,
     list_supported_financial,
+    union,
 )
 from tests.common import PYTHON_LATEST_SUPPORTED_VERSION, PYTHON_VERSION
 
@@ -140,6 +156,267 @@ class TestAllInSameYear(unittest.TestCase):
         self.assertEqual(self.years, financial_holidays(market, years=self.years).years)
 
 
+class TestParseCache(unittest.TestCase):
+    def tearDown(self):
+        disable_parse_cache()
+
+    def test_parse_cache(self):
+        self.assertIsNone(get_parse_cache_info())
+
+        enable_parse_cache(maxsize=2)
+        us_holidays = holidays.US(years=2024)
+        for key in ("2024-07-04", "07/04/2024", "2024-07-04", "2024-07-05", "07/04/2024"):
+            us_holidays.get(key)
+
+        cache_info = get_parse_cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 4)
+        self.assertEqual(cache_info.maxsize, 2)
+        self.assertEqual(cache_info.currsize, 2)
+        self.assertIn("2024-07-04", us_holidays)
+        self.assertNotIn("2024-07-05", us_holidays)
+        self.assertRaises(ValueError, lambda: "abc" in us_holidays)
+
+        disable_parse_cache()
+        self.assertIsNone(get_parse_cache_info())
+        self.assertIn("07/04/2024", us_holidays)
+
+
+def _populate_persistent(path, year):
+    enable_populate_cache(persistent=True, path=path)
+    return dict(country_holidays("US", subdiv="CA", years=year))
+
+
+class TestPopulateCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "cache" / "populate_cache.sqlite3"
+
+    def tearDown(self):
+        disable_populate_cache()
+        self.tmp_dir.cleanup()
+
+    def _count_stored(self):
+        with sqlite3.connect(self.path) as connection:
+            return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def test_populate_cache(self):
+        self.assertIsNone(get_populate_cache_info())
+
+        enable_populate_cache(maxsize=3)
+        us_holidays = country_holidays("US", subdiv="CA", years=2024)
+        self.assertTupleEqual(get_populate_cache_info(), (0, 1, 0, 3, 1))
+        self.assertDictEqual(us_holidays, country_holidays("US", subdiv="CA", years=2024))
+        self.assertTupleEqual(get_populate_cache_info(), (1, 1, 0, 3, 1))
+
+        # Expansions use the cache too.
+        self.assertIn("2024-07-04", country_holidays("US", subdiv="CA"))
+        self.assertTupleEqual(get_populate_cache_info(), (2, 1, 0, 3, 1))
+
+        # Different options are cached separately.
+        for kwargs in (
+            {"subdiv": "NY"},
+            {"subdiv": "CA", "observed": False},
+            {"subdiv": "CA", "language": "th"},
+        ):
+            holidays_2023 = country_holidays("US", years=2023, **kwargs)
+            disable_populate_cache()
+            self.assertDictEqual(holidays_2023, country_holidays("US", years=2023, **kwargs))
+            enable_populate_cache(maxsize=3)
+        country_holidays("US", subdiv="CA", years=range(2022, 2026))
+        self.assertTupleEqual(get_populate_cache_info(), (0, 4, 1, 3, 3))
+
+        clear_populate_cache()
+        self.assertTupleEqual(get_populate_cache_info(), (0, 0, 0, 3, 0))
+
+        disable_populate_cache()
+        self.assertIsNone(get_populate_cache_info())
+        clear_populate_cache()
+
+    def test_entity_options(self):
+        enable_populate_cache()
+        self.assertNotEqual(
+            holidays.HK(preferred_discretionary_holidays=(CHRISTMAS,), years=2023),
+            holidays.HK(preferred_discretionary_holidays=(WINTER_SOLSTICE,), years=2023),
+        )
+        self.assertEqual(get_populate_cache_info().misses, 2)
+        self.assertNotEqual(
+            holidays.NO(include_sundays=True, years=2023),
+            holidays.NO(include_sundays=False, years=2023),
+        )
+        self.assertEqual(get_populate_cache_info().misses, 4)
+
+        # The sum operands are cached on their own.
+        country_holidays("US", years=2024) + country_holidays("CA", years=2024)
+        self.assertEqual(get_populate_cache_info().misses, 6)
+
+    def test_weekend_workdays(self):
+        by_holidays = country_holidays("BY", years=range(2015, 2025))
+
+        enable_populate_cache()
+        country_holidays("BY", years=range(2015, 2025))
+        cached_by_holidays = country_holidays("BY", years=range(2015, 2025))
+        self.assertEqual(get_populate_cache_info().hits, 10)
+        self.assertDictEqual(cached_by_holidays, by_holidays)
+        self.assertSetEqual(cached_by_holidays.weekend_workdays, by_holidays.weekend_workdays)
+        self.assertEqual(
+            cached_by_holidays.get_workdays_number("2015-01-01", "2024-12-31"),
+            by_holidays.get_workdays_number("2015-01-01", "2024-12-31"),
+        )
+
+    def test_weekend(self):
+        # Entities changing the weekend days (and the observed rules) while
+        # populating the years.
+        entities = (
+            (holidays.MY, {"subdiv": "01", "years": 2023}, "2023-01-06"),
+            (holidays.SA, {"years": 2010}, "2010-01-07"),
+            (holidays.SA, {"years": range(2010, 2016)}, "2014-01-03"),
+        )
+        expected = [entity_cls(**kwargs) for entity_cls, kwargs, _ in entities]
+
+        enable_populate_cache()
+        for _ in range(2):
+            for (entity_cls, kwargs, dt), entity_holidays in zip(entities, expected):
+                cached_holidays = entity_cls(**kwargs)
+                self.assertSetEqual(cached_holidays.weekend, entity_holidays.weekend)
+                self.assertEqual(cached_holidays._observed_rule, entity_holidays._observed_rule)
+                self.assertEqual(cached_holidays, entity_holidays)
+                self.assertFalse(cached_holidays.is_workday(dt))
+                self.assertEqual(
+                    cached_holidays.get_workdays_number(f"{dt[:4]}-01-01", f"{dt[:4]}-12-31"),
+                    entity_holidays.get_workdays_number(f"{dt[:4]}-01-01", f"{dt[:4]}-12-31"),
+                )
+        self.assertEqual(get_populate_cache_info().misses, 8)
+
+        my_holidays = holidays.MY(subdiv="01", years=2023)
+        my_holidays.observed = False
+        self.assertSetEqual(my_holidays.weekend, expected[0].weekend)
+
+    def test_persistent(self):
+        by_holidays = country_holidays("BY", years=range(2015, 2025))
+        th_holidays = country_holidays("US", subdiv="CA", years=2024, language="th")
+
+        enable_populate_cache(persistent=True, path=self.path)
+        country_holidays("BY", years=range(2015, 2025))
+        country_holidays("US", subdiv="CA", years=2024, language="th")
+        self.assertEqual(get_populate_cache_info().misses, 11)
+        self.assertEqual(self._count_stored(), 11)
+
+        # A new cache loads the stored years instead of populating them.
+        enable_populate_cache(persistent=True, path=self.path)
+        with mock.patch.object(Belarus, "_populate") as populate:
+            cached_by_holidays = country_holidays("BY", years=range(2015, 2025))
+            populate.assert_not_called()
+        self.assertDictEqual(cached_by_holidays, by_holidays)
+        self.assertSetEqual(cached_by_holidays.weekend_workdays, by_holidays.weekend_workdays)
+        self.assertDictEqual(
+            country_holidays("US", subdiv="CA", years=2024, language="th"), th_holidays
+        )
+        self.assertTupleEqual(get_populate_cache_info(), (11, 0, 0, 1024, 11))
+
+        # Different options are stored separately.
+        country_holidays("US", subdiv="CA", years=2024, observed=False)
+        self.assertEqual(self._count_stored(), 12)
+
+        # Custom entity classes aren't stored.
+        class CustomHolidays(UnitedStates):
+            pass
+
+        CustomHolidays(years=2024)
+        self.assertEqual(self._count_stored(), 12)
+
+        clear_populate_cache()
+        self.assertEqual(self._count_stored(), 0)
+
+    def test_persistent_default_path(self):
+        self.path = self.path.with_name(f"populate_cache-{holidays.__version__}.sqlite3")
+        with mock.patch("holidays.utils._get_cache_dir", return_value=self.path.parent):
+            enable_populate_cache(persistent=True)
+        country_holidays("US", years=2024)
+        self.assertEqual(self._count_stored(), 1)
+
+    def test_persistent_errors(self):
+        enable_populate_cache(persistent=True, path=self.path)
+        with mock.patch.object(
+            holiday_base._PopulateCacheStore,
+            "_connect",
+            side_effect=sqlite3.OperationalError("database is locked"),
+        ):
+            us_holidays = country_holidays("US", years=2024)
+            clear_populate_cache()
+            self.assertEqual(self._count_stored(), 0)
+        disable_populate_cache()
+        self.assertDictEqual(us_holidays, country_holidays("US", years=2024))
+
+    def test_persistent_processes(self):
+        years = range(2020, 2024)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_populate_persistent, [self.path] * len(years), years))
+        self.assertEqual(self._count_stored(), len(years))
+
+        enable_populate_cache(persistent=True, path=self.path)
+        for year, result in zip(years, results):
+            self.assertDictEqual(dict(country_holidays("US", subdiv="CA", years=year)), result)
+        self.assertEqual(get_populate_cache_info().misses, 0)
+
+    def test_persistent_version(self):
+        enable_populate_cache(persistent=True, path=self.path)
+        country_holidays("US", years=2024)
+
+        with mock.patch("holidays.__version__", "0.0"):
+            enable_populate_cache(persistent=True, path=self.path)
+        country_holidays("US", years=2024)
+        self.assertEqual(get_populate_cache_info().misses, 1)
+        self.assertEqual(self._count_stored(), 2)
+
+        # The other versions results are kept.
+        enable_populate_cache(persistent=True, path=self.path)
+        country_holidays("US", years=2024)
+        self.assertEqual(get_populate_cache_info().misses, 0)
+        self.assertEqual(self._count_stored(), 2)
+
+    def test_persistent_weekend(self):
+        sa_holidays = holidays.SA(years=range(2010, 2016))
+
+        enable_populate_cache(persistent=True, path=self.path)
+        holidays.SA(years=range(2010, 2016))
+
+        enable_populate_cache(persistent=True, path=self.path)
+        cached_sa_holidays = holidays.SA(years=2010)
+        self.assertEqual(get_populate_cache_info().misses, 0)
+        self.assertSetEqual(cached_sa_holidays.weekend, {THU, FRI})
+        self.assertFalse(cached_sa_holidays.is_workday("2010-01-07"))
+        cached_sa_holidays = holidays.SA(years=range(2010, 2016))
+        self.assertEqual(get_populate_cache_info().misses, 0)
+        self.assertEqual(cached_sa_holidays, sa_holidays)
+
+
+class TestHolidayQuorums(unittest.TestCase):
+    def setUp(self):
+        self.markets = (financial_holidays("ECB"), financial_holidays("NYSE"))
+
+    def test_closed_count(self):
+        hb_quorum = closed_count(self.markets, 1, years=2024)
+        self.assertIsInstance(hb_quorum, holidays.HolidayQuorum)
+        self.assertEqual(hb_quorum.quorum, 1)
+        self.assertIn("2024-07-04", hb_quorum)
+        self.assertIn("2024-12-26", hb_quorum)
+        self.assertFalse(hb_quorum.is_workday("2024-07-04"))
+        self.assertEqual(hb_quorum.get_nth_workday("2024-07-03", 1), date(2024, 7, 5))
+
+    def test_intersection(self):
+        hb_quorum = intersection(self.markets, years=2024)
+        self.assertIsInstance(hb_quorum, holidays.HolidayQuorum)
+        self.assertEqual(hb_quorum.quorum, 2)
+        self.assertSetEqual(hb_quorum.years, {2024})
+        self.assertListEqual(
+            hb_quorum["2024-01-01":"2024-12-31"],
+            [date(2024, 1, 1), date(2024, 3, 29), date(2024, 12, 25)],
+        )
+        self.assertTrue(hb_quorum.is_workday("2024-07-04"))
+        self.assertEqual(hb_quorum.get_workdays_number("2024-12-20", "2024-12-27"), 4)
+
+
 class TestListLocalizedEntities(unittest.TestCase):
     def assertLocalizedEntities(self, localized_entities, supported_entities):  # noqa: N802
         tests_dir = Path(__file__).parent
@@ -237,3 +514,31 @@ class TestListSupportedEntities(unittest.TestCase):
             len(financial_files),
             len(supported_financial),
         )
+
+
+class TestUnion(unittest.TestCase):
+    def test_union(self):
+        # The holiday names are in the entities' default languages.
+        languages = {
+            code: getattr(holidays, code).default_language
+            for code in ("AT", "BE", "DE", "FR", "NL")
+        }
+        hb_union = union(
+            (country_holidays(code, language=language) for code, language in languages.items()),
+            years=(2023, 2024),
+        )
+        hb_sum = sum(
+            country_holidays(code, years=(2023, 2024), language=language)
+            for code, language in languages.items()
+        )
+
+        self.assertIsInstance(hb_union, holidays.HolidayUnion)
+        self.assertEqual(len(hb_union.holidays), 5)
+        self.assertSetEqual(hb_union.years, {2023, 2024})
+        self.assertEqual(hb_union, hb_sum)
+        self.assertIn("2024-10-03", hb_union)
+        self.assertNotIn("2024-10-04", hb_union)
+        self.assertListEqual(
+            hb_union.get_list("2024-05-01"),
+            ["Dag van de Arbeid", "Erster Mai", "Fête du Travail", "Staatsfeiertag"],
+        )
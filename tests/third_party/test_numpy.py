@@ -10,14 +10,137 @@
 #  Website: https://github.com/vacanza/python-holidays
 #  License: MIT (see LICENSE file)
 
+from datetime import date, datetime
 from unittest import TestCase
 
+from holidays.countries.belarus import Belarus
 from holidays.countries.cambodia import Cambodia
+from holidays.countries.china import China
 from holidays.countries.thailand import Thailand
 from holidays.countries.ukraine import Ukraine
+from holidays.countries.united_states import UnitedStates
+from holidays.utils import matrix
 
 
 class TestNumpy(TestCase):
+    def test_contains_many(self):
+        import numpy as np
+
+        h = Ukraine()
+        dates = np.arange("2019-12-25", "2021-01-05", dtype="datetime64[D]")
+        mask = h.contains_many(dates)
+        self.assertEqual(mask.dtype, np.bool_)
+        self.assertEqual(mask.shape, dates.shape)
+        self.assertEqual(mask.tolist(), [dt in h for dt in dates.tolist()])
+        self.assertEqual(h.years, {2019, 2020, 2021})
+
+        self.assertEqual(
+            h.contains_many(
+                np.array(["2020-01-01T10:00", "NaT"], dtype="datetime64[ns]")
+            ).tolist(),
+            [True, False],
+        )
+        self.assertEqual(
+            h.contains_many([date(2020, 1, 7), datetime(2020, 1, 7, 12), "2020-01-08"]).tolist(),
+            [True, True, False],
+        )
+        # Numbers are POSIX timestamps whatever the array type is.
+        timestamps = [1577836800, 1577923199, 1577923200, -1]
+        for keys in (
+            timestamps,
+            np.array(timestamps),
+            np.array(timestamps, dtype=object),
+            np.array(timestamps, dtype=np.float64),
+        ):
+            self.assertEqual(h.contains_many(keys).tolist(), [ts in h for ts in timestamps], keys)
+        self.assertEqual(
+            h.contains_many(np.array(timestamps[:3], dtype=np.uint32)).tolist(),
+            [True, True, False],
+        )
+        mixed_keys = np.array(
+            [date(2020, 1, 7), 1577836800, "2020-01-08", datetime(2020, 1, 7, 12), 1.5e9],
+            dtype=object,
+        )
+        self.assertEqual(
+            h.contains_many(mixed_keys).tolist(), [key in h for key in mixed_keys.tolist()]
+        )
+        self.assertEqual(
+            h.is_workday_many(np.array(timestamps)).tolist(),
+            [h.is_workday(ts) for ts in timestamps],
+        )
+        self.assertRaises(ValueError, lambda: h.contains_many(np.array([10**12])))
+        self.assertEqual(h.contains_many(dates[:-1].reshape(2, -1)).shape, (2, 188))
+        self.assertEqual(h.contains_many([]).tolist(), [])
+
+        h = Ukraine(expand=False)
+        self.assertFalse(h.contains_many(dates).any())
+        self.assertEqual(h.years, set())
+
+    def test_is_workday_many(self):
+        import numpy as np
+
+        dates = np.arange("2015-01-01", "2024-01-01", dtype="datetime64[D]")
+        for cls in (Belarus, China, Ukraine):
+            h = cls()
+            mask = h.is_workday_many(dates)
+            self.assertEqual(mask.shape, dates.shape)
+            self.assertSetEqual(h.years, set(range(2015, 2024)))
+            h_scalar = cls()
+            self.assertEqual(mask.tolist(), [h_scalar.is_workday(dt) for dt in dates.tolist()])
+            # The following year is looked ahead without being populated.
+            self.assertSetEqual(h_scalar.years, h.years)
+            self.assertTrue(h.weekend_workdays)
+
+        h = China()
+        # 2023-01-28 and 2023-01-29 are make-up working days, 2023-01-27 is a holiday.
+        self.assertEqual(
+            h.is_workday_many(["2023-01-27", "2023-01-28", "2023-01-29", "2023-02-04"]).tolist(),
+            [False, True, True, False],
+        )
+        self.assertEqual(
+            h.is_workday_many(np.array(["NaT", "2023-01-30"], dtype="datetime64[D]")).tolist(),
+            [False, True],
+        )
+
+    def test_matrix(self):
+        import numpy as np
+
+        years = range(2022, 2025)
+        entities = ("BY", China(), "UA", UnitedStates(subdiv="CA"))
+        m = matrix(entities, years)
+        self.assertTupleEqual(m.entities, ("BY", "CN", "UA", "US-CA"))
+        self.assertEqual(m.index["UA"], 2)
+        self.assertEqual(m.start, date(2022, 1, 1))
+        self.assertEqual(m.end, date(2024, 12, 31))
+        # The holidays objects are not modified.
+        self.assertSetEqual(entities[1].years, set())
+
+        dates = m.dates
+        self.assertEqual(dates.shape, (1096,))
+        self.assertEqual(dates[0], np.datetime64("2022-01-01"))
+        self.assertEqual(m.holidays.shape, (4, 1096))
+        self.assertEqual(m.workdays.shape, (4, 1096))
+        for idx, cls in ((0, Belarus), (1, China), (2, Ukraine)):
+            h = cls(years=years)
+            self.assertEqual(m.holidays[idx].tolist(), h.contains_many(dates).tolist())
+            self.assertEqual(m.workdays[idx].tolist(), h.is_workday_many(dates).tolist())
+
+        # No holidays in Ukraine under martial law.
+        self.assertEqual(m.is_holiday("2023-01-01").tolist(), [True, True, False, True])
+        self.assertEqual(m.is_off("2023-01-28").tolist(), [True, False, True, True])
+        self.assertListEqual(m.get_off("2023-01-28"), ["BY", "UA", "US-CA"])
+        self.assertListEqual(m.get_off("2023-01-30"), [])
+        self.assertEqual(m.get_holiday_counts().tolist(), m.holidays.sum(axis=0).tolist())
+        self.assertEqual(m.get_off_counts().tolist(), (~m.workdays).sum(axis=0).tolist())
+
+        self.assertEqual(m.first_common_workday("2023-01-21"), date(2023, 1, 30))
+        self.assertEqual(m.first_common_workday("2023-01-30"), date(2023, 1, 30))
+        self.assertIsNone(matrix(("UA",), 2022).first_common_workday("2022-12-31"))
+        self.assertRaises(KeyError, lambda: m.is_off("2025-01-01"))
+        self.assertRaises(ValueError, lambda: matrix(("UA",), ()))
+
+        self.assertEqual(matrix(entities, years, workers=2).holidays.tolist(), m.holidays.tolist())
+
     def test_years_int_conversion(self):
         import numpy as np  # It seems the import causes the error mentioned above.
 